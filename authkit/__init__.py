@@ -1,33 +1,46 @@
 """
 The AuthKit module provides a comprehensive set of authentication and user management primitives.
+
+Submodules are imported lazily: names below are only loaded on first access,
+which keeps `import authkit` cheap for short-lived processes.
 """
-from authkit.ports import (
-    UserReaderRepository,
-    UserWriterRepository,
-    RegistrationIntentStore,
-    UserIDIntentStore,
-    OTPManager,
-    OTPStore,
-    AuthSessionService,
-    AuthSession,
-    PasswordManager,
-    UserRepository
-)
-from authkit.domain import (
-    User,
-    RegistrationIntent,
-    OTPPurpose
-)
-from authkit.core.authkit import AuthKit
+from typing import TYPE_CHECKING
+from authkit._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from authkit.ports import (
+        UserReaderRepository,
+        UserWriterRepository,
+        RegistrationIntentStore,
+        UserIDIntentStore,
+        OTPManager,
+        OTPStore,
+        AuthSessionService,
+        AuthSession,
+        PasswordManager,
+        UserRepository
+    )
+    from authkit.domain import (
+        User,
+        RegistrationIntent,
+        OTPPurpose,
+        AuthErrorCode,
+        Result
+    )
+    from authkit.core.authkit import AuthKit
+    from authkit.core.async_authkit import AsyncAuthKit
 
 __all__ = [
     # Facade
     "AuthKit",
+    "AsyncAuthKit",
 
     # Entities
     "User", 
     "RegistrationIntent", 
     "OTPPurpose",
+    "AuthErrorCode",
+    "Result",
 
     # Ports
     "UserReaderRepository",
@@ -42,4 +55,26 @@ __all__ = [
     "UserRepository",
     # "SecurityEventPublisher",
 
-]
\ No newline at end of file
+]
+
+__getattr__, __dir__ = lazy_exports(__name__, {
+    "AuthKit": "authkit.core.authkit",
+    "AsyncAuthKit": "authkit.core.async_authkit",
+
+    "User": "authkit.domain.entities.user",
+    "RegistrationIntent": "authkit.domain.entities.intent",
+    "OTPPurpose": "authkit.domain.enum.otp",
+    "AuthErrorCode": "authkit.domain.enum.error",
+    "Result": "authkit.domain.result",
+
+    "UserReaderRepository": "authkit.ports.user_repo_cqrs._reader",
+    "UserWriterRepository": "authkit.ports.user_repo_cqrs._writer",
+    "RegistrationIntentStore": "authkit.ports.intents.registration_intent_store",
+    "UserIDIntentStore": "authkit.ports.intents.user_id_intent_store",
+    "OTPManager": "authkit.ports.otp.otp_manager",
+    "OTPStore": "authkit.ports.otp.otp_store",
+    "AuthSessionService": "authkit.ports.session_service",
+    "AuthSession": "authkit.ports.session_service",
+    "PasswordManager": "authkit.ports.passwd_manager",
+    "UserRepository": "authkit.ports.user_repo",
+})
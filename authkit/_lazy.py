@@ -0,0 +1,39 @@
+"""
+Helpers for lazily loaded package exports.
+"""
+import sys
+from importlib import import_module
+from typing import Any, Callable, Dict, List, Tuple
+
+
+def lazy_exports(
+    package: str,
+    exports: Dict[str, str],
+) -> Tuple[Callable[[str], Any], Callable[[], List[str]]]:
+    """
+    Builds module-level `__getattr__` and `__dir__` functions for a package.
+
+    Each exported name is imported from its submodule the first time it is
+    accessed and then cached in the package namespace.
+
+    Args:
+        package: The `__name__` of the package exposing the names.
+        exports: Mapping of exported name to the (absolute) module defining it.
+
+    Returns:
+        The `(__getattr__, __dir__)` pair to assign in the package `__init__`.
+    """
+    namespace = sys.modules[package].__dict__
+
+    def __getattr__(name: str) -> Any:
+        module = exports.get(name)
+        if module is None:
+            raise AttributeError(f"module '{package}' has no attribute '{name}'")
+        value = getattr(import_module(module), name)
+        namespace[name] = value
+        return value
+
+    def __dir__() -> List[str]:
+        return sorted(set(namespace) | set(exports))
+
+    return __getattr__, __dir__
@@ -0,0 +1,80 @@
+"""
+Built-in adapters implementing the AuthKit ports with the standard library only.
+"""
+from typing import TYPE_CHECKING
+from authkit._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from authkit.adapters.password import *
+    from authkit.adapters.screening import *
+    from authkit.adapters.session import *
+
+__all__ = [
+    "ScryptPasswordManager",
+    "PBKDF2PasswordManager",
+    "MultiSchemePasswordManager",
+    "calibrate",
+    "CalibrationResult",
+    "OffloadedPasswordManager",
+    "OffloadStats",
+    "AdmissionControlledPasswordManager",
+    "AdmissionStats",
+    "HashScheduler",
+    "PriorityClass",
+    "ScheduledPasswordManager",
+    "ClassStats",
+    "BackgroundPasswordRehasher",
+    "RehashStats",
+    "VerifiedCredentialMemo",
+    "MemoStats",
+    "SpeculativePasswordHasher",
+    "BloomFilterPasswordScreener",
+    "BloomFilterInfo",
+    "build_bloom_filter",
+    "HMACSessionService",
+    "SignedSession",
+    "SessionClaims",
+    "InMemoryRevocationStore",
+    "FilteredRevocationStore",
+    "StoredSessionService",
+    "StoredSession",
+    "InMemorySessionStore",
+    "RedisSessionStore",
+    "VerifiedTokenCache",
+    "TokenCacheStats",
+]
+
+__getattr__, __dir__ = lazy_exports(__name__, {
+    "ScryptPasswordManager": "authkit.adapters.password.scrypt",
+    "PBKDF2PasswordManager": "authkit.adapters.password.pbkdf2",
+    "MultiSchemePasswordManager": "authkit.adapters.password.multi",
+    "calibrate": "authkit.adapters.password.calibrate",
+    "CalibrationResult": "authkit.adapters.password.calibrate",
+    "OffloadedPasswordManager": "authkit.adapters.password.offload",
+    "OffloadStats": "authkit.adapters.password.offload",
+    "AdmissionControlledPasswordManager": "authkit.adapters.password.admission",
+    "AdmissionStats": "authkit.adapters.password.admission",
+    "HashScheduler": "authkit.adapters.password.scheduler",
+    "PriorityClass": "authkit.adapters.password.scheduler",
+    "ScheduledPasswordManager": "authkit.adapters.password.scheduler",
+    "ClassStats": "authkit.adapters.password.scheduler",
+    "BackgroundPasswordRehasher": "authkit.adapters.password.rehash",
+    "RehashStats": "authkit.adapters.password.rehash",
+    "VerifiedCredentialMemo": "authkit.adapters.password.memo",
+    "MemoStats": "authkit.adapters.password.memo",
+    "SpeculativePasswordHasher": "authkit.adapters.password.speculative",
+    "BloomFilterPasswordScreener": "authkit.adapters.screening.bloom",
+    "BloomFilterInfo": "authkit.adapters.screening.bloom",
+    "build_bloom_filter": "authkit.adapters.screening.bloom",
+    "HMACSessionService": "authkit.adapters.session.hmac_session",
+    "SignedSession": "authkit.adapters.session.hmac_session",
+    "SessionClaims": "authkit.adapters.session.hmac_session",
+    "InMemoryRevocationStore": "authkit.adapters.session.revocation",
+    "FilteredRevocationStore": "authkit.adapters.session.revocation",
+    "StoredSessionService": "authkit.adapters.session.stored_session",
+    "StoredSession": "authkit.adapters.session.stored_session",
+    "InMemorySessionStore": "authkit.adapters.session.store",
+    "RedisSessionStore": "authkit.adapters.session.store",
+    "VerifiedTokenCache": "authkit.adapters.session.token_cache",
+    "TokenCacheStats": "authkit.adapters.session.token_cache",
+})
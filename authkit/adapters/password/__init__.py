@@ -0,0 +1,62 @@
+"""
+`PasswordManager` implementations based on `hashlib` (scrypt, PBKDF2).
+
+Hashes are self-describing (`$<scheme>$<params>$<salt>$<hash>`), so the cost
+parameters can be raised at any time without invalidating existing hashes.
+"""
+from typing import TYPE_CHECKING
+from authkit._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from authkit.adapters.password.scrypt import ScryptPasswordManager
+    from authkit.adapters.password.pbkdf2 import PBKDF2PasswordManager
+    from authkit.adapters.password.multi import MultiSchemePasswordManager
+    from authkit.adapters.password.calibrate import calibrate, CalibrationResult
+    from authkit.adapters.password.offload import OffloadedPasswordManager, OffloadStats
+    from authkit.adapters.password.admission import AdmissionControlledPasswordManager, AdmissionStats
+    from authkit.adapters.password.scheduler import HashScheduler, PriorityClass, ScheduledPasswordManager, ClassStats
+    from authkit.adapters.password.rehash import BackgroundPasswordRehasher, RehashStats
+    from authkit.adapters.password.memo import VerifiedCredentialMemo, MemoStats
+    from authkit.adapters.password.speculative import SpeculativePasswordHasher
+
+__all__ = [
+    "ScryptPasswordManager",
+    "PBKDF2PasswordManager",
+    "MultiSchemePasswordManager",
+    "calibrate",
+    "CalibrationResult",
+    "OffloadedPasswordManager",
+    "OffloadStats",
+    "AdmissionControlledPasswordManager",
+    "AdmissionStats",
+    "HashScheduler",
+    "PriorityClass",
+    "ScheduledPasswordManager",
+    "ClassStats",
+    "BackgroundPasswordRehasher",
+    "RehashStats",
+    "VerifiedCredentialMemo",
+    "MemoStats",
+    "SpeculativePasswordHasher",
+]
+
+__getattr__, __dir__ = lazy_exports(__name__, {
+    "ScryptPasswordManager": "authkit.adapters.password.scrypt",
+    "PBKDF2PasswordManager": "authkit.adapters.password.pbkdf2",
+    "MultiSchemePasswordManager": "authkit.adapters.password.multi",
+    "calibrate": "authkit.adapters.password.calibrate",
+    "CalibrationResult": "authkit.adapters.password.calibrate",
+    "OffloadedPasswordManager": "authkit.adapters.password.offload",
+    "OffloadStats": "authkit.adapters.password.offload",
+    "AdmissionControlledPasswordManager": "authkit.adapters.password.admission",
+    "AdmissionStats": "authkit.adapters.password.admission",
+    "HashScheduler": "authkit.adapters.password.scheduler",
+    "PriorityClass": "authkit.adapters.password.scheduler",
+    "ScheduledPasswordManager": "authkit.adapters.password.scheduler",
+    "ClassStats": "authkit.adapters.password.scheduler",
+    "BackgroundPasswordRehasher": "authkit.adapters.password.rehash",
+    "RehashStats": "authkit.adapters.password.rehash",
+    "VerifiedCredentialMemo": "authkit.adapters.password.memo",
+    "MemoStats": "authkit.adapters.password.memo",
+    "SpeculativePasswordHasher": "authkit.adapters.password.speculative",
+})
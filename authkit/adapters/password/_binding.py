@@ -0,0 +1,57 @@
+"""
+Forwarding of per-use-case binding through password manager wrappers.
+"""
+from typing import Any
+
+
+class BoundManagerView:
+    """
+    A wrapper's view for one use case: the wrapper's calls, made on its inner manager's bound view.
+
+    The Resolver only binds the adapter it injects. A wrapper around an
+    adapter that behaves per use case (e.g. a `HashScheduler`) forwards the
+    binding with `bind_inner`, and hands out this view: calls go through the
+    wrapper's `_call`/`_call_async` (so its state, e.g. an admission queue,
+    stays shared) with the bound inner manager. Other attributes are the
+    wrapper's.
+    """
+
+    def __init__(self, wrapper: Any, manager: Any):
+        self.wrapper = wrapper
+        self.manager = manager
+
+    @property
+    def releases_gil(self) -> bool:
+        """Mirrors the bound manager."""
+        return getattr(self.manager, "releases_gil", False)
+
+    def hash(self, password: str) -> str:
+        return self.wrapper._call(self.manager, "hash", password)
+
+    def verify(self, password: str, hashed_password: str) -> bool:
+        return self.wrapper._call(self.manager, "verify", password, hashed_password)
+
+    async def hash_async(self, password: str) -> str:
+        return await self.wrapper._call_async(self.manager, "hash", password)
+
+    async def verify_async(self, password: str, hashed_password: str) -> bool:
+        return await self.wrapper._call_async(self.manager, "verify", password, hashed_password)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.wrapper, name)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.wrapper!r}, {self.manager!r})"
+
+
+def bind_inner(wrapper: Any, use_case: str) -> Any:
+    """
+    Binds `wrapper.manager` to `use_case` and returns the wrapper's view around it.
+
+    Returns `wrapper` itself when the inner manager does not bind per use case.
+    """
+    bind = getattr(type(wrapper.manager), "bind_use_case", None)
+    if bind is None:
+        return wrapper
+    bound = bind(wrapper.manager, use_case)
+    return wrapper if bound is wrapper.manager else BoundManagerView(wrapper, bound)
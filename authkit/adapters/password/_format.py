@@ -0,0 +1,46 @@
+"""
+Encoding of self-describing password hashes: `$<scheme>$<k>=<v>,...$<salt>$<hash>`.
+
+Salt and hash use unpadded standard base64, as in the PHC string format.
+"""
+import base64
+from typing import Optional
+
+
+def b64encode(data: bytes) -> str:
+    return base64.b64encode(data).decode("ascii").rstrip("=")
+
+
+def b64decode(data: str) -> bytes:
+    return base64.b64decode(data + "=" * (-len(data) % 4), validate=True)
+
+
+def encode(scheme: str, params: dict[str, int], salt: bytes, digest: bytes) -> str:
+    """Formats a hash string from its parts."""
+    fields = ",".join(f"{key}={value}" for key, value in params.items())
+    return f"${scheme}${fields}${b64encode(salt)}${b64encode(digest)}"
+
+
+def scheme_of(hashed: str) -> Optional[str]:
+    """Returns the `<scheme>` of a `$<scheme>$...` hash string, None if it has none."""
+    if not hashed.startswith("$"):
+        return None
+    end = hashed.find("$", 1)
+    return hashed[1:end] if end > 1 else None
+
+
+def decode(hashed: str, scheme: str) -> Optional[tuple[dict[str, int], bytes, bytes]]:
+    """
+    Parses a hash string produced by `encode` for `scheme`.
+
+    Returns:
+        `(params, salt, digest)`, or None if `hashed` is not a well-formed `scheme` hash.
+    """
+    parts = hashed.split("$")
+    if len(parts) != 5 or parts[0] or parts[1] != scheme:
+        return None
+    try:
+        params = {key: int(value) for key, value in (field.split("=", 1) for field in parts[2].split(","))}
+        return params, b64decode(parts[3]), b64decode(parts[4])
+    except ValueError:
+        return None
@@ -0,0 +1,34 @@
+"""
+Helpers shared by the password managers that queue callers for a hashing slot.
+"""
+import asyncio
+from typing import Any, Callable
+
+
+class Waiter:
+    """A queued caller: `granted` is set under the owner's lock, then `wake()` is called."""
+    __slots__ = ("granted", "wake")
+
+    def __init__(self, wake: Callable[[], None]):
+        self.granted = False
+        self.wake = wake
+
+
+def async_wake(loop: asyncio.AbstractEventLoop, future: "asyncio.Future[None]") -> Callable[[], None]:
+    """Returns a thread-safe callback resolving `future` on `loop`."""
+    def resolve() -> None:
+        if not future.done():
+            future.set_result(None)
+
+    def wake() -> None:
+        loop.call_soon_threadsafe(resolve)
+    return wake
+
+
+async def call_async(manager: Any, method: str, *args: Any) -> Any:
+    """Awaits `<method>_async` of `manager` if it has one, else runs `<method>` in a thread."""
+    native = getattr(manager, f"{method}_async", None)
+    if native is not None:
+        return await native(*args)
+    # A sync-only manager must not run on the event loop.
+    return await asyncio.get_running_loop().run_in_executor(None, getattr(manager, method), *args)
@@ -0,0 +1,240 @@
+"""
+Admission control (load shedding) in front of password hashing.
+"""
+import asyncio
+import os
+import threading
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Callable, Optional
+
+from authkit.adapters.password._binding import bind_inner
+from authkit.adapters.password._waiting import Waiter, async_wake, call_async
+from authkit.exceptions import OverloadedError
+
+
+@dataclass
+class AdmissionStats:
+    """
+    Snapshot of an `AdmissionControlledPasswordManager`'s gate.
+
+    Attributes:
+        active: Calls currently hashing.
+        waiting: Calls queued for a hashing slot.
+        admitted: Calls admitted since creation.
+        rejected_queue_full: Calls rejected because the queue was full.
+        rejected_timeout: Calls rejected after waiting `max_wait` seconds.
+    """
+    active: int
+    waiting: int
+    admitted: int
+    rejected_queue_full: int
+    rejected_timeout: int
+
+
+class AdmissionControlledPasswordManager:
+    """
+    `PasswordManager` wrapper that bounds concurrent hashing and sheds excess load.
+
+    At most `max_concurrency` calls hash at once; further calls wait in a FIFO
+    queue. A call is rejected with `OverloadedError`, before any hashing
+    starts, when the queue already holds `max_queue` calls or when it has
+    waited `max_wait` seconds for a slot. Under a login flood the excess is
+    refused in microseconds instead of timing out after burning CPU, so
+    latency for admitted requests stays bounded.
+
+    Works with both facades: `AuthKit` calls `hash`/`verify`, `AsyncAuthKit`
+    picks up `hash_async`/`verify_async`, and both share the same queue.
+    Per-use-case binding is forwarded to the wrapped manager, so a
+    `HashScheduler` behind the gate still routes each use case to its class.
+
+    Usage:
+        >>> passwords = AdmissionControlledPasswordManager(
+        ...     OffloadedPasswordManager(ScryptPasswordManager(), max_workers=8),
+        ...     max_queue=64, max_wait=0.2,
+        ... )
+        >>> auth = AuthKit(password_manager=passwords, ...)
+    """
+
+    def __init__(self, manager: Any, *, max_concurrency: Optional[int] = None,
+                 max_queue: int = 0, max_wait: Optional[float] = None):
+        """
+        Args:
+            manager: The wrapped `PasswordManager`.
+            max_concurrency: Number of calls allowed to hash at once. Defaults to
+                the wrapped manager's `max_workers` (e.g. `OffloadedPasswordManager`),
+                or `os.cpu_count()`.
+            max_queue: Number of calls allowed to wait for a slot; 0 rejects
+                every call that cannot start immediately.
+            max_wait: Seconds a call may wait for a slot. None waits indefinitely.
+
+        Raises:
+            ValueError: If a limit is negative or `max_concurrency` is lower than 1.
+        """
+        if max_concurrency is None:
+            max_concurrency = getattr(manager, "max_workers", None) or os.cpu_count() or 1
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        if max_queue < 0 or (max_wait is not None and max_wait < 0):
+            raise ValueError("max_queue and max_wait must not be negative")
+
+        self.manager = manager
+        self.max_concurrency = max_concurrency
+        self.max_queue = max_queue
+        self.max_wait = max_wait
+
+        self._lock = threading.Lock()
+        self._free = max_concurrency
+        self._waiters: deque[Waiter] = deque()
+        self._admitted = 0
+        self._rejected_queue_full = 0
+        self._rejected_timeout = 0
+
+    @property
+    def releases_gil(self) -> bool:
+        """Mirrors the wrapped manager, so `OffloadedPasswordManager(mode="auto")` can wrap this one."""
+        return getattr(self.manager, "releases_gil", False)
+
+    def hash(self, password: str) -> str:
+        """
+        Hashes a plain text password once admitted.
+
+        Raises:
+            OverloadedError: If the call is not admitted.
+        """
+        return self._call(self.manager, "hash", password)
+
+    def verify(self, password: str, hashed_password: str) -> bool:
+        """
+        Verifies a plain text password once admitted.
+
+        Raises:
+            OverloadedError: If the call is not admitted.
+        """
+        return self._call(self.manager, "verify", password, hashed_password)
+
+    async def hash_async(self, password: str) -> str:
+        """
+        Awaitable `hash`: waits for admission without blocking the event loop.
+
+        Raises:
+            OverloadedError: If the call is not admitted.
+        """
+        return await self._call_async(self.manager, "hash", password)
+
+    async def verify_async(self, password: str, hashed_password: str) -> bool:
+        """
+        Awaitable `verify`: waits for admission without blocking the event loop.
+
+        Raises:
+            OverloadedError: If the call is not admitted.
+        """
+        return await self._call_async(self.manager, "verify", password, hashed_password)
+
+    def needs_rehash(self, hashed_password: str) -> bool:
+        """Asks the wrapped manager, inline (it only parses the hash); False if it cannot tell."""
+        needs_rehash = getattr(self.manager, "needs_rehash", None)
+        return needs_rehash is not None and needs_rehash(hashed_password)
+
+    def bind_use_case(self, use_case: str) -> Any:
+        """
+        Forwards the Resolver's binding to the wrapped manager (e.g. a `HashScheduler`).
+
+        Args:
+            use_case: The facade name of the use case being resolved.
+
+        Returns:
+            A view sharing this gate around the bound manager, or this wrapper
+            if the wrapped manager does not bind per use case.
+        """
+        return bind_inner(self, use_case)
+
+    def stats(self) -> AdmissionStats:
+        """Returns the current state of the admission gate."""
+        with self._lock:
+            return AdmissionStats(
+                active=self.max_concurrency - self._free,
+                waiting=len(self._waiters),
+                admitted=self._admitted,
+                rejected_queue_full=self._rejected_queue_full,
+                rejected_timeout=self._rejected_timeout,
+            )
+
+    def _call(self, manager: Any, method: str, *args: Any) -> Any:
+        """Runs `manager.<method>(*args)` once admitted."""
+        self._acquire()
+        try:
+            return getattr(manager, method)(*args)
+        finally:
+            self._release()
+
+    async def _call_async(self, manager: Any, method: str, *args: Any) -> Any:
+        """Awaits `manager.<method>(*args)` once admitted."""
+        await self._acquire_async()
+        try:
+            return await call_async(manager, method, *args)
+        finally:
+            self._release()
+
+    def _try_enter(self, wake: Callable[[], None]) -> Optional[Waiter]:
+        """Takes a free slot (returns None) or queues a waiter; raises when the queue is full."""
+        with self._lock:
+            if self._free > 0 and not self._waiters:
+                self._free -= 1
+                self._admitted += 1
+                return None
+            if len(self._waiters) >= self.max_queue:
+                self._rejected_queue_full += 1
+                raise OverloadedError("Password hashing queue is full")
+            waiter = Waiter(wake)
+            self._waiters.append(waiter)
+            return waiter
+
+    def _give_up(self, waiter: Waiter, timed_out: bool = True) -> bool:
+        """Leaves the queue; returns True if a slot was granted meanwhile."""
+        with self._lock:
+            if waiter.granted:
+                return True
+            self._waiters.remove(waiter)
+            if timed_out:
+                self._rejected_timeout += 1
+            return False
+
+    def _acquire(self) -> None:
+        event = threading.Event()
+        waiter = self._try_enter(event.set)
+        if waiter is None:
+            return
+        if not event.wait(self.max_wait) and not self._give_up(waiter):
+            raise OverloadedError("Timed out waiting for a password hashing slot")
+
+    async def _acquire_async(self) -> None:
+        loop = asyncio.get_running_loop()
+        granted = loop.create_future()
+        waiter = self._try_enter(async_wake(loop, granted))
+        if waiter is None:
+            return
+        try:
+            await asyncio.wait_for(asyncio.shield(granted), self.max_wait)
+        except asyncio.TimeoutError:
+            if not self._give_up(waiter):
+                raise OverloadedError("Timed out waiting for a password hashing slot")
+        except asyncio.CancelledError:
+            if self._give_up(waiter, timed_out=False):
+                self._release()
+            raise
+
+    def _release(self) -> None:
+        with self._lock:
+            if not self._waiters:
+                self._free += 1
+                return
+            # Hand the slot straight to the oldest waiter (FIFO).
+            waiter = self._waiters.popleft()
+            waiter.granted = True
+            self._admitted += 1
+        waiter.wake()
+
+    def __repr__(self) -> str:
+        return (f"{type(self).__name__}({self.manager!r}, max_concurrency={self.max_concurrency}, "
+                f"max_queue={self.max_queue}, max_wait={self.max_wait})")
@@ -0,0 +1,151 @@
+"""
+Host benchmarking to pick password hashing parameters for a target latency.
+"""
+import math
+import os
+import statistics
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Optional
+
+from authkit.adapters.password.pbkdf2 import PBKDF2PasswordManager
+from authkit.adapters.password.scrypt import ScryptPasswordManager
+
+_SAMPLE_PASSWORD = "calibration-password"
+
+
+@dataclass
+class CalibrationResult:
+    """
+    Parameters chosen by `calibrate`, with the latency measured for them.
+
+    Attributes:
+        scheme: "scrypt" or "pbkdf2".
+        params: Constructor arguments of the chosen manager.
+        verify_ms: Median latency of one `verify` while `cores` verifications run concurrently.
+        cores: Number of concurrent verifications the measurement was taken with.
+        manager: A password manager configured with `params`.
+    """
+    scheme: str
+    params: dict[str, Any]
+    verify_ms: float
+    cores: int
+    manager: Any
+
+    @property
+    def verifies_per_second_per_core(self) -> float:
+        """Sustained verifications per second that one busy core can serve."""
+        return 1000.0 / self.verify_ms
+
+    @property
+    def verifies_per_second(self) -> float:
+        """Sustained verifications per second across `cores` busy cores."""
+        return self.cores * self.verifies_per_second_per_core
+
+
+def calibrate(
+    scheme: str = "scrypt",
+    *,
+    target_ms: float = 50.0,
+    cores: Optional[int] = None,
+    max_memory: int = 64 * 1024 * 1024,
+    r: int = 8,
+    digest: str = "sha256",
+    rounds: int = 3,
+) -> CalibrationResult:
+    """
+    Benchmarks this host and picks the parameters whose `verify` takes about `target_ms`.
+
+    Every measurement runs `cores` verifications at a time (hashlib releases the
+    GIL), so the result accounts for memory bandwidth and frequency scaling
+    when all cores hash at once, i.e. at full login load.
+
+    Usage:
+        >>> result = calibrate("scrypt", target_ms=50, cores=8)
+        >>> auth = AuthKit(password_manager=result.manager, ...)
+        >>> result.verifies_per_second  # login capacity of this host
+
+    Args:
+        scheme: "scrypt" or "pbkdf2".
+        target_ms: Desired latency of one password verification, in milliseconds.
+        cores: Number of cores expected to hash concurrently. Defaults to `os.cpu_count()`.
+        max_memory: (scrypt) Upper bound on the memory used by one hash, in bytes.
+        r: (scrypt) Block size, kept fixed while N and p are tuned.
+        digest: (pbkdf2) Name of the hashlib digest.
+        rounds: Verifications timed per core for each measurement.
+
+    Returns:
+        The chosen parameters, their measured latency and a configured manager.
+
+    Raises:
+        ValueError: If `scheme` is unknown or `target_ms` is not positive.
+    """
+    if target_ms <= 0:
+        raise ValueError("target_ms must be positive")
+    cores = cores or os.cpu_count() or 1
+
+    if scheme == "scrypt":
+        params = _calibrate_scrypt(target_ms, cores, max_memory, r, rounds)
+        manager: Any = ScryptPasswordManager(**params)
+    elif scheme == "pbkdf2":
+        params = _calibrate_pbkdf2(target_ms, cores, digest, rounds)
+        manager = PBKDF2PasswordManager(**params)
+    else:
+        raise ValueError(f"Unknown scheme '{scheme}': expected 'scrypt' or 'pbkdf2'")
+
+    return CalibrationResult(
+        scheme=scheme,
+        params=params,
+        verify_ms=_verify_ms(manager, cores, rounds),
+        cores=cores,
+        manager=manager,
+    )
+
+
+def _calibrate_scrypt(target_ms: float, cores: int, max_memory: int, r: int, rounds: int) -> dict[str, Any]:
+    # Cost is linear in N (a power of two) and in p: take the largest N that fits
+    # both the memory cap and the target, then fill the remaining budget with p.
+    probe_ln = 12
+    per_n = _verify_ms(ScryptPasswordManager(ln=probe_ln, r=r), cores, rounds) / (1 << probe_ln)
+    ln_memory = int(math.log2(max_memory / (128 * r)))
+    ln_target = int(math.log2(max(target_ms / per_n, 2)))
+    ln = max(1, min(ln_memory, ln_target))
+
+    single = _verify_ms(ScryptPasswordManager(ln=ln, r=r), cores, rounds)
+    p = max(1, round(target_ms / single))
+    return {"ln": ln, "r": r, "p": p}
+
+
+def _calibrate_pbkdf2(target_ms: float, cores: int, digest: str, rounds: int) -> dict[str, Any]:
+    # Cost is linear in the iteration count: extrapolate from a probe, then correct once.
+    iterations = 20_000
+    for _ in range(2):
+        elapsed = _verify_ms(PBKDF2PasswordManager(iterations=iterations, digest=digest), cores, rounds)
+        iterations = max(1_000, int(round(iterations * target_ms / elapsed, -3)))
+    return {"iterations": iterations, "digest": digest}
+
+
+def _verify_ms(manager: Any, cores: int, rounds: int) -> float:
+    """Median `verify` latency in ms, with `cores` threads verifying concurrently."""
+    hashed = manager.hash(_SAMPLE_PASSWORD)
+    return _concurrent_median_ms(lambda: manager.verify(_SAMPLE_PASSWORD, hashed), cores, rounds)
+
+
+def _concurrent_median_ms(fn: Callable[[], Any], workers: int, rounds: int) -> float:
+    samples: list[float] = []
+    barrier = threading.Barrier(workers)
+
+    def run() -> None:
+        barrier.wait()
+        for _ in range(rounds):
+            start = time.perf_counter()
+            fn()
+            samples.append(time.perf_counter() - start)
+
+    threads = [threading.Thread(target=run) for _ in range(workers)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return statistics.median(samples) * 1000.0
@@ -0,0 +1,204 @@
+"""
+Short-lived in-memory memo of password verification results.
+"""
+import hmac
+import os
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Optional
+from uuid import UUID
+
+from authkit.domain import User
+
+
+@dataclass
+class MemoStats:
+    """
+    Snapshot of a `VerifiedCredentialMemo`'s activity.
+
+    Attributes:
+        hits: Verifications answered "valid" from the memo.
+        negative_hits: Verifications answered "invalid" from the memo.
+        misses: Verifications that went to the password manager.
+        entries: Remembered valid credentials (expired ones included until evicted).
+        negative_entries: Remembered invalid credentials.
+    """
+    hits: int
+    negative_hits: int
+    misses: int
+    entries: int
+    negative_entries: int
+
+
+class _Table:
+    """Insertion-ordered entries sharing one TTL, so the oldest entry always expires first."""
+    __slots__ = ("ttl", "max_entries", "entries")
+
+    def __init__(self, ttl: float, max_entries: int):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        # fingerprint -> (expiry, user id)
+        self.entries: OrderedDict[bytes, tuple[float, Any]] = OrderedDict()
+
+    def get(self, key: bytes, now: float) -> bool:
+        entry = self.entries.get(key)
+        if entry is None:
+            return False
+        if entry[0] <= now:
+            del self.entries[key]
+            return False
+        return True
+
+    def put(self, key: bytes, user_id: Any, now: float) -> None:
+        if self.ttl <= 0 or self.max_entries <= 0:
+            return
+        entries = self.entries
+        entries.pop(key, None)
+        # Drop what has expired, then the oldest entries beyond capacity.
+        while entries and next(iter(entries.values()))[0] <= now:
+            entries.popitem(last=False)
+        while len(entries) >= self.max_entries:
+            entries.popitem(last=False)
+        entries[key] = (now + self.ttl, user_id)
+
+    def discard_user(self, user_id: Any) -> None:
+        stale = [key for key, (_, owner) in self.entries.items() if owner == user_id]
+        for key in stale:
+            del self.entries[key]
+
+
+class VerifiedCredentialMemo:
+    """
+    `CredentialMemo` keeping recent verification results in memory for a few seconds.
+
+    Clients that retry or log in again within seconds pay for one password
+    hash instead of one per attempt: repeats are answered with an HMAC instead.
+    Failed attempts are remembered separately, with their own (shorter) TTL,
+    so replaying the same wrong credentials during credential stuffing does
+    not burn hashing capacity either.
+
+    Entries are keyed by an HMAC-SHA256 fingerprint of the identifier, the
+    password, the stored `password_hash` and the `credentials_version`, under a
+    random key generated per instance. Plain text passwords are never stored.
+    Changing the password or bumping the credentials version changes the
+    fingerprint, so older entries can never match again; `invalidate()` also
+    drops them right away, e.g. for changes made outside AuthKit.
+
+    The memo is per process: with several workers, each one keeps its own.
+
+    Usage:
+        >>> auth = AuthKit(password_manager=passwords, credential_memo=VerifiedCredentialMemo(ttl=30), ...)
+    """
+    # In-memory only: AsyncAuthKit calls it on the event loop.
+    __authkit_nonblocking__ = True
+
+    def __init__(self, *, ttl: float = 30.0, max_entries: int = 10_000,
+                 negative_ttl: float = 10.0, negative_max_entries: int = 10_000,
+                 key: Optional[bytes] = None):
+        """
+        Args:
+            ttl: Seconds a successful verification is remembered.
+            max_entries: Most successful verifications remembered; the oldest are evicted first.
+            negative_ttl: Seconds a failed verification is remembered (0 disables the negative memo).
+            negative_max_entries: Most failed verifications remembered.
+            key: HMAC key for the fingerprints. Defaults to 32 random bytes.
+
+        Raises:
+            ValueError: On a negative TTL or size.
+        """
+        if min(ttl, max_entries, negative_ttl, negative_max_entries) < 0:
+            raise ValueError("TTLs and sizes must not be negative")
+        self._key = key or os.urandom(32)
+        self._valid = _Table(ttl, max_entries)
+        self._invalid = _Table(negative_ttl, negative_max_entries)
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._negative_hits = 0
+        self._misses = 0
+
+    def verify(self, identifier: str, password: str, user: User, password_manager: Any) -> bool:
+        """
+        Verifies `password` against `user.password_hash`, from the memo when possible.
+
+        Args:
+            identifier: The identifier the user logged in with.
+            password: The plain text password.
+            user: The user found for `identifier`.
+            password_manager: Verifies the password on a memo miss.
+
+        Returns:
+            True if the password matches the user's hash, False otherwise.
+        """
+        key = self._fingerprint(identifier, password, user)
+        cached = self._lookup(key)
+        if cached is not None:
+            return cached
+        valid = password_manager.verify(password, user.password_hash)
+        self._remember(key, user.id, valid)
+        return valid
+
+    async def verify_async(self, identifier: str, password: str, user: User, password_manager: Any) -> bool:
+        """Awaitable `verify`, for the async `password_manager` of `AsyncAuthKit`."""
+        key = self._fingerprint(identifier, password, user)
+        cached = self._lookup(key)
+        if cached is not None:
+            return cached
+        valid = await password_manager.verify(password, user.password_hash)
+        self._remember(key, user.id, valid)
+        return valid
+
+    def invalidate(self, user_id: UUID) -> None:
+        """
+        Forgets every entry of a user.
+
+        Args:
+            user_id: The ID of the user.
+        """
+        with self._lock:
+            self._valid.discard_user(user_id)
+            self._invalid.discard_user(user_id)
+
+    def clear(self) -> None:
+        """Forgets every entry."""
+        with self._lock:
+            self._valid.entries.clear()
+            self._invalid.entries.clear()
+
+    def stats(self) -> MemoStats:
+        """Returns the counters since creation and the current sizes."""
+        with self._lock:
+            return MemoStats(
+                hits=self._hits,
+                negative_hits=self._negative_hits,
+                misses=self._misses,
+                entries=len(self._valid.entries),
+                negative_entries=len(self._invalid.entries),
+            )
+
+    def _fingerprint(self, identifier: str, password: str, user: User) -> bytes:
+        # Length-prefixed, so no two (identifier, password) splits give the same message.
+        message = (f"{len(identifier)}:{identifier}{len(password)}:{password}"
+                   f"{user.credentials_version}:{user.password_hash}")
+        return hmac.digest(self._key, message.encode("utf-8"), "sha256")
+
+    def _lookup(self, key: bytes) -> Optional[bool]:
+        now = time.monotonic()
+        with self._lock:
+            if self._valid.get(key, now):
+                self._hits += 1
+                return True
+            if self._invalid.get(key, now):
+                self._negative_hits += 1
+                return False
+            self._misses += 1
+            return None
+
+    def _remember(self, key: bytes, user_id: Any, valid: bool) -> None:
+        now = time.monotonic()
+        with self._lock:
+            (self._valid if valid else self._invalid).put(key, user_id, now)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(ttl={self._valid.ttl}, negative_ttl={self._invalid.ttl})"
@@ -0,0 +1,110 @@
+"""
+Password manager verifying several hash schemes, to migrate between algorithms.
+"""
+from typing import Any, Optional
+
+from authkit.adapters.password import _format
+
+
+class MultiSchemePasswordManager:
+    """
+    `PasswordManager` hashing with one manager and verifying with any of several.
+
+    New hashes are made by `current`. `verify` hands a stored hash to the
+    manager of its scheme (the `$<scheme>$` prefix, matched against the
+    managers' `scheme` attribute); managers without a `scheme` attribute
+    (e.g. wrapping an external library) are tried in order for hashes no
+    named scheme claims. `needs_rehash` reports every hash not made by
+    `current`, and defers to `current.needs_rehash` for its own.
+
+    With a `BackgroundPasswordRehasher`, users are moved to the current
+    algorithm as they log in; drop a legacy manager once no stored hash
+    uses its scheme anymore.
+
+    Usage:
+        >>> manager = MultiSchemePasswordManager(ScryptPasswordManager(), PBKDF2PasswordManager())
+        >>> auth = AuthKit(password_manager=manager,
+        ...                password_rehasher=BackgroundPasswordRehasher(manager), ...)
+    """
+
+    def __init__(self, current: Any, *legacy: Any):
+        """
+        Args:
+            current: The `PasswordManager` making new hashes; it must declare its
+                `scheme`, to tell its hashes from the legacy ones.
+            legacy: `PasswordManager`s of the older schemes, still accepted by `verify`.
+
+        Raises:
+            ValueError: If `current` declares no scheme, or two managers declare the same one.
+        """
+        if getattr(current, "scheme", None) is None:
+            raise ValueError("the current manager must declare its scheme")
+        self.current = current
+        self.legacy = legacy
+        self._by_scheme: dict[str, Any] = {}
+        self._unnamed: list[Any] = []
+        for manager in (current, *legacy):
+            scheme = getattr(manager, "scheme", None)
+            if scheme is None:
+                self._unnamed.append(manager)
+            elif scheme in self._by_scheme:
+                raise ValueError(f"several managers for scheme {scheme!r}")
+            else:
+                self._by_scheme[scheme] = manager
+
+    @property
+    def releases_gil(self) -> bool:
+        """True if every manager releases the GIL while hashing."""
+        return all(getattr(manager, "releases_gil", False) for manager in (self.current, *self.legacy))
+
+    def hash(self, password: str) -> str:
+        """
+        Hashes a plain text password with the current manager.
+
+        Args:
+            password: The plain text password to hash.
+
+        Returns:
+            The hash string.
+        """
+        return self.current.hash(password)
+
+    def verify(self, password: str, hashed_password: str) -> bool:
+        """
+        Verifies a plain text password with the manager of the hash's scheme.
+
+        Args:
+            password: The plain text password.
+            hashed_password: The hash to verify against.
+
+        Returns:
+            True if the password matches; False otherwise, including for hashes of unknown schemes.
+        """
+        manager = self._owner(hashed_password)
+        if manager is not None:
+            return manager.verify(password, hashed_password)
+        return any(manager.verify(password, hashed_password) for manager in self._unnamed)
+
+    def needs_rehash(self, hashed_password: str) -> bool:
+        """
+        Checks whether a hash should be replaced by one of the current manager.
+
+        Args:
+            hashed_password: The stored hash.
+
+        Returns:
+            True for hashes of another scheme, else what the current manager's
+            `needs_rehash` reports (False if it has none).
+        """
+        if self._owner(hashed_password) is not self.current:
+            return True
+        needs_rehash = getattr(self.current, "needs_rehash", None)
+        return needs_rehash is not None and needs_rehash(hashed_password)
+
+    def _owner(self, hashed_password: str) -> Optional[Any]:
+        """The manager of a hash's scheme; None if no named scheme claims it."""
+        return self._by_scheme.get(_format.scheme_of(hashed_password))
+
+    def __repr__(self) -> str:
+        managers = ", ".join(repr(manager) for manager in (self.current, *self.legacy))
+        return f"{type(self).__name__}({managers})"
@@ -0,0 +1,247 @@
+"""
+Runs password hashing off the request thread, on a process or thread pool.
+"""
+import asyncio
+import os
+import threading
+import time
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Optional
+
+from authkit.adapters.password._binding import bind_inner
+
+# The wrapped manager inside each worker process (set by the pool initializer).
+_worker_manager: Any = None
+
+
+def _init_worker(manager: Any) -> None:
+    global _worker_manager
+    _worker_manager = manager
+
+
+def _run_in_worker(method: str, *args: Any) -> tuple[Any, float]:
+    return _run(_worker_manager, method, *args)
+
+
+def _run(manager: Any, method: str, *args: Any) -> tuple[Any, float]:
+    start = time.perf_counter()
+    result = getattr(manager, method)(*args)
+    return result, time.perf_counter() - start
+
+
+@dataclass
+class OffloadStats:
+    """
+    Snapshot of an `OffloadedPasswordManager`'s activity.
+
+    Attributes:
+        mode: "process" or "thread".
+        workers: Size of the pool.
+        in_flight: Calls submitted and not finished yet (queued or running).
+        queue_depth: Calls waiting for a free worker.
+        completed: Calls finished since the pool was created.
+        busy_seconds: Total time spent hashing by the workers.
+        utilization: Fraction of the pool's capacity spent hashing since the
+            previous `stats()` call (0.0 - 1.0).
+    """
+    mode: str
+    workers: int
+    in_flight: int
+    queue_depth: int
+    completed: int
+    busy_seconds: float
+    utilization: float
+
+
+class OffloadedPasswordManager:
+    """
+    `PasswordManager` wrapper running `hash`/`verify` of another manager on a worker pool.
+
+    In "process" mode each worker process holds its own copy of the wrapped
+    manager, so CPU-bound hashing scales with cores even when it holds the GIL.
+    "thread" mode suits algorithms that release the GIL (the built-in scrypt and
+    PBKDF2 managers) and avoids pickling each call. The default, "auto", picks
+    threads for managers declaring `releases_gil = True` and processes otherwise.
+
+    Besides the blocking `hash`/`verify`, it exposes `hash_async`/`verify_async`,
+    which `AsyncAuthKit` uses automatically instead of its own thread pool.
+    In "thread" mode per-use-case binding is forwarded to the wrapped manager
+    (e.g. a `HashScheduler`); worker processes hold their own unbound copy.
+
+    Usage:
+        >>> passwords = OffloadedPasswordManager(BcryptPasswordManager(), max_workers=8)
+        >>> auth = AuthKit(password_manager=passwords, ...)
+        >>> passwords.stats().queue_depth
+
+    The pool is created on first use, so the wrapper can be built before a
+    pre-fork server forks its workers.
+    """
+
+    def __init__(self, manager: Any, *, mode: str = "auto", max_workers: Optional[int] = None,
+                 mp_context: Any = None):
+        """
+        Args:
+            manager: The wrapped `PasswordManager`. Must be picklable in "process" mode.
+            mode: "process", "thread" or "auto".
+            max_workers: Size of the pool. Defaults to `os.cpu_count()`.
+            mp_context: (process mode) multiprocessing context for the pool.
+
+        Raises:
+            ValueError: If `mode` is unknown or `max_workers` is lower than 1.
+        """
+        if mode == "auto":
+            mode = "thread" if getattr(manager, "releases_gil", False) else "process"
+        if mode not in ("process", "thread"):
+            raise ValueError(f"Unknown mode '{mode}': expected 'process', 'thread' or 'auto'")
+        workers = max_workers or os.cpu_count() or 1
+        if workers < 1:
+            raise ValueError("max_workers must be at least 1")
+
+        self.manager = manager
+        self.mode = mode
+        self.max_workers = workers
+        self._mp_context = mp_context
+        self._executor: Optional[Executor] = None
+        self._lock = threading.Lock()
+
+        self._in_flight = 0
+        self._completed = 0
+        self._busy = 0.0
+        self._last_sample = (time.monotonic(), 0.0)
+
+    def hash(self, password: str) -> str:
+        """
+        Hashes a plain text password on the pool, blocking until done.
+
+        Args:
+            password: The plain text password to hash.
+
+        Returns:
+            The hashed password string.
+        """
+        return self._call(self.manager, "hash", password)
+
+    def verify(self, password: str, hashed_password: str) -> bool:
+        """
+        Verifies a plain text password on the pool, blocking until done.
+
+        Args:
+            password: The plain text password.
+            hashed_password: The hashed password to verify against.
+
+        Returns:
+            True if the password matches the hash, False otherwise.
+        """
+        return self._call(self.manager, "verify", password, hashed_password)
+
+    async def hash_async(self, password: str) -> str:
+        """Awaitable `hash`: the event loop stays free while the pool works."""
+        return await self._call_async(self.manager, "hash", password)
+
+    async def verify_async(self, password: str, hashed_password: str) -> bool:
+        """Awaitable `verify`: the event loop stays free while the pool works."""
+        return await self._call_async(self.manager, "verify", password, hashed_password)
+
+    def needs_rehash(self, hashed_password: str) -> bool:
+        """Asks the wrapped manager, inline (it only parses the hash); False if it cannot tell."""
+        needs_rehash = getattr(self.manager, "needs_rehash", None)
+        return needs_rehash is not None and needs_rehash(hashed_password)
+
+    def bind_use_case(self, use_case: str) -> Any:
+        """
+        Forwards the Resolver's binding to the wrapped manager (e.g. a `HashScheduler`), in "thread" mode.
+
+        Args:
+            use_case: The facade name of the use case being resolved.
+
+        Returns:
+            A view sharing this pool around the bound manager, or this wrapper
+            in "process" mode or if the wrapped manager does not bind per use case.
+        """
+        return self if self.mode == "process" else bind_inner(self, use_case)
+
+    def stats(self) -> OffloadStats:
+        """
+        Returns the current queue depth and pool utilization.
+
+        Utilization is measured over the interval since the previous call,
+        which suits periodic metrics collection.
+        """
+        now = time.monotonic()
+        with self._lock:
+            in_flight, completed, busy = self._in_flight, self._completed, self._busy
+            last_time, last_busy = self._last_sample
+            self._last_sample = (now, busy)
+        elapsed = now - last_time
+        utilization = (busy - last_busy) / (elapsed * self.max_workers) if elapsed > 0 else 0.0
+        return OffloadStats(
+            mode=self.mode,
+            workers=self.max_workers,
+            in_flight=in_flight,
+            queue_depth=max(0, in_flight - self.max_workers),
+            completed=completed,
+            busy_seconds=busy,
+            utilization=min(1.0, utilization),
+        )
+
+    def shutdown(self, wait: bool = True) -> None:
+        """
+        Shuts the pool down. A later call starts a new one.
+
+        Args:
+            wait: Whether to block until pending calls have finished.
+        """
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait)
+
+    def _call(self, manager: Any, method: str, *args: Any) -> Any:
+        """Runs `manager.<method>(*args)` on the pool, blocking until done."""
+        return self._submit(manager, method, *args).result()[0]
+
+    async def _call_async(self, manager: Any, method: str, *args: Any) -> Any:
+        """Awaits `manager.<method>(*args)` on the pool."""
+        return (await asyncio.wrap_future(self._submit(manager, method, *args)))[0]
+
+    def _submit(self, manager: Any, method: str, *args: Any) -> "Future[tuple[Any, float]]":
+        # Under the lock, so a concurrent shutdown() cannot close the pool between lookup and submit.
+        with self._lock:
+            executor = self._executor or self._start()
+            if self.mode == "process":
+                future = executor.submit(_run_in_worker, method, *args)
+            else:
+                future = executor.submit(_run, manager, method, *args)
+            self._in_flight += 1
+        # Outside the lock: the callback takes it, and runs right away if the call already finished.
+        future.add_done_callback(self._on_done)
+        return future
+
+    def _on_done(self, future: "Future[tuple[Any, float]]") -> None:
+        busy = 0.0
+        if not future.cancelled() and future.exception() is None:
+            busy = future.result()[1]
+        with self._lock:
+            self._in_flight -= 1
+            self._completed += 1
+            self._busy += busy
+
+    def _start(self) -> Executor:
+        """Creates the pool. Caller holds the lock."""
+        if self.mode == "process":
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=self._mp_context,
+                initializer=_init_worker,
+                initargs=(self.manager,),
+            )
+        else:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers,
+                thread_name_prefix="authkit-passwords",
+            )
+        return self._executor
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.manager!r}, mode={self.mode!r}, max_workers={self.max_workers})"
@@ -0,0 +1,99 @@
+import hashlib
+import hmac
+import os
+
+from authkit.adapters.password import _format
+
+
+class PBKDF2PasswordManager:
+    """
+    `PasswordManager` using `hashlib.pbkdf2_hmac`.
+
+    Hashes look like `$pbkdf2-sha256$i=600000$<salt>$<hash>`; `verify` reads
+    the iteration count from the hash itself, so hashes created with a lower
+    count keep verifying after the cost is raised, and `needs_rehash`
+    reports them so they can be upgraded on the next login.
+
+    Use `calibrate(scheme="pbkdf2", ...)` to pick an iteration count for this host.
+    """
+    # hashlib releases the GIL while hashing: threads are enough to use every core.
+    releases_gil = True
+
+    def __init__(self, iterations: int = 600_000, digest: str = "sha256", salt_size: int = 16, dklen: int = 32):
+        """
+        Args:
+            iterations: Number of HMAC iterations.
+            digest: Name of the hashlib digest (e.g. "sha256", "sha512").
+            salt_size: Number of random salt bytes.
+            dklen: Length of the derived key in bytes.
+        """
+        if iterations < 1:
+            raise ValueError("iterations must be positive")
+        hashlib.new(digest)  # Fail early on unknown digests.
+        self.iterations = iterations
+        self.digest = digest
+        self.salt_size = salt_size
+        self.dklen = dklen
+        self.scheme = f"pbkdf2-{digest}"
+
+    @property
+    def params(self) -> dict[str, int]:
+        """The cost parameters as encoded in new hashes."""
+        return {"i": self.iterations}
+
+    def hash(self, password: str) -> str:
+        """
+        Hashes a plain text password with a fresh random salt.
+
+        Args:
+            password: The plain text password to hash.
+
+        Returns:
+            The self-describing hash string.
+        """
+        salt = os.urandom(self.salt_size)
+        digest = hashlib.pbkdf2_hmac(self.digest, password.encode("utf-8"), salt, self.iterations, self.dklen)
+        return _format.encode(self.scheme, self.params, salt, digest)
+
+    def verify(self, password: str, hashed_password: str) -> bool:
+        """
+        Verifies a plain text password against a hash made with the same digest.
+
+        Args:
+            password: The plain text password.
+            hashed_password: The hash to verify against.
+
+        Returns:
+            True if the password matches; False otherwise, including for
+            malformed hashes or hashes of another scheme.
+        """
+        parsed = _format.decode(hashed_password, self.scheme)
+        if parsed is None:
+            return False
+        params, salt, expected = parsed
+        iterations = params.get("i", 0)
+        if iterations < 1 or not expected:
+            return False
+        digest = hashlib.pbkdf2_hmac(self.digest, password.encode("utf-8"), salt, iterations, len(expected))
+        return hmac.compare_digest(digest, expected)
+
+    def needs_rehash(self, hashed_password: str) -> bool:
+        """
+        Checks whether a hash was made with other parameters than new hashes.
+
+        Args:
+            hashed_password: The stored hash.
+
+        Returns:
+            True for hashes with another iteration count or key length, and for
+            hashes of other schemes or digests (migrated when this is the
+            current manager of a `MultiSchemePasswordManager`).
+        """
+        parsed = _format.decode(hashed_password, self.scheme)
+        if parsed is None:
+            return True
+        params, _, digest = parsed
+        return params != self.params or len(digest) != self.dklen
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(iterations={self.iterations}, digest={self.digest!r})"
@@ -0,0 +1,232 @@
+"""
+Upgrades password hashes to the current parameters after successful logins.
+"""
+import asyncio
+import inspect
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, Optional
+
+from authkit.adapters.password._waiting import call_async
+from authkit.domain import User
+
+
+@dataclass
+class RehashStats:
+    """
+    Snapshot of a `BackgroundPasswordRehasher`'s activity.
+
+    Attributes:
+        scheduled: Re-hashes started since creation.
+        completed: Re-hashes persisted.
+        failed: Re-hashes that raised while hashing or writing.
+        dropped: Out of date hashes not scheduled because the user already had
+            one pending or `max_pending` was reached (retried on a later login).
+        pending: Re-hashes scheduled and not finished yet.
+    """
+    scheduled: int
+    completed: int
+    failed: int
+    dropped: int
+    pending: int
+
+
+class BackgroundPasswordRehasher:
+    """
+    `PasswordRehasher` hashing and persisting upgraded hashes off the login path.
+
+    After a successful login the use case calls `submit()`. If the password
+    manager's `needs_rehash()` reports the stored hash as out of date (older
+    cost parameters, or another algorithm), the password is hashed again with
+    the current parameters in the background and written back with the
+    writer's `change_password()`. The login itself only pays for parsing the hash.
+
+    Lowering or raising the cost therefore takes effect gradually, as users
+    log in, without a reset. Migrating algorithms works the same way with a
+    `MultiSchemePasswordManager`, which verifies the old hashes and reports
+    them as out of date.
+
+    Writers may implement `replace_password_hash(user_id, old_password_hash,
+    new_password_hash)` as a compare-and-set; it is preferred over
+    `change_password()` so that a password changed meanwhile is never
+    overwritten by the upgraded old one.
+
+    `AsyncAuthKit` calls `submit_async()`, which runs the re-hash as a task on
+    the event loop with the use case's async writer.
+
+    Usage:
+        >>> manager = ScryptPasswordManager(ln=16)
+        >>> auth = AuthKit(password_manager=manager,
+        ...                password_rehasher=BackgroundPasswordRehasher(manager), ...)
+    """
+    # `submit` only enqueues, so AsyncAuthKit may call it on the event loop.
+    __authkit_nonblocking__ = True
+
+    def __init__(self, manager: Any, *, user_writer: Any = None, max_pending: int = 256, workers: int = 1):
+        """
+        Args:
+            manager: The `PasswordManager` producing the new hashes; only
+                managers implementing `needs_rehash` trigger re-hashes. Pass a
+                low priority view to keep upgrades behind logins, e.g.
+                `scheduler.for_class("bulk")`.
+            user_writer: Writer to persist with instead of the login use case's
+                one, e.g. when the use case's writer is bound to a request-scoped
+                database session.
+            max_pending: Most re-hashes scheduled at once; further ones are
+                dropped until a slot frees up.
+            workers: Threads running sync re-hashes.
+
+        Raises:
+            ValueError: If `max_pending` or `workers` is not positive.
+        """
+        if max_pending < 1 or workers < 1:
+            raise ValueError("max_pending and workers must be at least 1")
+        self.manager = manager
+        self.user_writer = user_writer
+        self.max_pending = max_pending
+        self.workers = workers
+
+        self._lock = threading.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        # Users with a re-hash in flight: a burst of logins hashes only once.
+        self._pending: set[Any] = set()
+        # Running asyncio tasks, referenced until done so they are not garbage collected.
+        self._tasks: set["asyncio.Task[None]"] = set()
+        self._scheduled = 0
+        self._completed = 0
+        self._failed = 0
+        self._dropped = 0
+
+    def submit(self, user: User, password: str, user_writer: Any) -> bool:
+        """
+        Schedules re-hashing `password` on a worker thread if `user`'s hash is out of date.
+
+        Args:
+            user: The authenticated user, with the hash that was just verified.
+            password: The verified plain text password.
+            user_writer: The writer of the login use case.
+
+        Returns:
+            True if a re-hash was scheduled, False otherwise.
+        """
+        if not self._reserve(user):
+            return False
+        try:
+            self._start().submit(self._rehash, user, password, self.user_writer or user_writer)
+        except BaseException:
+            self._finish(user, ok=False)
+            raise
+        return True
+
+    async def submit_async(self, user: User, password: str, user_writer: Any) -> bool:
+        """
+        Schedules re-hashing `password` as a task on the running event loop if `user`'s hash is out of date.
+
+        Args:
+            user: The authenticated user, with the hash that was just verified.
+            password: The verified plain text password.
+            user_writer: The (async) writer of the login use case.
+
+        Returns:
+            True if a re-hash was scheduled, False otherwise.
+        """
+        if not self._reserve(user):
+            return False
+        task = asyncio.get_running_loop().create_task(
+            self._rehash_async(user, password, self.user_writer or user_writer)
+        )
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return True
+
+    def stats(self) -> RehashStats:
+        """Returns the counters since creation."""
+        with self._lock:
+            return RehashStats(
+                scheduled=self._scheduled,
+                completed=self._completed,
+                failed=self._failed,
+                dropped=self._dropped,
+                pending=len(self._pending),
+            )
+
+    def shutdown(self, wait: bool = True) -> None:
+        """
+        Stops the worker threads, if any were started.
+
+        Args:
+            wait: Whether to block until the scheduled sync re-hashes are persisted.
+        """
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait)
+
+    def _reserve(self, user: User) -> bool:
+        """Claims a pending slot for `user` if its hash is out of date."""
+        needs_rehash = getattr(self.manager, "needs_rehash", None)
+        if needs_rehash is None or not needs_rehash(user.password_hash):
+            return False
+        with self._lock:
+            if user.id in self._pending or len(self._pending) >= self.max_pending:
+                self._dropped += 1
+                return False
+            self._pending.add(user.id)
+            self._scheduled += 1
+        return True
+
+    def _finish(self, user: User, ok: bool) -> None:
+        with self._lock:
+            self._pending.discard(user.id)
+            if ok:
+                self._completed += 1
+            else:
+                self._failed += 1
+
+    def _rehash(self, user: User, password: str, user_writer: Any) -> None:
+        ok = False
+        try:
+            method, args = _write(user_writer, user, self.manager.hash(password))
+            method(*args)
+            ok = True
+        finally:
+            self._finish(user, ok)
+
+    async def _rehash_async(self, user: User, password: str, user_writer: Any) -> None:
+        ok = False
+        try:
+            method, args = _write(user_writer, user, await call_async(self.manager, "hash", password))
+            if inspect.iscoroutinefunction(method):
+                await method(*args)
+            else:
+                # A sync writer (e.g. the `user_writer` override) must not block the event loop.
+                await asyncio.get_running_loop().run_in_executor(None, method, *args)
+            ok = True
+        except Exception:
+            # Nobody awaits the task: the failure is counted, the next login retries.
+            pass
+        finally:
+            self._finish(user, ok)
+
+    def _start(self) -> ThreadPoolExecutor:
+        executor = self._executor
+        if executor is None:
+            with self._lock:
+                executor = self._executor
+                if executor is None:
+                    executor = self._executor = ThreadPoolExecutor(
+                        max_workers=self.workers, thread_name_prefix="authkit-rehash",
+                    )
+        return executor
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.manager!r})"
+
+
+def _write(user_writer: Any, user: User, new_hash: str) -> tuple[Callable[..., Any], tuple[Any, ...]]:
+    """Picks the writer method persisting `new_hash`: compare-and-set if available."""
+    replace = getattr(user_writer, "replace_password_hash", None)
+    if replace is not None:
+        return replace, (user.id, user.password_hash, new_hash)
+    return user_writer.change_password, (user.id, new_hash)
@@ -0,0 +1,381 @@
+"""
+Priority-aware scheduling of password hashing jobs with weighted fair queuing.
+"""
+import asyncio
+import os
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Iterable, Mapping, Optional
+
+from authkit.adapters.password._waiting import Waiter, async_wake, call_async
+from authkit.exceptions import OverloadedError
+
+
+@dataclass(frozen=True)
+class PriorityClass:
+    """
+    A class of hashing jobs sharing one queue in a `HashScheduler`.
+
+    Attributes:
+        name: Name of the class, used in routes and metrics.
+        weight: Share of the hashing slots the class gets under contention,
+            relative to the other classes.
+        max_concurrency: Most slots the class may hold at once (None: no cap).
+        max_queue: Most jobs of the class allowed to wait; further jobs are
+            rejected with `OverloadedError` (None: unbounded).
+    """
+    name: str
+    weight: float = 1.0
+    max_concurrency: Optional[int] = None
+    max_queue: Optional[int] = None
+
+
+DEFAULT_PRIORITY_CLASSES = (
+    PriorityClass("login", weight=16),
+    PriorityClass("mfa", weight=8),
+    PriorityClass("credential", weight=4),
+    PriorityClass("registration", weight=2),
+    PriorityClass("bulk", weight=1),
+)
+
+# Built-in use cases calling the password manager, by priority class.
+# Anything else (custom use cases, direct calls) goes to the default class.
+DEFAULT_ROUTES: Mapping[str, str] = {
+    "login": "login",
+    "login_otp_start": "mfa",
+    "change_password": "credential",
+    "forget_password_verify": "credential",
+    "register": "registration",
+    "register_otp_start": "registration",
+}
+
+
+@dataclass
+class ClassStats:
+    """
+    Per priority class metrics of a `HashScheduler`.
+
+    Attributes:
+        name: The priority class.
+        active: Jobs currently hashing.
+        waiting: Jobs queued for a slot.
+        completed: Jobs admitted since creation.
+        rejected: Jobs rejected because the class queue was full.
+        wait_mean_ms: Mean queueing delay over recent jobs.
+        wait_p95_ms: 95th percentile queueing delay over recent jobs.
+        wait_max_ms: Largest queueing delay since creation.
+    """
+    name: str
+    active: int
+    waiting: int
+    completed: int
+    rejected: int
+    wait_mean_ms: float
+    wait_p95_ms: float
+    wait_max_ms: float
+
+
+class _ClassState:
+    __slots__ = ("spec", "cap", "queue", "active", "last_finish", "completed", "rejected", "waits", "wait_max")
+
+    def __init__(self, spec: PriorityClass, cap: int):
+        self.spec = spec
+        self.cap = cap
+        # (waiter, finish tag, enqueue time)
+        self.queue: deque[tuple[Waiter, float, float]] = deque()
+        self.active = 0
+        self.last_finish = 0.0
+        self.completed = 0
+        self.rejected = 0
+        self.waits: deque[float] = deque(maxlen=1024)
+        self.wait_max = 0.0
+
+
+class HashScheduler:
+    """
+    Runs `hash`/`verify` of a password manager in a fixed number of slots,
+    shared between priority classes by weighted fair queuing.
+
+    Each use case gets a view bound to its priority class (see `DEFAULT_ROUTES`)
+    when it is resolved, so e.g. a burst of `register_otp_start` hashes cannot
+    starve `login` verifies: under contention each class receives slots in
+    proportion to its weight, optionally capped by `max_concurrency`.
+    The scheduler is self-clocked (SCFQ): every queued job gets a virtual
+    finish tag and the job with the smallest tag among eligible classes runs next.
+
+    Jobs wait for a slot without a deadline; wrap the scheduler in
+    `AdmissionControlledPasswordManager` to also bound the total wait. That
+    wrapper (like `OffloadedPasswordManager` in "thread" mode) forwards the
+    per-use-case binding to the scheduler; a custom wrapper must define
+    `bind_use_case` itself (see `_binding.bind_inner`), or every flow lands
+    in the default class.
+
+    Usage:
+        >>> scheduler = HashScheduler(
+        ...     OffloadedPasswordManager(ScryptPasswordManager(), max_workers=8),
+        ... )
+        >>> auth = AuthKit(password_manager=scheduler, ...)
+        >>> scheduler.stats()["login"].wait_p95_ms
+        >>> importer = scheduler.for_class("bulk")  # for scripts outside the facade
+    """
+
+    def __init__(
+        self,
+        manager: Any,
+        *,
+        workers: Optional[int] = None,
+        classes: Iterable[PriorityClass] = DEFAULT_PRIORITY_CLASSES,
+        routes: Optional[Mapping[str, str]] = None,
+        default_class: Optional[str] = None,
+    ):
+        """
+        Args:
+            manager: The wrapped `PasswordManager`.
+            workers: Number of hashing slots. Defaults to the wrapped manager's
+                `max_workers` (e.g. `OffloadedPasswordManager`), or `os.cpu_count()`.
+            classes: The priority classes.
+            routes: Use case name -> priority class name. Defaults to the
+                `DEFAULT_ROUTES` whose class is in `classes`.
+            default_class: Class for unrouted use cases and direct calls.
+                Defaults to the last of `classes`.
+
+        Raises:
+            ValueError: On an empty or duplicate class list, a non-positive weight
+                or worker count, or a route to an unknown class.
+        """
+        if workers is None:
+            workers = getattr(manager, "max_workers", None) or os.cpu_count() or 1
+        if workers < 1:
+            raise ValueError("workers must be at least 1")
+
+        self._classes: dict[str, _ClassState] = {}
+        for spec in classes:
+            if spec.name in self._classes:
+                raise ValueError(f"Duplicate priority class '{spec.name}'")
+            if spec.weight <= 0:
+                raise ValueError(f"Priority class '{spec.name}' must have a positive weight")
+            self._classes[spec.name] = _ClassState(spec, spec.max_concurrency or workers)
+        if not self._classes:
+            raise ValueError("At least one priority class is required")
+
+        if routes is None:
+            # Default routes to classes absent from a custom class list fall back to the default class.
+            routes = {use_case: name for use_case, name in DEFAULT_ROUTES.items() if name in self._classes}
+        routes = dict(routes)
+        default_class = default_class or list(self._classes)[-1]
+        unknown = {default_class, *routes.values()} - set(self._classes)
+        if unknown:
+            raise ValueError(f"Unknown priority class(es): {', '.join(sorted(unknown))}")
+
+        self.manager = manager
+        self.workers = workers
+        self.routes = routes
+        self.default_class = default_class
+
+        self._lock = threading.Lock()
+        self._free = workers
+        self._virtual_time = 0.0
+        self._views = {name: ScheduledPasswordManager(self, name) for name in self._classes}
+
+    @property
+    def releases_gil(self) -> bool:
+        """Mirrors the wrapped manager."""
+        return getattr(self.manager, "releases_gil", False)
+
+    def bind_use_case(self, use_case: str) -> "ScheduledPasswordManager":
+        """
+        Returns the view used by `use_case`; called by the Resolver when it injects this adapter.
+
+        Args:
+            use_case: The facade name of the use case being resolved.
+        """
+        return self._views[self.routes.get(use_case, self.default_class)]
+
+    def for_class(self, name: str) -> "ScheduledPasswordManager":
+        """
+        Returns a `PasswordManager` submitting its jobs to the priority class `name`.
+
+        Raises:
+            ValueError: If the class does not exist.
+        """
+        view = self._views.get(name)
+        if view is None:
+            raise ValueError(f"Unknown priority class '{name}'")
+        return view
+
+    def hash(self, password: str) -> str:
+        """Hashes `password` in the default class."""
+        return self._views[self.default_class].hash(password)
+
+    def verify(self, password: str, hashed_password: str) -> bool:
+        """Verifies `password` in the default class."""
+        return self._views[self.default_class].verify(password, hashed_password)
+
+    async def hash_async(self, password: str) -> str:
+        """Awaitable `hash` in the default class."""
+        return await self._views[self.default_class].hash_async(password)
+
+    async def verify_async(self, password: str, hashed_password: str) -> bool:
+        """Awaitable `verify` in the default class."""
+        return await self._views[self.default_class].verify_async(password, hashed_password)
+
+    def needs_rehash(self, hashed_password: str) -> bool:
+        """Asks the wrapped manager, inline (it only parses the hash); False if it cannot tell."""
+        needs_rehash = getattr(self.manager, "needs_rehash", None)
+        return needs_rehash is not None and needs_rehash(hashed_password)
+
+    def stats(self) -> dict[str, ClassStats]:
+        """Returns the metrics of every priority class, keyed by class name."""
+        with self._lock:
+            snapshot = [
+                (st.spec.name, st.active, len(st.queue), st.completed, st.rejected, list(st.waits), st.wait_max)
+                for st in self._classes.values()
+            ]
+        stats = {}
+        for name, active, waiting, completed, rejected, waits, wait_max in snapshot:
+            waits.sort()
+            stats[name] = ClassStats(
+                name=name,
+                active=active,
+                waiting=waiting,
+                completed=completed,
+                rejected=rejected,
+                wait_mean_ms=sum(waits) / len(waits) * 1000 if waits else 0.0,
+                wait_p95_ms=waits[int(0.95 * (len(waits) - 1))] * 1000 if waits else 0.0,
+                wait_max_ms=wait_max * 1000,
+            )
+        return stats
+
+    # -- Slot management ---------------------------------------------------
+
+    def _enter(self, st: _ClassState, waiter: Waiter) -> bool:
+        """Takes a slot right away (True) or queues `waiter` (False)."""
+        with self._lock:
+            if self._free > 0 and st.active < st.cap:
+                # Free slot and nobody eligible waiting (dispatch keeps it that way).
+                self._free -= 1
+                st.active += 1
+                st.completed += 1
+                st.waits.append(0.0)
+                return True
+            if st.spec.max_queue is not None and len(st.queue) >= st.spec.max_queue:
+                st.rejected += 1
+                raise OverloadedError(f"Password hashing queue '{st.spec.name}' is full")
+            tag = max(self._virtual_time, st.last_finish) + 1.0 / st.spec.weight
+            st.last_finish = tag
+            st.queue.append((waiter, tag, time.monotonic()))
+            return False
+
+    def _leave(self, st: _ClassState) -> None:
+        with self._lock:
+            self._free += 1
+            st.active -= 1
+            woken = self._dispatch()
+        for waiter in woken:
+            waiter.wake()
+
+    def _withdraw(self, st: _ClassState, waiter: Waiter) -> bool:
+        """Removes a cancelled waiter; returns True if it had been granted a slot meanwhile."""
+        with self._lock:
+            if waiter.granted:
+                return True
+            for index, entry in enumerate(st.queue):
+                if entry[0] is waiter:
+                    del st.queue[index]
+                    break
+            return False
+
+    def _dispatch(self) -> list[Waiter]:
+        """Grants free slots to the queued jobs with the smallest finish tags. Caller holds the lock."""
+        woken = []
+        while self._free > 0:
+            best: Optional[_ClassState] = None
+            for st in self._classes.values():
+                if st.queue and st.active < st.cap and (best is None or st.queue[0][1] < best.queue[0][1]):
+                    best = st
+            if best is None:
+                break
+            waiter, tag, enqueued = best.queue.popleft()
+            self._free -= 1
+            best.active += 1
+            best.completed += 1
+            self._virtual_time = tag
+            wait = time.monotonic() - enqueued
+            best.waits.append(wait)
+            best.wait_max = max(best.wait_max, wait)
+            waiter.granted = True
+            woken.append(waiter)
+        return woken
+
+    def _acquire(self, st: _ClassState) -> None:
+        event = threading.Event()
+        if not self._enter(st, Waiter(event.set)):
+            event.wait()
+
+    async def _acquire_async(self, st: _ClassState) -> None:
+        loop = asyncio.get_running_loop()
+        granted = loop.create_future()
+        waiter = Waiter(async_wake(loop, granted))
+        if self._enter(st, waiter):
+            return
+        try:
+            await asyncio.shield(granted)
+        except asyncio.CancelledError:
+            if self._withdraw(st, waiter):
+                self._leave(st)
+            raise
+
+    def _run(self, st: _ClassState, method: str, *args: Any) -> Any:
+        self._acquire(st)
+        try:
+            return getattr(self.manager, method)(*args)
+        finally:
+            self._leave(st)
+
+    async def _run_async(self, st: _ClassState, method: str, *args: Any) -> Any:
+        await self._acquire_async(st)
+        try:
+            return await call_async(self.manager, method, *args)
+        finally:
+            self._leave(st)
+
+
+class ScheduledPasswordManager:
+    """
+    `PasswordManager` view submitting its jobs to one priority class of a `HashScheduler`.
+    """
+
+    def __init__(self, scheduler: HashScheduler, priority_class: str):
+        self.scheduler = scheduler
+        self.priority_class = priority_class
+        self._state = scheduler._classes[priority_class]
+
+    @property
+    def releases_gil(self) -> bool:
+        """Mirrors the scheduled manager."""
+        return self.scheduler.releases_gil
+
+    def hash(self, password: str) -> str:
+        """Hashes `password` once the scheduler grants this class a slot."""
+        return self.scheduler._run(self._state, "hash", password)
+
+    def verify(self, password: str, hashed_password: str) -> bool:
+        """Verifies `password` once the scheduler grants this class a slot."""
+        return self.scheduler._run(self._state, "verify", password, hashed_password)
+
+    async def hash_async(self, password: str) -> str:
+        """Awaitable `hash`: waits for a slot without blocking the event loop."""
+        return await self.scheduler._run_async(self._state, "hash", password)
+
+    async def verify_async(self, password: str, hashed_password: str) -> bool:
+        """Awaitable `verify`: waits for a slot without blocking the event loop."""
+        return await self.scheduler._run_async(self._state, "verify", password, hashed_password)
+
+    def needs_rehash(self, hashed_password: str) -> bool:
+        """Asks the scheduled manager, without waiting for a slot."""
+        return self.scheduler.needs_rehash(hashed_password)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.priority_class!r})"
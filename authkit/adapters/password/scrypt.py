@@ -0,0 +1,113 @@
+import hashlib
+import hmac
+import os
+
+from authkit.adapters.password import _format
+
+SCHEME = "scrypt"
+
+
+def _maxmem(n: int, r: int, p: int) -> int:
+    # Memory OpenSSL needs for these parameters, plus some slack (hashlib defaults to 32 MiB).
+    return 128 * r * (n + p + 2) + (1 << 20)
+
+
+class ScryptPasswordManager:
+    """
+    `PasswordManager` using `hashlib.scrypt` (memory-hard).
+
+    Hashes look like `$scrypt$ln=15,r=8,p=1$<salt>$<hash>`; `verify` reads the
+    cost parameters from the hash itself, so hashes created with older
+    parameters keep verifying after the cost is raised, and `needs_rehash`
+    reports them so they can be upgraded on the next login.
+
+    Use `calibrate(scheme="scrypt", ...)` to pick parameters for this host.
+    """
+    # hashlib releases the GIL while hashing: threads are enough to use every core.
+    releases_gil = True
+    scheme = SCHEME
+
+    def __init__(self, ln: int = 15, r: int = 8, p: int = 1, salt_size: int = 16, dklen: int = 32):
+        """
+        Args:
+            ln: log2 of the CPU/memory cost N (memory used is about 128 * r * 2**ln bytes).
+            r: Block size.
+            p: Parallelization factor (run sequentially: cost grows linearly).
+            salt_size: Number of random salt bytes.
+            dklen: Length of the derived key in bytes.
+        """
+        if ln < 1 or r < 1 or p < 1:
+            raise ValueError("scrypt parameters must be positive")
+        self.ln = ln
+        self.r = r
+        self.p = p
+        self.salt_size = salt_size
+        self.dklen = dklen
+
+    @property
+    def params(self) -> dict[str, int]:
+        """The cost parameters as encoded in new hashes."""
+        return {"ln": self.ln, "r": self.r, "p": self.p}
+
+    def hash(self, password: str) -> str:
+        """
+        Hashes a plain text password with a fresh random salt.
+
+        Args:
+            password: The plain text password to hash.
+
+        Returns:
+            The self-describing hash string.
+        """
+        salt = os.urandom(self.salt_size)
+        digest = self._derive(password, salt, self.ln, self.r, self.p, self.dklen)
+        return _format.encode(SCHEME, self.params, salt, digest)
+
+    def verify(self, password: str, hashed_password: str) -> bool:
+        """
+        Verifies a plain text password against a hash made by this class.
+
+        Args:
+            password: The plain text password.
+            hashed_password: The hash to verify against.
+
+        Returns:
+            True if the password matches; False otherwise, including for
+            malformed hashes or hashes of another scheme.
+        """
+        parsed = _format.decode(hashed_password, SCHEME)
+        if parsed is None:
+            return False
+        params, salt, expected = parsed
+        try:
+            digest = self._derive(password, salt, params["ln"], params["r"], params["p"], len(expected))
+        except (KeyError, ValueError):
+            return False
+        return hmac.compare_digest(digest, expected)
+
+    def needs_rehash(self, hashed_password: str) -> bool:
+        """
+        Checks whether a hash was made with other parameters than new hashes.
+
+        Args:
+            hashed_password: The stored hash.
+
+        Returns:
+            True for hashes with other cost parameters or key length, and for
+            hashes of other schemes (migrated to scrypt when this is the
+            current manager of a `MultiSchemePasswordManager`).
+        """
+        parsed = _format.decode(hashed_password, SCHEME)
+        if parsed is None:
+            return True
+        params, _, digest = parsed
+        return params != self.params or len(digest) != self.dklen
+
+    @staticmethod
+    def _derive(password: str, salt: bytes, ln: int, r: int, p: int, dklen: int) -> bytes:
+        n = 1 << ln
+        return hashlib.scrypt(password.encode("utf-8"), salt=salt, n=n, r=r, p=p,
+                              dklen=dklen, maxmem=_maxmem(n, r, p))
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(ln={self.ln}, r={self.r}, p={self.p})"
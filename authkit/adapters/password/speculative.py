@@ -0,0 +1,244 @@
+"""
+Background password hashing for multi-step flows (e.g. registration with OTP).
+"""
+import asyncio
+import inspect
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from typing import Any, Callable, Optional
+from uuid import uuid4
+
+# Prefix of the placeholders stored instead of a hash; never a valid hash of any scheme.
+PLACEHOLDER_PREFIX = "$pending$"
+
+
+class SpeculativePasswordHasher:
+    """
+    `SpeculativeHasher` computing hashes on a thread pool while the flow carries on.
+
+    With it, `register_otp_start` stores the registration intent and sends the
+    OTP right away, holding a placeholder instead of the hash. The hash is
+    computed meanwhile and written into the stored intent once ready, if the
+    intent store implements `update(key, intent)`. `register_otp_verify` uses
+    the attached hash, or waits for the local computation if the user was
+    faster than the hashing. The hash that ends up in the user record is the
+    same as without this adapter.
+
+    Without `update` on the intent store, the placeholder can only be resolved
+    by the process that started the hashing: enable it with sticky routing only.
+
+    Usage:
+        >>> auth = AuthKit(password_manager=passwords,
+        ...                speculative_hasher=SpeculativePasswordHasher(passwords), ...)
+    """
+    # `start`/`attach` only enqueue: AsyncAuthKit may call them on the event loop.
+    __authkit_nonblocking__ = True
+
+    def __init__(self, manager: Any, *, workers: Optional[int] = None, max_pending: int = 1024,
+                 ttl: float = 900.0, timeout: Optional[float] = None):
+        """
+        Args:
+            manager: The `PasswordManager` computing the hashes.
+            workers: Threads hashing in the background (default: the executor's
+                default). Use 1 or 2 when `manager` already offloads its work.
+            max_pending: Most hashes kept for `resolve()`; beyond that `start()`
+                hashes inline, as without this adapter.
+            ttl: Seconds a computed hash is kept for `resolve()`, e.g. the
+                lifetime of the registration intents.
+            timeout: Longest `resolve()` waits for a hash still being computed
+                (None: no limit).
+
+        Raises:
+            ValueError: If `max_pending` or `ttl` is not positive.
+        """
+        if max_pending < 1 or ttl <= 0:
+            raise ValueError("max_pending and ttl must be positive")
+        self.manager = manager
+        self.workers = workers
+        self.max_pending = max_pending
+        self.ttl = ttl
+        self.timeout = timeout
+
+        self._lock = threading.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        # placeholder -> (future hash, expiry); insertion ordered, so oldest first.
+        self._jobs: dict[str, tuple["Future[str]", float]] = {}
+        # Running asyncio tasks, referenced until done so they are not garbage collected.
+        self._tasks: set["asyncio.Task[Any]"] = set()
+
+    def start(self, password: str) -> str:
+        """
+        Starts hashing `password` in the background.
+
+        Args:
+            password: The plain text password to hash.
+
+        Returns:
+            A placeholder for the hash, or the hash itself when too many
+            hashes are pending already.
+        """
+        now = time.monotonic()
+        with self._lock:
+            self._expire(now)
+            full = len(self._jobs) >= self.max_pending
+        if full:
+            return self.manager.hash(password)
+        placeholder = f"{PLACEHOLDER_PREFIX}{uuid4().hex}"
+        future = self._start().submit(self.manager.hash, password)
+        with self._lock:
+            self._jobs[placeholder] = (future, now + self.ttl)
+        return placeholder
+
+    def attach(self, placeholder: str, on_ready: Callable[[str], Any]) -> None:
+        """
+        Calls `on_ready(hash)` once the hash for `placeholder` is computed.
+
+        Called from a running event loop, `on_ready` runs on that loop and an
+        awaitable result is run as a task; otherwise it runs on the hashing thread.
+        Failures of the hashing or of `on_ready` are left to `resolve()`: the
+        placeholder then simply stays in the stored record.
+
+        Args:
+            placeholder: A placeholder returned by `start()`.
+            on_ready: Receives the hash.
+        """
+        with self._lock:
+            job = self._jobs.get(placeholder)
+        if job is None:
+            return
+        try:
+            loop: Optional[asyncio.AbstractEventLoop] = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+
+        def done(future: "Future[str]") -> None:
+            if future.cancelled() or future.exception() is not None:
+                return
+            if loop is None:
+                try:
+                    on_ready(future.result())
+                except Exception:
+                    pass
+            elif not loop.is_closed():
+                loop.call_soon_threadsafe(self._call_on_loop, on_ready, future.result())
+
+        job[0].add_done_callback(done)
+
+    def resolve(self, password_hash: str) -> Optional[str]:
+        """
+        Returns the hash for a placeholder, waiting for it if needed.
+
+        Args:
+            password_hash: A stored hash, or a placeholder returned by `start()`.
+
+        Returns:
+            `password_hash` itself if it is not a placeholder, the computed hash
+            otherwise, or None for placeholders unknown to (or expired in) this process.
+
+        Raises:
+            TimeoutError: If the hash is not ready within `timeout`; it is kept,
+                so a retry waits for it again.
+        """
+        if not password_hash.startswith(PLACEHOLDER_PREFIX):
+            return password_hash
+        future = self._find(password_hash)
+        if future is None:
+            return None
+        try:
+            result = future.result(timeout=self.timeout)
+        except FutureTimeoutError:
+            # Still computing: kept, so a retry can wait for it again.
+            raise
+        except BaseException:
+            self._forget(password_hash, future)
+            raise
+        self._forget(password_hash, future)
+        return result
+
+    async def resolve_async(self, password_hash: str) -> Optional[str]:
+        """Awaitable `resolve`: waits for the hash without blocking the event loop."""
+        if not password_hash.startswith(PLACEHOLDER_PREFIX):
+            return password_hash
+        future = self._find(password_hash)
+        if future is None:
+            return None
+        try:
+            # Shielded: a timeout must not cancel a hash that is still queued.
+            result = await asyncio.wait_for(asyncio.shield(asyncio.wrap_future(future)), self.timeout)
+        except (asyncio.TimeoutError, asyncio.CancelledError):
+            raise
+        except BaseException:
+            self._forget(password_hash, future)
+            raise
+        self._forget(password_hash, future)
+        return result
+
+    def pending(self) -> int:
+        """Returns the number of hashes kept for `resolve()` (computing or computed)."""
+        with self._lock:
+            return len(self._jobs)
+
+    def shutdown(self, wait: bool = True) -> None:
+        """
+        Stops the hashing threads, if any were started.
+
+        Args:
+            wait: Whether to block until the started hashes are computed.
+        """
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait)
+
+    def _find(self, placeholder: str) -> Optional["Future[str]"]:
+        with self._lock:
+            self._expire(time.monotonic())
+            job = self._jobs.get(placeholder)
+        return None if job is None else job[0]
+
+    def _forget(self, placeholder: str, future: "Future[str]") -> None:
+        """Drops a resolved hash, once its result (or failure) has been read."""
+        with self._lock:
+            job = self._jobs.get(placeholder)
+            if job is not None and job[0] is future:
+                del self._jobs[placeholder]
+
+    def _expire(self, now: float) -> None:
+        """Drops the hashes of abandoned flows. Caller holds the lock."""
+        jobs = self._jobs
+        while jobs:
+            placeholder, (_, expiry) = next(iter(jobs.items()))
+            if expiry > now:
+                break
+            del jobs[placeholder]
+
+    def _call_on_loop(self, on_ready: Callable[[str], Any], password_hash: str) -> None:
+        try:
+            result = on_ready(password_hash)
+        except Exception:
+            return
+        if inspect.isawaitable(result):
+            task = asyncio.ensure_future(result)
+            self._tasks.add(task)
+            task.add_done_callback(self._forget_task)
+
+    def _forget_task(self, task: "asyncio.Task[Any]") -> None:
+        self._tasks.discard(task)
+        if not task.cancelled():
+            # Retrieved so that a failed write is not reported as never retrieved.
+            task.exception()
+
+    def _start(self) -> ThreadPoolExecutor:
+        executor = self._executor
+        if executor is None:
+            with self._lock:
+                executor = self._executor
+                if executor is None:
+                    executor = self._executor = ThreadPoolExecutor(
+                        max_workers=self.workers, thread_name_prefix="authkit-speculative-hash",
+                    )
+        return executor
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.manager!r})"
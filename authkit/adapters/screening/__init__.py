@@ -0,0 +1,20 @@
+"""
+`PasswordScreener` implementations rejecting passwords known from data breaches.
+"""
+from typing import TYPE_CHECKING
+from authkit._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from authkit.adapters.screening.bloom import BloomFilterPasswordScreener, BloomFilterInfo, build_bloom_filter
+
+__all__ = [
+    "BloomFilterPasswordScreener",
+    "BloomFilterInfo",
+    "build_bloom_filter",
+]
+
+__getattr__, __dir__ = lazy_exports(__name__, {
+    "BloomFilterPasswordScreener": "authkit.adapters.screening.bloom",
+    "BloomFilterInfo": "authkit.adapters.screening.bloom",
+    "build_bloom_filter": "authkit.adapters.screening.bloom",
+})
@@ -0,0 +1,265 @@
+"""
+Breached-password screening with a memory-mapped Bloom filter file.
+
+The filter is built offline from a list of SHA-1 hashes (e.g. the "Pwned
+Passwords" download, one `HASH:COUNT` line per password) and memory-mapped
+read-only at runtime. Every worker process maps the same file, so the
+operating system's page cache holds a single shared copy, and only the
+pages actually probed are ever loaded.
+
+Build a filter:
+
+    python -m authkit.adapters.screening.bloom pwned-passwords-sha1.txt breached.bloom --fp-rate 1e-6
+"""
+import argparse
+import hashlib
+import math
+import mmap
+import os
+import struct
+import sys
+from dataclasses import dataclass
+from typing import IO, Iterable, Iterator, Optional, Sequence
+
+MAGIC = b"AKBLOOM1"
+# magic, number of bits, number of hash functions, number of items.
+_HEADER = struct.Struct("<8sQIQ")
+HEADER_SIZE = 32
+
+
+@dataclass
+class BloomFilterInfo:
+    """
+    Parameters of a Bloom filter file.
+
+    Attributes:
+        bits: Size of the bit array.
+        hashes: Number of bit positions checked per password.
+        items: Number of hashes added when building.
+        size_bytes: Size of the file.
+        fp_rate: Expected false positive rate for `items`.
+    """
+    bits: int
+    hashes: int
+    items: int
+    size_bytes: int
+    fp_rate: float
+
+
+def _positions(digest: bytes, bits: int, hashes: int) -> Iterator[int]:
+    # SHA-1 output is uniform: split it into two 64-bit halves for double hashing.
+    h1 = int.from_bytes(digest[:8], "little")
+    h2 = int.from_bytes(digest[8:16], "little") | 1
+    for i in range(hashes):
+        yield (h1 + i * h2) % bits
+
+
+def _fp_rate(bits: int, hashes: int, items: int) -> float:
+    return (1.0 - math.exp(-hashes * items / bits)) ** hashes if items else 0.0
+
+
+class BloomFilterPasswordScreener:
+    """
+    `PasswordScreener` backed by a memory-mapped Bloom filter of breached SHA-1 hashes.
+
+    A lookup hashes the password once with SHA-1 and probes a few bits of the
+    mapped file, stopping at the first clear bit, so most clean passwords
+    cost a single probe. Resident memory is only the pages probed, shared
+    by every process mapping the file.
+
+    Bloom filters have no false negatives: every listed password is
+    rejected. A small fraction of other passwords (the false positive rate
+    chosen when building) is rejected too.
+
+    Usage:
+        >>> screener = BloomFilterPasswordScreener("/var/lib/authkit/breached.bloom")
+        >>> auth = AuthKit(password_screener=screener, ...)
+    """
+    # A lookup is a handful of page cache reads: AsyncAuthKit calls it on the event loop.
+    __authkit_nonblocking__ = True
+
+    def __init__(self, path: "str | os.PathLike[str]"):
+        """
+        Args:
+            path: A file written by `build_bloom_filter` (or the builder CLI).
+
+        Raises:
+            ValueError: If the file is not a Bloom filter file or is truncated.
+        """
+        with open(path, "rb") as file:
+            self._map = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            if len(self._map) < HEADER_SIZE or self._map[:len(MAGIC)] != MAGIC:
+                raise ValueError(f"{os.fspath(path)} is not a Bloom filter file")
+            _, bits, hashes, _ = _HEADER.unpack_from(self._map)
+            if bits < 1 or hashes < 1 or len(self._map) < HEADER_SIZE + (bits + 7) // 8:
+                raise ValueError(f"{os.fspath(path)} is truncated or corrupt")
+        except ValueError:
+            self._map.close()
+            raise
+        if hasattr(self._map, "madvise") and hasattr(mmap, "MADV_RANDOM"):
+            # Probes are random: reading ahead would only pollute the page cache.
+            self._map.madvise(mmap.MADV_RANDOM)
+        self.path = os.fspath(path)
+        self._bits = bits
+        self._hashes = hashes
+
+    @property
+    def info(self) -> BloomFilterInfo:
+        """The parameters the filter was built with."""
+        _, bits, hashes, items = _HEADER.unpack_from(self._map)
+        return BloomFilterInfo(bits=bits, hashes=hashes, items=items, size_bytes=len(self._map),
+                               fp_rate=_fp_rate(bits, hashes, items))
+
+    def is_breached(self, password: str) -> bool:
+        """
+        Checks a password against the filter.
+
+        Args:
+            password: The plain text password.
+
+        Returns:
+            True if the password is (probably) in the breached list, False if it is certainly not.
+        """
+        return self.contains_sha1(hashlib.sha1(password.encode("utf-8")).digest())
+
+    def contains_sha1(self, digest: bytes) -> bool:
+        """
+        Checks a raw SHA-1 digest against the filter.
+
+        Args:
+            digest: The 20-byte SHA-1 digest of a password.
+        """
+        # `_positions` inlined: this loop is the whole cost of a lookup.
+        data = self._map
+        bits = self._bits
+        position = int.from_bytes(digest[:8], "little") % bits
+        step = (int.from_bytes(digest[8:16], "little") | 1) % bits
+        for _ in range(self._hashes):
+            if not data[HEADER_SIZE + (position >> 3)] >> (position & 7) & 1:
+                return False
+            position += step
+            if position >= bits:
+                position -= bits
+        return True
+
+    def close(self) -> None:
+        """Unmaps the file."""
+        self._map.close()
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.path!r})"
+
+
+def build_bloom_filter(digests: Iterable[bytes], path: "str | os.PathLike[str]", *,
+                       capacity: int, fp_rate: float = 1e-6) -> BloomFilterInfo:
+    """
+    Writes a Bloom filter file holding `digests`.
+
+    The bit array is written through a shared memory map of the output file,
+    so building does not need the whole filter in Python memory.
+
+    Args:
+        digests: 20-byte SHA-1 digests of the breached passwords.
+        path: The file to create (overwritten if it exists).
+        capacity: Number of digests the filter is sized for.
+        fp_rate: Target false positive rate at `capacity` items.
+
+    Returns:
+        The parameters of the written filter.
+
+    Raises:
+        ValueError: On a non-positive capacity or a rate outside (0, 1).
+    """
+    if capacity < 1 or not 0 < fp_rate < 1:
+        raise ValueError("capacity must be positive and fp_rate between 0 and 1")
+    bits = max(8, math.ceil(-capacity * math.log(fp_rate) / math.log(2) ** 2))
+    hashes = max(1, round(bits / capacity * math.log(2)))
+    size = HEADER_SIZE + (bits + 7) // 8
+
+    items = 0
+    with open(path, "w+b") as file:
+        file.truncate(size)
+        with mmap.mmap(file.fileno(), size) as data:
+            for digest in digests:
+                for position in _positions(digest, bits, hashes):
+                    data[HEADER_SIZE + (position >> 3)] |= 1 << (position & 7)
+                items += 1
+            _HEADER.pack_into(data, 0, MAGIC, bits, hashes, items)
+            data.flush()
+    return BloomFilterInfo(bits=bits, hashes=hashes, items=items, size_bytes=size,
+                           fp_rate=_fp_rate(bits, hashes, items))
+
+
+def read_sha1_list(lines: Iterable[str], *, min_count: int = 0, plaintext: bool = False) -> Iterator[bytes]:
+    """
+    Parses a breached password list into SHA-1 digests.
+
+    Args:
+        lines: Lines of `HASH` or `HASH:COUNT` (hex SHA-1, any case), or plain
+            passwords with `plaintext=True`.
+        min_count: Skips hashes seen fewer times than this (lines without a count are kept).
+        plaintext: Whether the lines are passwords to hash rather than hashes.
+
+    Yields:
+        The 20-byte digests. Blank and malformed lines are skipped.
+    """
+    for line in lines:
+        line = line.rstrip("\r\n")
+        if plaintext:
+            if line:
+                yield hashlib.sha1(line.encode("utf-8")).digest()
+            continue
+        hex_digest, _, count = line.strip().partition(":")
+        if len(hex_digest) != 40:
+            continue
+        try:
+            digest = bytes.fromhex(hex_digest)
+            if count and int(count) < min_count:
+                continue
+        except ValueError:
+            continue
+        yield digest
+
+
+def _count_lines(path: str, min_count: int, plaintext: bool) -> int:
+    with open(path, encoding="utf-8", errors="replace") as file:
+        return sum(1 for _ in read_sha1_list(file, min_count=min_count, plaintext=plaintext))
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Command line entry point of the filter builder."""
+    parser = argparse.ArgumentParser(
+        prog="python -m authkit.adapters.screening.bloom",
+        description="Build a Bloom filter file of breached passwords for BloomFilterPasswordScreener.",
+    )
+    parser.add_argument("input", help="Text file of SHA-1 hashes (HASH or HASH:COUNT per line), '-' for stdin")
+    parser.add_argument("output", help="Bloom filter file to write")
+    parser.add_argument("--fp-rate", type=float, default=1e-6, help="Target false positive rate (default: 1e-6)")
+    parser.add_argument("--capacity", type=int, help="Number of hashes to size for (default: counted from the input)")
+    parser.add_argument("--min-count", type=int, default=0, help="Skip hashes seen fewer times than this")
+    parser.add_argument("--plaintext", action="store_true", help="Input lines are passwords, not hashes")
+    args = parser.parse_args(argv)
+
+    capacity = args.capacity
+    if capacity is None:
+        if args.input == "-":
+            parser.error("--capacity is required when reading from stdin")
+        capacity = _count_lines(args.input, args.min_count, args.plaintext)
+        if not capacity:
+            parser.error("the input holds no hashes")
+
+    source: IO[str] = sys.stdin if args.input == "-" else open(args.input, encoding="utf-8", errors="replace")
+    try:
+        info = build_bloom_filter(read_sha1_list(source, min_count=args.min_count, plaintext=args.plaintext),
+                                  args.output, capacity=capacity, fp_rate=args.fp_rate)
+    finally:
+        if source is not sys.stdin:
+            source.close()
+    print(f"{args.output}: {info.items} hashes, {info.bits} bits, {info.hashes} hash functions, "
+          f"{info.size_bytes / 2**20:.1f} MiB, expected false positive rate {info.fp_rate:.2e}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,40 @@
+"""
+`AuthSessionService` implementations and their revocation and session stores.
+"""
+from typing import TYPE_CHECKING
+from authkit._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from authkit.adapters.session.hmac_session import HMACSessionService, SignedSession, SessionClaims
+    from authkit.adapters.session.revocation import InMemoryRevocationStore, FilteredRevocationStore
+    from authkit.adapters.session.stored_session import StoredSessionService, StoredSession
+    from authkit.adapters.session.store import InMemorySessionStore, RedisSessionStore
+    from authkit.adapters.session.token_cache import VerifiedTokenCache, TokenCacheStats
+
+__all__ = [
+    "HMACSessionService",
+    "SignedSession",
+    "SessionClaims",
+    "InMemoryRevocationStore",
+    "FilteredRevocationStore",
+    "StoredSessionService",
+    "StoredSession",
+    "InMemorySessionStore",
+    "RedisSessionStore",
+    "VerifiedTokenCache",
+    "TokenCacheStats",
+]
+
+__getattr__, __dir__ = lazy_exports(__name__, {
+    "HMACSessionService": "authkit.adapters.session.hmac_session",
+    "SignedSession": "authkit.adapters.session.hmac_session",
+    "SessionClaims": "authkit.adapters.session.hmac_session",
+    "InMemoryRevocationStore": "authkit.adapters.session.revocation",
+    "FilteredRevocationStore": "authkit.adapters.session.revocation",
+    "StoredSessionService": "authkit.adapters.session.stored_session",
+    "StoredSession": "authkit.adapters.session.stored_session",
+    "InMemorySessionStore": "authkit.adapters.session.store",
+    "RedisSessionStore": "authkit.adapters.session.store",
+    "VerifiedTokenCache": "authkit.adapters.session.token_cache",
+    "TokenCacheStats": "authkit.adapters.session.token_cache",
+})
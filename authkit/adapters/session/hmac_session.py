@@ -0,0 +1,375 @@
+"""
+Stateless session tokens signed with HMAC-SHA256.
+"""
+import hashlib
+import hmac
+import os
+import re
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Mapping, Optional, Sequence, Union
+from uuid import UUID
+
+from authkit.adapters.session import codec
+from authkit.exceptions import FeatureNotConfiguredError
+
+_KEY_ID = re.compile(r"[A-Za-z0-9_-]{1,32}")
+_MIN_KEY_BYTES = 16
+# Session IDs are a random nonce and a MAC binding it to the owner, so `revoke` can check ownership.
+_SESSION_NONCE_BYTES = 8
+# Starts with a zero byte: never the first byte of a signed token (the format version).
+_SESSION_ID_DOMAIN = b"\0session-id"
+
+
+@dataclass(frozen=True)
+class SessionClaims:
+    """
+    The claims carried by a signed session token.
+
+    Attributes:
+        user_id: The owner of the session.
+        session_id: The ID of the session.
+        credentials_version: The user's credentials version when the session was issued.
+        issued_at: When the session was issued (epoch seconds, millisecond precision).
+        expires_at: When the token expires (epoch seconds).
+        key_id: The ID of the key the token is signed with.
+    """
+    user_id: UUID
+    session_id: UUID
+    credentials_version: int
+    issued_at: float
+    expires_at: int
+    key_id: str
+
+
+@dataclass(frozen=True)
+class SignedSession:
+    """
+    `AuthSession` issued by `HMACSessionService`.
+
+    Attributes:
+        session_id: The ID of the session.
+        session_token: The signed token to hand to the client.
+        user_id: The owner of the session.
+        credentials_version: The user's credentials version the session is tied to.
+        expires_at: When the token expires (epoch seconds).
+    """
+    session_id: UUID
+    session_token: str
+    user_id: UUID
+    credentials_version: int
+    expires_at: int
+
+
+class _SigningKey:
+    """HMAC-SHA256 with the inner and outer hash states precomputed for one key."""
+    __slots__ = ("_inner", "_outer")
+
+    def __init__(self, secret: bytes):
+        if len(secret) > 64:
+            secret = hashlib.sha256(secret).digest()
+        secret = secret.ljust(64, b"\0")
+        self._inner = hashlib.sha256(bytes(b ^ 0x36 for b in secret))
+        self._outer = hashlib.sha256(bytes(b ^ 0x5C for b in secret))
+
+    def sign(self, message: bytes) -> bytes:
+        inner = self._inner.copy()
+        inner.update(message)
+        outer = self._outer.copy()
+        outer.update(inner.digest())
+        return outer.digest()
+
+
+class HMACSessionService:
+    """
+    `AuthSessionService` issuing self-contained tokens signed with HMAC-SHA256.
+
+    A token carries the user ID, the session ID, the credentials version and
+    the issue and expiry times, so `verify` is pure CPU: one HMAC over the
+    token and a few comparisons, no storage round trip. Tokens use the compact
+    binary layout of `authkit.adapters.session.codec` (91 characters).
+
+    Keys are identified by a key ID written into every token. Tokens are
+    signed with the active key and verified with whichever key they name, so
+    keys rotate without downtime: add the new key, activate it once every
+    process knows it, and remove the old one after the token lifetime.
+
+    `verify` only accepts a token for the user it was issued to. Session IDs
+    end with a MAC of their owner, so `revoke` can tell, without any state,
+    whether a session ID was issued to the given user (by any known key).
+
+    Signed tokens cannot be taken back. `revoke_all` is covered anyway
+    by the credentials version, which AuthKit bumps on global logout and
+    password changes. Revoking single sessions needs a `SessionRevocationStore`;
+    without one `revoke` raises `FeatureNotConfiguredError`. To share revocations between
+    processes without a lookup per `verify`, put a `FilteredRevocationStore`
+    in front of a shared store.
+
+    Usage:
+        >>> sessions = HMACSessionService({"2024-06": os.environ["SESSION_KEY"]}, ttl=3600)
+        >>> auth = AuthKit(session_service=sessions, ...)
+    """
+    # No I/O of its own: AsyncAuthKit calls it inline unless the revocation store blocks (see __init__).
+    __authkit_nonblocking__ = True
+
+    def __init__(self, keys: Mapping[str, Union[str, bytes]], *, active_key: Optional[str] = None,
+                 ttl: int = 3600, revocations: Any = None, clock: Callable[[], float] = time.time):
+        """
+        Args:
+            keys: Secrets by key ID (letters, digits, `_` and `-`). Secrets must be
+                at least 16 bytes; str secrets are UTF-8 encoded.
+            active_key: The key ID new tokens are signed with (default: the last one of `keys`).
+            ttl: Lifetime of the tokens in seconds.
+            revocations: Optional `SessionRevocationStore` for `revoke` and `revoke_all`.
+            clock: Returns the current time in epoch seconds.
+
+        Raises:
+            ValueError: On an invalid key ID or secret, an unknown `active_key`,
+                no keys or a non-positive `ttl`.
+        """
+        if ttl <= 0:
+            raise ValueError("ttl must be positive")
+        if not keys:
+            raise ValueError("At least one key is required")
+        self.ttl = int(ttl)
+        self.revocations = revocations
+        if revocations is not None:
+            self.__authkit_nonblocking__ = getattr(revocations, "__authkit_nonblocking__", False)
+        self._clock = clock
+        self._lock = threading.Lock()
+        # Signing functions by ASCII key ID; replaced as a whole on rotation, so readers never take the lock.
+        self._keys: dict[bytes, Callable[[bytes], bytes]] = {
+            kid.encode("ascii"): _signing_key(kid, secret).sign for kid, secret in keys.items()
+        }
+        active_key = list(keys)[-1] if active_key is None else active_key
+        if active_key.encode() not in self._keys:
+            raise ValueError(f"Unknown key ID: {active_key!r}")
+        self._active = active_key
+
+    @property
+    def active_key(self) -> str:
+        """The key ID new tokens are signed with."""
+        return self._active
+
+    def add_key(self, key_id: str, secret: Union[str, bytes], *, activate: bool = False) -> None:
+        """
+        Adds a key, so tokens signed with it are accepted.
+
+        Args:
+            key_id: The ID of the key.
+            secret: The secret, at least 16 bytes.
+            activate: Whether to sign new tokens with it right away.
+
+        Raises:
+            ValueError: On an invalid key ID or secret.
+        """
+        sign = _signing_key(key_id, secret).sign
+        with self._lock:
+            self._keys = {**self._keys, key_id.encode("ascii"): sign}
+            if activate:
+                self._active = key_id
+
+    def activate_key(self, key_id: str) -> None:
+        """
+        Signs new tokens with a known key.
+
+        Raises:
+            ValueError: If the key is unknown.
+        """
+        with self._lock:
+            if key_id.encode() not in self._keys:
+                raise ValueError(f"Unknown key ID: {key_id!r}")
+            self._active = key_id
+
+    def remove_key(self, key_id: str) -> None:
+        """
+        Removes a key: tokens signed with it are rejected from now on.
+
+        Raises:
+            ValueError: If the key is the active one.
+        """
+        with self._lock:
+            if key_id == self._active:
+                raise ValueError("The active key cannot be removed")
+            self._keys = {kid: sign for kid, sign in self._keys.items() if kid != key_id.encode()}
+
+    def issue(self, user_id: UUID, creds_version: int) -> SignedSession:
+        """
+        Issues a signed session token.
+
+        Args:
+            user_id: The ID of the user.
+            creds_version: The user's current credentials version.
+
+        Returns:
+            The session, with its token.
+        """
+        kid = self._active.encode("ascii")
+        sign = self._keys[kid]
+        nonce = os.urandom(_SESSION_NONCE_BYTES)
+        session_id = UUID(bytes=nonce + _owner_tag(sign, user_id, nonce))
+        now = self._clock()
+        expires_at = int(now) + self.ttl
+        token = codec.encode(kid, user_id, session_id, int(creds_version), int(now * 1000), expires_at, sign)
+        return SignedSession(session_id=session_id, session_token=token, user_id=user_id,
+                             credentials_version=int(creds_version), expires_at=expires_at)
+
+    def verify(self, session_token: str, creds_version: int, user_id: UUID) -> bool:
+        """
+        Validates a token: signature, expiry, owner, credentials version and revocations.
+
+        Args:
+            session_token: The raw token string.
+            creds_version: The current credentials version of the user.
+            user_id: The user the token must have been issued to.
+
+        Returns:
+            True if valid, False if expired, tampered, obsolete, revoked or issued to another user.
+        """
+        fields = self._check(session_token)
+        if fields is None or fields.credentials_version != creds_version or fields.user_id != user_id.bytes:
+            return False
+        revocations = self.revocations
+        if revocations is not None and revocations.is_revoked(
+            UUID(bytes=fields.user_id), UUID(bytes=fields.session_id), fields.issued_at_ms / 1000
+        ):
+            return False
+        return True
+
+    def verify_many(self, items: Sequence[tuple[str, int, UUID]]) -> list[bool]:
+        """
+        Validates a batch of tokens, reading the clock and the key table once.
+
+        Args:
+            items: `(session_token, creds_version, user_id)` triples.
+
+        Returns:
+            One result per item, in order, as `verify` would return it.
+        """
+        lookup = self._keys.get
+        now = self._clock()
+        revocations = self.revocations
+        results = []
+        for session_token, creds_version, user_id in items:
+            fields = codec.decode(session_token, lookup)
+            valid = (fields is not None and fields.expires_at > now
+                     and fields.credentials_version == creds_version and fields.user_id == user_id.bytes)
+            if valid and revocations is not None:
+                valid = not revocations.is_revoked(UUID(bytes=fields.user_id), UUID(bytes=fields.session_id),
+                                                   fields.issued_at_ms / 1000)
+            results.append(valid)
+        return results
+
+    def claims(self, session_token: Union[str, bytes, memoryview]) -> Optional[SessionClaims]:
+        """
+        Decodes a token whose signature and expiry are valid.
+
+        Neither the credentials version nor revocations are checked: use it to
+        find the user to pass to `authenticate`, which then calls `verify`.
+
+        Args:
+            session_token: The raw token, as text or ASCII bytes.
+
+        Returns:
+            The claims, or None for an invalid or expired token.
+        """
+        fields = self._check(session_token)
+        if fields is None:
+            return None
+        return SessionClaims(user_id=UUID(bytes=fields.user_id), session_id=UUID(bytes=fields.session_id),
+                             credentials_version=fields.credentials_version,
+                             issued_at=fields.issued_at_ms / 1000, expires_at=fields.expires_at,
+                             key_id=fields.key_id.decode("ascii"))
+
+    def expires_at(self, session_token: str) -> Optional[int]:
+        """
+        Reads the expiry written in a token, without verifying it.
+
+        Meant for callers that already verified the token, e.g. to keep a
+        cache entry no longer than the token (`VerifiedTokenCache`).
+
+        Args:
+            session_token: The raw token string.
+
+        Returns:
+            The expiry in epoch seconds, or None for a malformed token.
+        """
+        return codec.expires_at(session_token)
+
+    def revoke(self, user_id: UUID, session_id: UUID) -> bool:
+        """
+        Revokes a single session through the revocation store.
+
+        Ownership is checked against the MAC in the session ID, with every
+        known key. Whether the session still exists cannot be told without
+        its token: any session ID issued to the user (and signed by a key
+        not removed yet) is accepted.
+
+        Args:
+            user_id: The owner of the session.
+            session_id: The ID of the session.
+
+        Returns:
+            True if revoked, False if the session ID was not issued to `user_id`.
+
+        Raises:
+            FeatureNotConfiguredError: Without a revocation store: single
+                sessions cannot be revoked (only all of a user's, through the
+                credentials version).
+        """
+        if self.revocations is None:
+            raise FeatureNotConfiguredError(
+                "Revoking a single session requires a revocation store (HMACSessionService(revocations=...))"
+            )
+        if not self._owns(user_id, session_id):
+            return False
+        # Unknown without the token: keep the entry for a full token lifetime.
+        self.revocations.revoke_session(session_id, self._clock() + self.ttl)
+        return True
+
+    def revoke_all(self, user_id: UUID) -> None:
+        """
+        Revokes every session issued so far to a user, through the revocation store.
+
+        Without a store this is a no-op: the credentials version bumped by AuthKit
+        alongside this call already invalidates the tokens.
+
+        Args:
+            user_id: The user to globally log out.
+        """
+        if self.revocations is not None:
+            now = self._clock()
+            self.revocations.revoke_user(user_id, now, now + self.ttl)
+
+    def _owns(self, user_id: UUID, session_id: UUID) -> bool:
+        """Whether `session_id` was issued to `user_id` by one of the known keys."""
+        raw = session_id.bytes
+        nonce, tag = raw[:_SESSION_NONCE_BYTES], raw[_SESSION_NONCE_BYTES:]
+        return any(hmac.compare_digest(_owner_tag(sign, user_id, nonce), tag) for sign in self._keys.values())
+
+    def _check(self, session_token: Union[str, bytes, memoryview]) -> Optional[codec.TokenFields]:
+        """Returns the fields of an authentic, unexpired token."""
+        fields = codec.decode(session_token, self._keys.get)
+        if fields is None or fields.expires_at <= self._clock():
+            return None
+        return fields
+
+    def __repr__(self) -> str:
+        keys = [kid.decode("ascii") for kid in self._keys]
+        return f"{type(self).__name__}(active_key={self._active!r}, keys={keys}, ttl={self.ttl})"
+
+
+def _owner_tag(sign: Callable[[bytes], bytes], user_id: UUID, nonce: bytes) -> bytes:
+    """The second half of a session ID: a truncated MAC of its owner and nonce."""
+    return sign(_SESSION_ID_DOMAIN + user_id.bytes + nonce)[:16 - _SESSION_NONCE_BYTES]
+
+
+def _signing_key(key_id: str, secret: Union[str, bytes]) -> _SigningKey:
+    if not _KEY_ID.fullmatch(key_id):
+        raise ValueError(f"Invalid key ID: {key_id!r}")
+    if isinstance(secret, str):
+        secret = secret.encode("utf-8")
+    if len(secret) < _MIN_KEY_BYTES:
+        raise ValueError(f"Key {key_id!r} is shorter than {_MIN_KEY_BYTES} bytes")
+    return _SigningKey(secret)
@@ -0,0 +1,365 @@
+"""
+Revocation lists for stateless session tokens.
+"""
+import heapq
+import math
+import threading
+import time
+from typing import Any, Callable, Optional
+from uuid import UUID
+
+from authkit.ports.session_revocation import RevocationChanges
+
+
+class InMemoryRevocationStore:
+    """
+    `SessionRevocationStore` keeping revocations in process memory.
+
+    Entries are dropped once the tokens they concern have expired, so the
+    store only ever holds the revocations of the last token lifetime. Each
+    process keeps its own store: with several workers, feed every store
+    (e.g. from a pub/sub channel) or use a shared implementation.
+    It implements `SyncableRevocationStore`.
+
+    Usage:
+        >>> sessions = HMACSessionService({"k1": secret}, revocations=InMemoryRevocationStore())
+    """
+    # Dictionary lookups only: AsyncAuthKit calls it on the event loop.
+    __authkit_nonblocking__ = True
+
+    def __init__(self, *, clock: Callable[[], float] = time.time):
+        """
+        Args:
+            clock: Returns the current time in epoch seconds.
+        """
+        self._clock = clock
+        self._lock = threading.Lock()
+        # session id -> (expires_at, sequence number)
+        self._sessions: dict[UUID, tuple[float, int]] = {}
+        # user id -> (revoked_at, expires_at, sequence number)
+        self._users: dict[UUID, tuple[float, float, int]] = {}
+        # Numbers the revocations, for `changes`.
+        self._sequence = 0
+        # (expires_at, kind, key), to drop entries in expiry order.
+        self._expiries: list[tuple[float, int, UUID]] = []
+
+    def revoke_session(self, session_id: UUID, expires_at: float) -> None:
+        """
+        Revokes a single session.
+
+        Args:
+            session_id: The ID of the session.
+            expires_at: When the session's token expires (epoch seconds).
+        """
+        with self._lock:
+            self._purge(self._clock())
+            previous = self._sessions.get(session_id)
+            if previous is not None:
+                expires_at = max(expires_at, previous[0])
+            self._sequence += 1
+            self._sessions[session_id] = (expires_at, self._sequence)
+            heapq.heappush(self._expiries, (expires_at, 0, session_id))
+
+    def revoke_user(self, user_id: UUID, revoked_at: float, expires_at: float) -> None:
+        """
+        Revokes every session of a user issued before `revoked_at`.
+
+        Args:
+            user_id: The ID of the user.
+            revoked_at: Sessions issued before this time (epoch seconds) are revoked.
+            expires_at: When the last of those sessions expires (epoch seconds).
+        """
+        with self._lock:
+            self._purge(self._clock())
+            previous = self._users.get(user_id)
+            if previous is not None:
+                revoked_at = max(revoked_at, previous[0])
+                expires_at = max(expires_at, previous[1])
+            self._sequence += 1
+            self._users[user_id] = (revoked_at, expires_at, self._sequence)
+            heapq.heappush(self._expiries, (expires_at, 1, user_id))
+
+    def is_revoked(self, user_id: UUID, session_id: UUID, issued_at: float) -> bool:
+        """
+        Checks a session against the recorded revocations.
+
+        Args:
+            user_id: The owner of the session.
+            session_id: The ID of the session.
+            issued_at: When the session was issued (epoch seconds).
+
+        Returns:
+            True if the session or all the user's sessions of that age were revoked.
+        """
+        if session_id in self._sessions:
+            return True
+        entry = self._users.get(user_id)
+        return entry is not None and issued_at < entry[0]
+
+    def changes(self, cursor: int) -> RevocationChanges:
+        """
+        Lists the live revocations recorded after `cursor`.
+
+        Args:
+            cursor: 0 for every live revocation, else the cursor of the previous call.
+
+        Returns:
+            The newer revocations and the cursor to pass next time.
+        """
+        with self._lock:
+            self._purge(self._clock())
+            return RevocationChanges(
+                cursor=self._sequence,
+                sessions=[(session_id, expires_at)
+                          for session_id, (expires_at, sequence) in self._sessions.items() if sequence > cursor],
+                users=[(user_id, revoked_at, expires_at)
+                       for user_id, (revoked_at, expires_at, sequence) in self._users.items() if sequence > cursor],
+            )
+
+    def __len__(self) -> int:
+        return len(self._sessions) + len(self._users)
+
+    def _purge(self, now: float) -> None:
+        """Drops the entries whose tokens have all expired. Caller holds the lock."""
+        expiries = self._expiries
+        while expiries and expiries[0][0] <= now:
+            _, kind, key = heapq.heappop(expiries)
+            table = self._sessions if kind == 0 else self._users
+            entry = table.get(key)
+            # Skip heap items superseded by a later revocation of the same key.
+            if entry is not None and (entry[0] if kind == 0 else entry[1]) <= now:
+                del table[key]
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(entries={len(self)})"
+
+
+class _BloomGeneration:
+    """One generation of revoked session IDs: a Bloom filter and the latest expiry it covers."""
+    __slots__ = ("bits", "size", "hashes", "started_at", "expires_at", "count")
+
+    def __init__(self, size: int, hashes: int, started_at: float):
+        self.bits = bytearray((size + 7) // 8)
+        self.size = size
+        self.hashes = hashes
+        self.started_at = started_at
+        self.expires_at = 0.0
+        self.count = 0
+
+    def add(self, position: int, step: int, expires_at: float) -> None:
+        bits, size = self.bits, self.size
+        position, step = position % size, step % size
+        for _ in range(self.hashes):
+            bits[position >> 3] |= 1 << (position & 7)
+            position = (position + step) % size
+        self.expires_at = max(self.expires_at, expires_at)
+        self.count += 1
+
+    def __contains__(self, probe: "tuple[int, int]") -> bool:
+        bits, size = self.bits, self.size
+        position, step = probe[0] % size, probe[1] % size
+        for _ in range(self.hashes):
+            if not bits[position >> 3] >> (position & 7) & 1:
+                return False
+            position = (position + step) % size
+        return True
+
+
+class FilteredRevocationStore:
+    """
+    `SessionRevocationStore` answering from memory, backed by an authoritative store.
+
+    Global logouts are kept as per-user revocation epochs: a token issued
+    before its user's epoch is revoked, whatever its session. Single
+    revoked sessions go into an in-memory Bloom filter. `is_revoked` is
+    therefore a dictionary lookup and a few bit probes, and the backend is
+    only asked on a filter hit, to tell a revoked session from a false
+    positive (`fp_rate` of the other tokens). False positives cost a lookup,
+    never a wrong rejection; revoked sessions are never missed.
+
+    Every revocation is written to the backend before the local state.
+    Bloom filters cannot forget, so session IDs are held in two generations:
+    the current one is replaced once it is `rotate_after` seconds old and
+    the previous one's tokens have all expired.
+
+    Each process holds its own filter. When the backend is a
+    `SyncableRevocationStore`, the filter loads its live revocations when
+    created and pulls the new ones at most every `sync_interval` seconds
+    (from `is_revoked`, or explicitly with `sync`): revocations made by other
+    processes are seen within that delay, or at once when passed to
+    `record_session` / `record_user` (e.g. from a pub/sub channel). Other
+    backends cannot be listed, so a filter miss is confirmed with the
+    backend too: correct, but without saving any lookup.
+
+    Backend calls are as blocking as the backend: the filter takes its
+    `__authkit_nonblocking__` flag from it.
+
+    Usage:
+        >>> revocations = FilteredRevocationStore(shared_store, capacity=50_000)
+        >>> sessions = HMACSessionService({"k1": secret}, revocations=revocations)
+    """
+    def __init__(self, backend: Any, *, capacity: int = 10_000, fp_rate: float = 1e-4,
+                 rotate_after: float = 3600.0, sync_interval: float = 1.0,
+                 clock: Callable[[], float] = time.time):
+        """
+        Args:
+            backend: The authoritative `SessionRevocationStore`, shared by every process.
+            capacity: Revoked sessions per generation the filter is sized for;
+                beyond it the false positive rate grows (only costing lookups).
+            fp_rate: Target share of valid tokens confirmed with the backend.
+            rotate_after: Minimum age of a generation before it is replaced
+                (typically the token lifetime).
+            sync_interval: Maximum age (seconds) of the revocations pulled from a
+                `SyncableRevocationStore` backend; 0 pulls on every check.
+            clock: Returns the current time in epoch seconds.
+
+        Raises:
+            ValueError: On a non-positive capacity or rotation age, a negative
+                sync interval, or a rate outside (0, 1).
+        """
+        if capacity < 1 or rotate_after <= 0 or sync_interval < 0 or not 0 < fp_rate < 1:
+            raise ValueError("capacity and rotate_after must be positive, sync_interval non-negative "
+                             "and fp_rate between 0 and 1")
+        self.backend = backend
+        self.rotate_after = rotate_after
+        self.sync_interval = sync_interval
+        # AsyncAuthKit calls non-blocking ports on the event loop: only as safe as the backend.
+        self.__authkit_nonblocking__ = getattr(backend, "__authkit_nonblocking__", False)
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._size = max(64, math.ceil(-capacity * math.log(fp_rate) / math.log(2) ** 2))
+        self._hashes = max(1, round(self._size / capacity * math.log(2)))
+        now = clock()
+        self._current = _BloomGeneration(self._size, self._hashes, now)
+        self._previous = _BloomGeneration(self._size, self._hashes, now)
+        # user id -> (revocation epoch, expiry of the last token it covers)
+        self._epochs: dict[UUID, tuple[float, float]] = {}
+        self._syncable = callable(getattr(backend, "changes", None))
+        self._sync_lock = threading.Lock()
+        self._cursor = 0
+        self._synced_at: Optional[float] = None
+        if self._syncable:
+            self.sync()
+
+    def revoke_session(self, session_id: UUID, expires_at: float) -> None:
+        """
+        Revokes a single session in the backend, then in the filter.
+
+        Args:
+            session_id: The ID of the session.
+            expires_at: When the session's token expires (epoch seconds).
+        """
+        self.backend.revoke_session(session_id, expires_at)
+        self.record_session(session_id, expires_at)
+
+    def revoke_user(self, user_id: UUID, revoked_at: float, expires_at: float) -> None:
+        """
+        Moves a user's revocation epoch forward, in the backend and locally.
+
+        Args:
+            user_id: The ID of the user.
+            revoked_at: Sessions issued before this time (epoch seconds) are revoked.
+            expires_at: When the last of those sessions expires (epoch seconds).
+        """
+        self.backend.revoke_user(user_id, revoked_at, expires_at)
+        self.record_user(user_id, revoked_at, expires_at)
+
+    def record_session(self, session_id: UUID, expires_at: float) -> None:
+        """
+        Adds a session revoked elsewhere to the local filter, without writing to the backend.
+
+        Args:
+            session_id: The ID of the session.
+            expires_at: When the session's token expires (epoch seconds).
+        """
+        position, step = self._probe(session_id)
+        with self._lock:
+            self._rotate(self._clock())
+            self._current.add(position, step, expires_at)
+
+    def record_user(self, user_id: UUID, revoked_at: float, expires_at: float) -> None:
+        """
+        Applies a revocation epoch set elsewhere, without writing to the backend.
+
+        Args:
+            user_id: The ID of the user.
+            revoked_at: Sessions issued before this time (epoch seconds) are revoked.
+            expires_at: When the last of those sessions expires (epoch seconds).
+        """
+        with self._lock:
+            self._rotate(self._clock())
+            previous = self._epochs.get(user_id)
+            if previous is not None:
+                revoked_at = max(revoked_at, previous[0])
+                expires_at = max(expires_at, previous[1])
+            self._epochs[user_id] = (revoked_at, expires_at)
+
+    def sync(self) -> None:
+        """
+        Pulls the revocations recorded in the backend since the last pull.
+
+        Does nothing if the backend cannot be listed, or if another thread is already pulling.
+        """
+        if not self._syncable or not self._sync_lock.acquire(blocking=False):
+            return
+        try:
+            started_at = self._clock()
+            changes = self.backend.changes(self._cursor)
+            if changes.cursor < self._cursor:
+                changes = self.backend.changes(0)
+            for session_id, expires_at in changes.sessions:
+                self.record_session(session_id, expires_at)
+            for user_id, revoked_at, expires_at in changes.users:
+                self.record_user(user_id, revoked_at, expires_at)
+            self._cursor = changes.cursor
+            self._synced_at = started_at
+        finally:
+            self._sync_lock.release()
+
+    def is_revoked(self, user_id: UUID, session_id: UUID, issued_at: float) -> bool:
+        """
+        Checks a session against the epochs and the filter, then the backend on a filter hit.
+
+        Pulls the backend's new revocations first once `sync_interval` has
+        passed; with a backend that cannot be listed, misses are checked
+        with the backend as well.
+
+        Args:
+            user_id: The owner of the session.
+            session_id: The ID of the session.
+            issued_at: When the session was issued (epoch seconds).
+
+        Returns:
+            True if the session or all the user's sessions of that age were revoked.
+        """
+        if self._syncable and (self._synced_at is None
+                               or self._clock() - self._synced_at >= self.sync_interval):
+            self.sync()
+        epoch = self._epochs.get(user_id)
+        if epoch is not None and issued_at < epoch[0]:
+            return True
+        probe = self._probe(session_id)
+        if probe not in self._current and probe not in self._previous and self._syncable:
+            return False
+        return self.backend.is_revoked(user_id, session_id, issued_at)
+
+    @staticmethod
+    def _probe(session_id: UUID) -> "tuple[int, int]":
+        # hash() of bytes is SipHash keyed per process: bit positions cannot be predicted
+        # from session IDs, and filters are never shared between processes.
+        digest = hash(session_id.bytes) & 0xFFFFFFFFFFFFFFFF
+        return digest & 0xFFFFFFFF, digest >> 32 | 1
+
+    def _rotate(self, now: float) -> None:
+        """Replaces the current generation once old enough and the previous one has expired. Caller holds the lock."""
+        if now - self._current.started_at < self.rotate_after or self._previous.expires_at > now:
+            return
+        self._previous = self._current
+        self._current = _BloomGeneration(self._size, self._hashes, now)
+        self._epochs = {user_id: entry for user_id, entry in self._epochs.items() if entry[1] > now}
+
+    def __len__(self) -> int:
+        return self._current.count + self._previous.count + len(self._epochs)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(backend={self.backend!r}, entries={len(self)})"
@@ -0,0 +1,291 @@
+"""
+Server-side session stores with a per-user session index.
+"""
+import heapq
+import threading
+import time
+from typing import Any, Callable, Iterable, Optional, Union
+from uuid import UUID
+
+from authkit.ports.session_store import SessionRecord
+
+
+class InMemorySessionStore:
+    """
+    `SessionStore` keeping sessions in process memory.
+
+    Sessions are kept by ID, with a set of session IDs per user, so removing
+    all of a user's sessions costs one dictionary pop per session. Expired
+    sessions are dropped as new ones are added.
+
+    Usage:
+        >>> sessions = StoredSessionService(InMemorySessionStore(), ttl=3600)
+    """
+    # Dictionary operations only: AsyncAuthKit calls it on the event loop.
+    __authkit_nonblocking__ = True
+
+    def __init__(self, *, clock: Callable[[], float] = time.time):
+        """
+        Args:
+            clock: Returns the current time in epoch seconds.
+        """
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._sessions: dict[UUID, SessionRecord] = {}
+        self._by_user: dict[UUID, set[UUID]] = {}
+        # (expires_at, session_id), to drop sessions in expiry order.
+        self._expiries: list[tuple[int, UUID]] = []
+
+    def add(self, record: SessionRecord) -> None:
+        """
+        Stores a session and adds it to its user's index.
+
+        Args:
+            record: The session to store.
+        """
+        with self._lock:
+            self._purge(self._clock())
+            self._sessions[record.session_id] = record
+            self._by_user.setdefault(record.user_id, set()).add(record.session_id)
+            heapq.heappush(self._expiries, (record.expires_at, record.session_id))
+
+    def get(self, session_id: UUID) -> Optional[SessionRecord]:
+        """
+        Finds a session.
+
+        Args:
+            session_id: The ID of the session.
+
+        Returns:
+            The session, or None if unknown, removed or expired.
+        """
+        record = self._sessions.get(session_id)
+        if record is None or record.expires_at <= self._clock():
+            return None
+        return record
+
+    def get_many(self, session_ids: Iterable[UUID]) -> dict[UUID, SessionRecord]:
+        """
+        Finds several sessions at once.
+
+        Args:
+            session_ids: The IDs of the sessions.
+
+        Returns:
+            The sessions found, by ID; unknown, removed and expired ones are left out.
+        """
+        now = self._clock()
+        sessions = self._sessions
+        found = {}
+        for session_id in session_ids:
+            record = sessions.get(session_id)
+            if record is not None and record.expires_at > now:
+                found[session_id] = record
+        return found
+
+    def remove(self, user_id: UUID, session_id: UUID) -> bool:
+        """
+        Removes a single session of a user.
+
+        Args:
+            user_id: The owner of the session.
+            session_id: The ID of the session.
+
+        Returns:
+            True if the session existed and belonged to the user.
+        """
+        with self._lock:
+            record = self._sessions.get(session_id)
+            if record is None or record.user_id != user_id:
+                return False
+            self._drop(record)
+            return record.expires_at > self._clock()
+
+    def remove_user(self, user_id: UUID) -> int:
+        """
+        Removes every session of a user, through the user's index.
+
+        Args:
+            user_id: The ID of the user.
+
+        Returns:
+            The number of sessions removed.
+        """
+        with self._lock:
+            session_ids = self._by_user.pop(user_id, ())
+            for session_id in session_ids:
+                del self._sessions[session_id]
+            return len(session_ids)
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+    def _drop(self, record: SessionRecord) -> None:
+        """Removes a session and its index entry. Caller holds the lock."""
+        del self._sessions[record.session_id]
+        user_sessions = self._by_user[record.user_id]
+        user_sessions.discard(record.session_id)
+        if not user_sessions:
+            del self._by_user[record.user_id]
+
+    def _purge(self, now: float) -> None:
+        """Drops the expired sessions. Caller holds the lock."""
+        expiries = self._expiries
+        while expiries and expiries[0][0] <= now:
+            expires_at, session_id = heapq.heappop(expiries)
+            record = self._sessions.get(session_id)
+            # Skip heap items of sessions already removed (or re-added with a later expiry).
+            if record is not None and record.expires_at == expires_at:
+                self._drop(record)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(sessions={len(self)}, users={len(self._by_user)})"
+
+
+class RedisSessionStore:
+    """
+    `SessionStore` on Redis (or any server speaking its protocol), with a sorted set per user as index.
+
+    Layout, under `prefix`:
+
+    - `session:<session id hex>`: the record as ASCII text, expiring with the session;
+    - `user_sessions:<user id hex>`: the user's session IDs, scored by their expiry.
+
+    `add` drops the index members whose sessions have expired, so the index
+    only holds the user's live sessions (plus those expiring in between),
+    and only ever extends the index's own expiry (Redis 7 `EXPIREAT NX`/`GT`).
+    `remove_user` reads the live members, then deletes their records and
+    index entries in one transaction: two round trips whatever the size of
+    the keyspace or the user's history, never a `KEYS`/`SCAN`. Members are
+    removed from the index rather than the index deleted, so a session
+    added concurrently stays indexed.
+
+    The client is used through its redis-py style API (`get`, `mget`, `set`,
+    `zadd`, `zrem`, `zrangebyscore`, `pipeline`), with or without
+    `decode_responses`; the store imports no client library itself.
+
+    Usage:
+        >>> store = RedisSessionStore(redis.Redis(...), prefix="myapp:")
+        >>> sessions = StoredSessionService(store, ttl=3600)
+    """
+
+    def __init__(self, client: Any, *, prefix: str = "authkit:", clock: Callable[[], float] = time.time):
+        """
+        Args:
+            client: A redis-py compatible client (sync).
+            prefix: Prepended to every key.
+            clock: Returns the current time in epoch seconds.
+        """
+        self.client = client
+        self.prefix = prefix
+        self._clock = clock
+
+    def add(self, record: SessionRecord) -> None:
+        """
+        Stores a session and adds it to its user's index, in one transaction.
+
+        Also drops the user's expired sessions from the index.
+
+        Args:
+            record: The session to store.
+        """
+        value = (f"{record.user_id.hex}:{record.credentials_version}:"
+                 f"{record.expires_at}:{record.token_digest.hex()}")
+        index = self._index_key(record.user_id)
+        pipe = self.client.pipeline(transaction=True)
+        pipe.set(self._session_key(record.session_id), value, exat=record.expires_at)
+        pipe.zadd(index, {record.session_id.hex: record.expires_at})
+        pipe.zremrangebyscore(index, "-inf", self._clock())
+        # Set the index's expiry if it has none, else only extend it: sessions may have different lifetimes.
+        pipe.expireat(index, record.expires_at, nx=True)
+        pipe.expireat(index, record.expires_at, gt=True)
+        pipe.execute()
+
+    def get(self, session_id: UUID) -> Optional[SessionRecord]:
+        """
+        Finds a session.
+
+        Args:
+            session_id: The ID of the session.
+
+        Returns:
+            The session, or None if unknown, removed or expired.
+        """
+        value = self.client.get(self._session_key(session_id))
+        return None if value is None else _record(session_id, value)
+
+    def get_many(self, session_ids: Iterable[UUID]) -> dict[UUID, SessionRecord]:
+        """
+        Finds several sessions with a single `MGET`.
+
+        Args:
+            session_ids: The IDs of the sessions.
+
+        Returns:
+            The sessions found, by ID; unknown, removed and expired ones are left out.
+        """
+        session_ids = list(dict.fromkeys(session_ids))
+        if not session_ids:
+            return {}
+        values = self.client.mget([self._session_key(session_id) for session_id in session_ids])
+        return {session_id: _record(session_id, value)
+                for session_id, value in zip(session_ids, values) if value is not None}
+
+    def remove(self, user_id: UUID, session_id: UUID) -> bool:
+        """
+        Removes a single session of a user.
+
+        Membership in the user's index is the ownership check: another
+        user's session ID is not in it, and nothing is deleted.
+
+        Args:
+            user_id: The owner of the session.
+            session_id: The ID of the session.
+
+        Returns:
+            True if the session existed and belonged to the user.
+        """
+        if not self.client.zrem(self._index_key(user_id), session_id.hex):
+            return False
+        return bool(self.client.delete(self._session_key(session_id)))
+
+    def remove_user(self, user_id: UUID) -> int:
+        """
+        Removes every session of a user: one read of the index's live members, then one transaction.
+
+        Args:
+            user_id: The ID of the user.
+
+        Returns:
+            The number of sessions removed (expired ones not counted).
+        """
+        index = self._index_key(user_id)
+        members = [_text(member) for member in self.client.zrangebyscore(index, f"({self._clock()}", "+inf")]
+        if not members:
+            return 0
+        pipe = self.client.pipeline(transaction=True)
+        pipe.delete(*(f"{self.prefix}session:{member}" for member in members))
+        pipe.zrem(index, *members)
+        deleted, _ = pipe.execute()
+        return int(deleted)
+
+    def _session_key(self, session_id: UUID) -> str:
+        return f"{self.prefix}session:{session_id.hex}"
+
+    def _index_key(self, user_id: UUID) -> str:
+        return f"{self.prefix}user_sessions:{user_id.hex}"
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(prefix={self.prefix!r})"
+
+
+def _record(session_id: UUID, value: Union[str, bytes]) -> SessionRecord:
+    user_hex, version, expires_at, digest_hex = _text(value).split(":")
+    return SessionRecord(session_id=session_id, user_id=UUID(hex=user_hex),
+                         credentials_version=int(version), token_digest=bytes.fromhex(digest_hex),
+                         expires_at=int(expires_at))
+
+
+def _text(value: Union[str, bytes]) -> str:
+    # Clients return bytes unless created with decode_responses=True.
+    return value.decode("ascii") if isinstance(value, bytes) else value
@@ -0,0 +1,194 @@
+"""
+Opaque session tokens backed by a server-side session store.
+"""
+import base64
+import hashlib
+import hmac
+import os
+import re
+import struct
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Optional, Sequence
+from uuid import UUID, uuid4
+
+from authkit.ports.session_store import SessionRecord
+
+_SECRET_BYTES = 16
+# session id, expiry (epoch seconds), secret
+_TOKEN = struct.Struct(f"<16sI{_SECRET_BYTES}s")
+# 36 bytes encode to 48 characters without padding: each token has exactly one spelling.
+_TOKEN_TEXT = re.compile(r"[A-Za-z0-9_-]{48}")
+
+
+@dataclass(frozen=True)
+class StoredSession:
+    """
+    `AuthSession` issued by `StoredSessionService`.
+
+    Attributes:
+        session_id: The ID of the session.
+        session_token: The opaque token to hand to the client.
+        user_id: The owner of the session.
+        credentials_version: The user's credentials version the session is tied to.
+        expires_at: When the session expires (epoch seconds).
+    """
+    session_id: UUID
+    session_token: str
+    user_id: UUID
+    credentials_version: int
+    expires_at: int
+
+
+class StoredSessionService:
+    """
+    `AuthSessionService` keeping every session in a `SessionStore`.
+
+    A token is the session ID, its expiry and a random secret, URL-safe
+    base64 encoded (48 characters). The store only keeps a SHA-256 of the secret,
+    so a leaked store does not yield usable tokens. `verify` costs one store
+    lookup; `revoke` and `revoke_all` take effect immediately, and
+    `revoke_all` only touches the user's own sessions through the store's
+    per-user index.
+
+    Usage:
+        >>> sessions = StoredSessionService(RedisSessionStore(redis_client), ttl=3600)
+        >>> auth = AuthKit(session_service=sessions, ...)
+    """
+
+    def __init__(self, store: Any, *, ttl: int = 3600, clock: Callable[[], float] = time.time):
+        """
+        Args:
+            store: The `SessionStore` holding the sessions.
+            ttl: Lifetime of the sessions in seconds.
+            clock: Returns the current time in epoch seconds.
+
+        Raises:
+            ValueError: On a non-positive `ttl`.
+        """
+        if ttl <= 0:
+            raise ValueError("ttl must be positive")
+        self.store = store
+        self.ttl = int(ttl)
+        self._clock = clock
+        # Inline under AsyncAuthKit only if the store does not block either.
+        self.__authkit_nonblocking__ = getattr(store, "__authkit_nonblocking__", False)
+
+    def issue(self, user_id: UUID, creds_version: int) -> StoredSession:
+        """
+        Creates a session in the store.
+
+        Args:
+            user_id: The ID of the user.
+            creds_version: The user's current credentials version.
+
+        Returns:
+            The session, with its token.
+        """
+        session_id = uuid4()
+        secret = os.urandom(_SECRET_BYTES)
+        expires_at = int(self._clock()) + self.ttl
+        self.store.add(SessionRecord(session_id=session_id, user_id=user_id,
+                                     credentials_version=int(creds_version),
+                                     token_digest=hashlib.sha256(secret).digest(), expires_at=expires_at))
+        token = base64.urlsafe_b64encode(_TOKEN.pack(session_id.bytes, expires_at, secret)).decode("ascii")
+        return StoredSession(session_id=session_id, session_token=token, user_id=user_id,
+                             credentials_version=int(creds_version), expires_at=expires_at)
+
+    def verify(self, session_token: str, creds_version: int, user_id: UUID) -> bool:
+        """
+        Validates a token against its stored session.
+
+        Args:
+            session_token: The raw token string.
+            creds_version: The current credentials version of the user.
+            user_id: The user the token must have been issued to.
+
+        Returns:
+            True if valid, False if unknown, expired, revoked, forged, obsolete or another user's.
+        """
+        parsed = _parse(session_token)
+        if parsed is None:
+            return False
+        return _accepts(self.store.get(parsed[0]), parsed, creds_version, user_id, self._clock())
+
+    def verify_many(self, items: Sequence[tuple[str, int, UUID]]) -> list[bool]:
+        """
+        Validates a batch of tokens with a single store lookup (`SessionStore.get_many`).
+
+        Args:
+            items: `(session_token, creds_version, user_id)` triples.
+
+        Returns:
+            One result per item, in order, as `verify` would return it.
+        """
+        parsed = [_parse(session_token) for session_token, _, _ in items]
+        records = self.store.get_many({token[0] for token in parsed if token is not None})
+        now = self._clock()
+        return [token is not None and _accepts(records.get(token[0]), token, creds_version, user_id, now)
+                for token, (_, creds_version, user_id) in zip(parsed, items)]
+
+    def expires_at(self, session_token: str) -> Optional[int]:
+        """
+        Reads the expiry written in a token, without a store lookup.
+
+        The value is only trustworthy once `verify` accepted the token (it
+        checks it against the stored session), e.g. to keep a cache entry no
+        longer than the token (`VerifiedTokenCache`).
+
+        Args:
+            session_token: The raw token string.
+
+        Returns:
+            The expiry in epoch seconds, or None for a malformed token.
+        """
+        parsed = _parse(session_token)
+        return None if parsed is None else parsed[1]
+
+    def revoke(self, user_id: UUID, session_id: UUID) -> bool:
+        """
+        Removes a session from the store.
+
+        Args:
+            user_id: The owner of the session.
+            session_id: The ID of the session.
+
+        Returns:
+            True if revoked, False if unknown or owned by another user.
+        """
+        return self.store.remove(user_id, session_id)
+
+    def revoke_all(self, user_id: UUID) -> None:
+        """
+        Removes every session of a user, through the store's per-user index.
+
+        Args:
+            user_id: The user to globally log out.
+        """
+        self.store.remove_user(user_id)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(store={self.store!r}, ttl={self.ttl})"
+
+
+def _accepts(record: Optional[SessionRecord], token: tuple[UUID, int, bytes], creds_version: int,
+             user_id: UUID, now: float) -> bool:
+    """Checks a parsed token against its stored session, which must belong to `user_id`."""
+    _, expires_at, secret = token
+    if record is None or record.expires_at != expires_at or expires_at <= now:
+        return False
+    if not hmac.compare_digest(hashlib.sha256(secret).digest(), record.token_digest):
+        return False
+    return record.credentials_version == creds_version and record.user_id == user_id
+
+
+def _parse(session_token: str) -> Optional[tuple[UUID, int, bytes]]:
+    """Splits a token into its session ID, expiry and secret, None if malformed."""
+    # The decoder maps '+' and '/' to '-' and '_', and skips characters outside the
+    # alphabet: only the exact URL-safe spelling is accepted, so that one session
+    # has one token text (the `VerifiedTokenCache` keys, denylists and logs rely on it).
+    if not isinstance(session_token, str) or not _TOKEN_TEXT.fullmatch(session_token):
+        return None
+    raw = base64.urlsafe_b64decode(session_token)
+    session_id, expires_at, secret = _TOKEN.unpack(raw)
+    return UUID(bytes=session_id), expires_at, secret
@@ -1,4 +1,4 @@
-from .registry import Registry
+from .registry import Registry, AsyncRegistry
 from .resolver import Resolver
 
 
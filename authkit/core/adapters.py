@@ -1,18 +1,63 @@
-from authkit.ports import UserRepository, AuthSessionService, PasswordManager, UserIDIntentStore, RegistrationIntentStore
-from authkit.ports.user_repo_cqrs import UserReaderRepository, UserWriterRepository
+import threading
+from typing import Any, Callable, Generic, TypeVar, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from authkit.ports import UserRepository, AuthSessionService, PasswordManager, UserIDIntentStore, RegistrationIntentStore
+    from authkit.ports.user_repo_cqrs import UserReaderRepository, UserWriterRepository
+
+T = TypeVar("T")
+
+_UNSET = object()
+
+
+class Provider(Generic[T]):
+    """
+    Lazy, memoized adapter factory.
+
+    Wrap a zero-argument callable in a `Provider` to defer building an adapter
+    until a use case that actually needs it is resolved. The factory is invoked
+    at most once per `Provider` object; every `AuthAdapters` (and every scope)
+    holding the same `Provider` shares the built value.
+
+    Usage:
+        >>> auth = AuthKit(
+        ...     otp_store=Provider(lambda: RedisOTPStore(redis_client)),
+        ...     ...
+        ... )
+        >>> auth.login.execute(...)  # RedisOTPStore is never constructed
+    """
+    __slots__ = ("_factory", "_value", "_lock")
+
+    def __init__(self, factory: Callable[[], T]):
+        self._factory = factory
+        self._value: Any = _UNSET
+        self._lock = threading.Lock()
+
+    def get(self) -> T:
+        """Returns the adapter, building it on first call."""
+        value = self._value
+        if value is _UNSET:
+            with self._lock:
+                value = self._value
+                if value is _UNSET:
+                    value = self._value = self._factory()
+        return value
 
 
 class AuthAdapters:
     """
     Dependency Injection container for AuthKit adapters.
-    
+
     This class holds the concrete implementations of the abstract ports required by AuthKit.
     It supports two modes of operation for User Persistence:
-    
+
     1. **Unified (Simple)**: specificy `user_repo`. The Facade will automatically set
        `user_reader` and `user_writer` to this same object.
     2. **CQRS (Advanced)**: specify `user_reader` and `user_writer` separately.
-    
+
+    Any adapter may be given as a `Provider`; it is only built when first read,
+    i.e. when a use case depending on it is resolved.
+
     Attributes:
         session_service: Service for issuing and verifying tokens (e.g. JWT, Database).
         password_manager: Service for hashing and verifying passwords.
@@ -24,46 +69,102 @@ class AuthAdapters:
         intent_store: (Optional) For storing Login/Recovery intents.
         registration_intent_store: (Optional) For storing Registration intents.
     """
-    session_service: AuthSessionService
-    password_manager: PasswordManager
-    
-    user_repo: UserRepository | None = None
-    
-    user_reader: UserReaderRepository | None = None
-    user_writer: UserWriterRepository | None = None
-    
-    intent_store: UserIDIntentStore | None = None
-    registration_intent_store: RegistrationIntentStore | None = None
+    session_service: "AuthSessionService"
+    password_manager: "PasswordManager"
+
+    # NOTE: No class-level defaults: an adapter held by a Provider must be
+    # absent from the instance so that __getattr__ can build it on demand.
+    user_repo: "UserRepository | None"
+
+    user_reader: "UserReaderRepository | None"
+    user_writer: "UserWriterRepository | None"
+
+    intent_store: "UserIDIntentStore | None"
+    registration_intent_store: "RegistrationIntentStore | None"
 
     # Allow dynamic extension via keyword arguments
     def __init__(self, session_service=None, password_manager=None, **kwargs):
-        self.session_service = session_service
-        self.password_manager = password_manager
-        
+        # Adapters deferred behind a Provider, keyed by attribute name.
+        self._providers: dict[str, Provider] = {}
+
+        self._assign('session_service', session_service)
+        self._assign('password_manager', password_manager)
+
         # Set optional known fields
-        self.user_repo = kwargs.pop('user_repo', None)
-        self.user_reader = kwargs.pop('user_reader', None)
-        self.user_writer = kwargs.pop('user_writer', None)
-        self.otp_store = kwargs.pop('otp_store', None)
-        self.otp_manager = kwargs.pop('otp_manager', None)
-        self.intent_store = kwargs.pop('intent_store', None)
-        self.registration_intent_store = kwargs.pop('registration_intent_store', None)
-        
+        for key in ('user_repo', 'user_reader', 'user_writer', 'otp_store', 'otp_manager',
+                    'intent_store', 'registration_intent_store'):
+            self._assign(key, kwargs.pop(key, None))
+
         # Set any other custom dependencies (Extensions)
         for key, value in kwargs.items():
-            setattr(self, key, value)
-            
+            self._assign(key, value)
+
         # Run validation
         self.__post_init__()
 
     def __post_init__(self):
-        if self.user_repo:
-            if (self.user_reader is not None and self.user_reader is not self.user_repo) or \
-               (self.user_writer is not None and self.user_writer is not self.user_repo):
+        # Work on the raw values so that validation never triggers a Provider.
+        user_repo = self._peek('user_repo')
+        if user_repo is not None:
+            user_reader = self._peek('user_reader')
+            user_writer = self._peek('user_writer')
+            if (user_reader is not None and user_reader is not user_repo) or \
+               (user_writer is not None and user_writer is not user_repo):
                 raise ValueError("Ambiguous configuration: Cannot provide 'user_repo' AND 'user_reader'/'user_writer'. Choose one mode.")
-            
-            self.user_reader = self.user_repo
-            self.user_writer = self.user_repo
-        
-        # NOTE: We allow partial adapters now (e.g. for Factory usage), so we don't strictly enforce 
+
+            self._assign('user_reader', user_repo)
+            self._assign('user_writer', user_repo)
+
+        # NOTE: We allow partial adapters now (e.g. for Factory usage), so we don't strictly enforce
         # repo presence here. Missing repos will fail when Use Case is executed via MissingDependencyProxy.
+
+    def __getattr__(self, name: str) -> Any:
+        # Only reached for attributes that are not set, i.e. adapters still held by a Provider.
+        providers = self.__dict__.get('_providers')
+        provider = providers.get(name) if providers else None
+        if provider is None:
+            raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+        value = provider.get()
+        # Cache on the instance so later reads are plain attribute lookups.
+        self.__dict__[name] = value
+        return value
+
+    def replace(self, **updates: Any) -> "AuthAdapters":
+        """
+        Returns a copy of these adapters with `updates` applied.
+
+        The copy shares every adapter (and Provider) that is not updated, so it is
+        cheap enough to build per request. The original instance is left untouched.
+        """
+        clone = object.__new__(type(self))
+        clone.__dict__.update(self.__dict__)
+        clone._providers = dict(self._providers)
+
+        # If user_repo is updated, we must clear inferred reader/writer
+        # to avoid "Ambiguous configuration" error in __post_init__.
+        if 'user_repo' in updates:
+            if 'user_reader' not in updates:
+                clone._assign('user_reader', None)
+            if 'user_writer' not in updates:
+                clone._assign('user_writer', None)
+
+        for key, value in updates.items():
+            clone._assign(key, value)
+
+        clone.__post_init__()
+        return clone
+
+    def _assign(self, name: str, value: Any) -> None:
+        if isinstance(value, Provider):
+            self._providers[name] = value
+            self.__dict__.pop(name, None)
+        else:
+            self._providers.pop(name, None)
+            self.__dict__[name] = value
+
+    def _peek(self, name: str) -> Any:
+        """Returns the configured value (or its Provider) without building anything."""
+        provider = self._providers.get(name)
+        if provider is not None:
+            return provider
+        return self.__dict__.get(name)
@@ -0,0 +1,72 @@
+from authkit.core import AsyncRegistry
+from .authkit import AuthKit, _Snapshot
+from .bridge import PortBridges
+from typing import Any, Callable, Optional
+
+
+class AsyncAuthKit(AuthKit):
+    """
+    The asyncio flavour of the AuthKit facade.
+
+    Exposes the same use cases as `AuthKit`, but every `execute()` is a coroutine,
+    so an ASGI application never blocks its event loop on a repository or
+    session store round trip.
+
+    Adapters may implement the async ports (`authkit.ports.aio`) or the regular
+    sync ports. Sync adapters are bridged automatically: their methods run in a
+    bounded thread pool per port (see `PortBridges`), or inline for adapters
+    marked `__authkit_nonblocking__ = True`.
+
+    Independent port calls of a use case are awaited concurrently, e.g. issuing
+    the session while recording the login, so a flow takes about as long as
+    its slowest step rather than the sum of them. Calls on the same port, and
+    any write that depends on a verification, still run in order.
+
+    Usage:
+        >>> auth = AsyncAuthKit(
+        ...     user_repo=AsyncpgUserRepo(pool),       # native async
+        ...     password_manager=BcryptPasswordManager(), # sync, runs in a thread pool
+        ...     session_service=my_session_service,
+        ... )
+        >>> session = await auth.login.execute(identifier, password)
+        ...
+        >>> auth.close()  # on application shutdown
+    """
+    _registry = AsyncRegistry
+
+    def __init__(self, *, bridge_workers: int = 4, concurrent_steps: bool = True, **kwargs: Any):
+        """
+        Initialize the AsyncAuthKit facade.
+
+        Args:
+            bridge_workers: Size of the thread pool used for each port served by
+                a sync adapter.
+            concurrent_steps: Whether use cases overlap their independent port calls.
+                Disable it when several adapters share a connection or session that
+                does not support concurrent use (e.g. one SQLAlchemy `AsyncSession`).
+            **kwargs: The same adapters and options as `AuthKit`.
+
+        Raises:
+            ValueError: If `bridge_workers` is lower than 1, or `features` names
+                a use case that is not registered.
+        """
+        # Shared with every scope() of this instance, so the pools stay bounded.
+        self._bridges = PortBridges(max_workers=bridge_workers)
+        super().__init__(**kwargs)
+        if not concurrent_steps:
+            # A plain value: injected as is into every use case taking `concurrent_steps`.
+            self._snapshot = _Snapshot(self._adapters.replace(concurrent_steps=False))
+
+    def close(self, wait: bool = True) -> None:
+        """
+        Shuts down the thread pools of the sync adapter bridges.
+
+        Call it once on application shutdown; scopes share the pools of their parent.
+
+        Args:
+            wait: Whether to block until in-flight calls have finished.
+        """
+        self._bridges.shutdown(wait=wait)
+
+    def _port_wrapper(self) -> Optional[Callable[[str, Any], Any]]:
+        return self._bridges.wrap
@@ -0,0 +1,69 @@
+from typing import Any, Iterable, Optional, Union
+from authkit.core.adapters import AuthAdapters
+from authkit.core.interceptors import Interceptor
+from authkit.core.authkit import AuthKit
+from authkit.ports import (
+    UserRepository, UserReaderRepository, UserWriterRepository,
+    PasswordManager, PasswordRehasher, CredentialMemo, SpeculativeHasher, PasswordScreener, AuthSessionService,
+    OTPStore, OTPManager,
+    RegistrationIntentStore, UserIDIntentStore
+)
+from authkit.ports.aio import (
+    AsyncUserRepository, AsyncUserReaderRepository, AsyncUserWriterRepository,
+    AsyncPasswordManager, AsyncPasswordRehasher, AsyncCredentialMemo, AsyncSpeculativeHasher, AsyncPasswordScreener, AsyncAuthSessionService,
+    AsyncOTPStore, AsyncOTPManager,
+    AsyncRegistrationIntentStore, AsyncUserIDIntentStore
+)
+import authkit.usecases.aio
+
+class AsyncAuthKit(AuthKit):
+    """
+    The asyncio flavour of the AuthKit facade.
+    """
+    authenticate: authkit.usecases.aio.AsyncAuthenticateUseCase  # type: ignore[assignment]
+    authenticate_many: authkit.usecases.aio.AsyncAuthenticateManyUseCase  # type: ignore[assignment]
+    login: authkit.usecases.aio.AsyncLoginUseCase  # type: ignore[assignment]
+    register: authkit.usecases.aio.AsyncRegistrationUseCase  # type: ignore[assignment]
+    logout: authkit.usecases.aio.AsyncLogoutUseCase  # type: ignore[assignment]
+    logout_all: authkit.usecases.aio.AsyncLogoutAllUseCase  # type: ignore[assignment]
+    change_password: authkit.usecases.aio.AsyncChangePasswordUseCase  # type: ignore[assignment]
+    delete_account: authkit.usecases.aio.AsyncDeleteAccountUseCase  # type: ignore[assignment]
+    forget_password_start: authkit.usecases.aio.AsyncStartForgetPasswordUseCase  # type: ignore[assignment]
+    forget_password_verify: authkit.usecases.aio.AsyncVerifyForgetPasswordUseCase  # type: ignore[assignment]
+    login_otp_start: authkit.usecases.aio.AsyncStartLoginWithOTPUseCase  # type: ignore[assignment]
+    login_otp_verify: authkit.usecases.aio.AsyncVerifyLoginWithOTPUseCase  # type: ignore[assignment]
+    register_otp_start: authkit.usecases.aio.AsyncStartRegistrationWithOTPUseCase  # type: ignore[assignment]
+    register_otp_verify: authkit.usecases.aio.AsyncVerifyRegistrationWithOTPUseCase  # type: ignore[assignment]
+    logout_all_otp_start: authkit.usecases.aio.AsyncStartLogoutAllWithOTPUseCase  # type: ignore[assignment]
+    logout_all_otp_verify: authkit.usecases.aio.AsyncVerifyLogoutAllWithOTPUseCase  # type: ignore[assignment]
+    delete_account_otp_start: authkit.usecases.aio.AsyncStartDeleteAccountWithOTPUseCase  # type: ignore[assignment]
+    delete_account_otp_verify: authkit.usecases.aio.AsyncVerifyDeleteAccountWithOTPUseCase  # type: ignore[assignment]
+
+    def __init__(
+        self,
+        *,
+        bridge_workers: int = 4,
+        concurrent_steps: bool = True,
+        user_repo: Optional[Union[AsyncUserRepository, UserRepository]] = None,
+        user_reader: Optional[Union[AsyncUserReaderRepository, UserReaderRepository]] = None,
+        user_writer: Optional[Union[AsyncUserWriterRepository, UserWriterRepository]] = None,
+        password_manager: Optional[Union[AsyncPasswordManager, PasswordManager]] = None,
+        session_service: Optional[Union[AsyncAuthSessionService, AuthSessionService]] = None,
+        otp_store: Optional[Union[AsyncOTPStore, OTPStore]] = None,
+        otp_manager: Optional[Union[AsyncOTPManager, OTPManager]] = None,
+        registration_intent_store: Optional[Union[AsyncRegistrationIntentStore, RegistrationIntentStore]] = None,
+        intent_store: Optional[Union[AsyncUserIDIntentStore, UserIDIntentStore]] = None,
+        password_rehasher: Optional[Union[AsyncPasswordRehasher, PasswordRehasher]] = None,
+        credential_memo: Optional[Union[AsyncCredentialMemo, CredentialMemo]] = None,
+        speculative_hasher: Optional[Union[AsyncSpeculativeHasher, SpeculativeHasher]] = None,
+        password_screener: Optional[Union[AsyncPasswordScreener, PasswordScreener]] = None,
+        adapters: Optional[AuthAdapters] = None,
+        features: Optional[Iterable[str]] = None,
+        interceptors: Optional[Iterable[Interceptor]] = None,
+    ) -> None: ...
+
+    def scope(self, **overrides: Any) -> "AsyncAuthKit": ...
+
+    def warmup(self, *, freeze: bool = False) -> "AsyncAuthKit": ...
+
+    def close(self, wait: bool = True) -> None: ...
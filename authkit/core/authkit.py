@@ -1,24 +1,42 @@
 from authkit.core import Registry, Resolver
-import authkit.usecases # Trigger registration
 from .adapters import AuthAdapters
-from authkit.ports import (
-    UserRepository, UserReaderRepository, UserWriterRepository,
-    PasswordManager, AuthSessionService,
-    OTPStore, OTPManager,
-    RegistrationIntentStore, UserIDIntentStore
-)
-from typing import TYPE_CHECKING, Optional
+import threading
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Optional
 
 if TYPE_CHECKING:
     import authkit.usecases
+    from .interceptors import Interceptor, InterceptorChain
+    from authkit.ports import (
+        UserRepository, UserReaderRepository, UserWriterRepository,
+        PasswordManager, PasswordRehasher, CredentialMemo, SpeculativeHasher, PasswordScreener, AuthSessionService,
+        OTPStore, OTPManager,
+        RegistrationIntentStore, UserIDIntentStore
+    )
+
+
+class _Snapshot:
+    """
+    The adapters of an AuthKit instance together with the use cases resolved from them.
+
+    A snapshot's adapters never change: `configure()` builds a new snapshot and
+    publishes it with a single reference swap, so readers never observe a mix
+    of old and new adapters and never need a lock. The use case cache only
+    ever grows and always matches the snapshot's adapters.
+    """
+    __slots__ = ("adapters", "use_cases")
+
+    def __init__(self, adapters: AuthAdapters):
+        self.adapters = adapters
+        self.use_cases: dict[str, Any] = {}
 
 
 class AuthKit:
     """
     The main entry point for the AuthKit library.
 
-    This Facade initializes all Use Cases with the provided adapters,
-    exposing them as easily accessible properties.
+    This Facade exposes all registered Use Cases as easily accessible properties.
+    Each Use Case is built from the provided adapters the first time it is accessed,
+    so construction cost does not grow with the number of registered Use Cases.
 
     Usage (Unified Repository - Standard):
         >>> adapters = AuthAdapters(
@@ -38,30 +56,48 @@ class AuthKit:
         ... )
         >>> auth = AuthKit(adapters)
     """
+    # Where use cases are looked up by name (see AsyncAuthKit for the async flavour).
+    _registry: type[Registry] = Registry
+
     def __init__(
         self,
         # Make everything keyword-only for clarity and safety
         *,
         # Standard Repos
-        user_repo: Optional[UserRepository] = None,
+        user_repo: Optional["UserRepository"] = None,
         # CQRS Repos (Alternative to user_repo)
-        user_reader: Optional[UserReaderRepository] = None,
-        user_writer: Optional[UserWriterRepository] = None,
+        user_reader: Optional["UserReaderRepository"] = None,
+        user_writer: Optional["UserWriterRepository"] = None,
         
         # Core Services
-        password_manager: Optional[PasswordManager] = None,
-        session_service: Optional[AuthSessionService] = None,
+        password_manager: Optional["PasswordManager"] = None,
+        session_service: Optional["AuthSessionService"] = None,
         
         # OTP Services
-        otp_store: Optional[OTPStore] = None,
-        otp_manager: Optional[OTPManager] = None,
+        otp_store: Optional["OTPStore"] = None,
+        otp_manager: Optional["OTPManager"] = None,
         
         # Intent Stores
-        registration_intent_store: Optional[RegistrationIntentStore] = None,
-        intent_store: Optional[UserIDIntentStore] = None,
+        registration_intent_store: Optional["RegistrationIntentStore"] = None,
+        intent_store: Optional["UserIDIntentStore"] = None,
+
+        # Optional: Upgrades outdated password hashes after logins
+        password_rehasher: Optional["PasswordRehasher"] = None,
+        # Optional: Remembers recent verifications for repeated logins
+        credential_memo: Optional["CredentialMemo"] = None,
+        # Optional: Hashes registration passwords in the background
+        speculative_hasher: Optional["SpeculativeHasher"] = None,
+        # Optional: Rejects new passwords known from data breaches
+        password_screener: Optional["PasswordScreener"] = None,
         
         # Advanced: Pre-built adapters (Optional)
         adapters: Optional[AuthAdapters] = None,
+
+        # Advanced: Restrict the facade to these use cases (Optional)
+        features: Optional[Iterable[str]] = None,
+
+        # Advanced: Middleware around use cases and ports (Optional)
+        interceptors: Optional[Iterable["Interceptor"]] = None,
     ):
         """
         Initialize the AuthKit facade with explicit dependency injections.
@@ -76,7 +112,23 @@ class AuthKit:
             otp_manager: Service for generating/validating OTPs.
             registration_intent_store: Storage for pending registrations.
             intent_store: Storage for user ID intents (e.g. forgot password).
+            password_rehasher: Re-hashes passwords whose stored hash is out of date
+                after successful logins (e.g. `BackgroundPasswordRehasher`).
+            credential_memo: Answers repeated logins with the same credentials without
+                hashing (e.g. `VerifiedCredentialMemo`).
+            speculative_hasher: Lets `register_otp_start` send the OTP while the password
+                is hashed in the background (e.g. `SpeculativePasswordHasher`).
+            password_screener: Rejects passwords known from data breaches when they are set
+                (e.g. `BloomFilterPasswordScreener`).
             adapters: Pre-built AuthAdapters instance (Advanced).
+            features: Names of the use cases this instance exposes, e.g.
+                `["login", "logout", "authenticate"]` (Advanced). Other use cases are
+                never imported or resolved by this instance. Defaults to all registered.
+            interceptors: `Interceptor`s wrapping every `execute()` and port call of
+                the resolved use cases, outermost first (Advanced).
+
+        Raises:
+            ValueError: If `features` names a use case that is not registered.
         """
         if adapters:
              # Legacy/Advanced mode support
@@ -92,7 +144,11 @@ class AuthKit:
                 'otp_store': otp_store,
                 'otp_manager': otp_manager,
                 'registration_intent_store': registration_intent_store,
-                'intent_store': intent_store
+                'intent_store': intent_store,
+                'password_rehasher': password_rehasher,
+                'credential_memo': credential_memo,
+                'speculative_hasher': speculative_hasher,
+                'password_screener': password_screener,
             }
             # Remove None values so we don't overwrite defaults
             explicit_deps = {k: v for k, v in explicit_deps.items() if v is not None}
@@ -103,10 +159,29 @@ class AuthKit:
             # Allow empty init (Partial/Template pattern)
             adapters = AuthAdapters(**final_kwargs)
             
-        self._adapters = adapters
+        if features is not None:
+            features = frozenset(features)
+            unknown = features - self._registry.names()
+            if unknown:
+                raise ValueError(f"Unknown feature(s): {', '.join(sorted(unknown))}")
+        # Use cases this instance may resolve (None means every registered one).
+        self._features: Optional[frozenset[str]] = features
+
+        # Composed into each use case when it is resolved; None keeps calls untouched.
+        self._interceptors: Optional["InterceptorChain"] = None
+        if interceptors:
+            from .interceptors import InterceptorChain
+            self._interceptors = InterceptorChain(interceptors)
+
+        # Adapters and resolved use cases, replaced as a whole by configure().
+        self._snapshot = _Snapshot(adapters)
+        # Serializes writers only; readers go through the current snapshot lock-free.
+        self._configure_lock = threading.Lock()
         
         # Explicit type hints for core use cases (for IDE autocomplete)
-        # These are dynamically populated by the Registry loop below.
+        # These are resolved lazily on first access (see __getattr__).
+        self.authenticate: 'authkit.usecases.AuthenticateUseCase'
+        self.authenticate_many: 'authkit.usecases.AuthenticateManyUseCase'
         self.login: 'authkit.usecases.LoginUseCase'
         self.register: 'authkit.usecases.RegistrationUseCase'
         self.logout: 'authkit.usecases.LogoutUseCase'
@@ -123,28 +198,34 @@ class AuthKit:
         self.logout_all_otp_verify: 'authkit.usecases.VerifyLogoutAllWithOTPUseCase'
         self.delete_account_otp_start: 'authkit.usecases.StartDeleteAccountWithOTPUseCase'
         self.delete_account_otp_verify: 'authkit.usecases.VerifyDeleteAccountWithOTPUseCase'
-        
-        # Dynamically instantiate all registered use cases
-        self._rebind_use_cases()
 
     def configure(
         self, 
         # Repeating explicit args for DX
-        user_repo: Optional[UserRepository] = None,
-        user_reader: Optional[UserReaderRepository] = None,
-        user_writer: Optional[UserWriterRepository] = None,
-        password_manager: Optional[PasswordManager] = None,
-        session_service: Optional[AuthSessionService] = None,
-        otp_store: Optional[OTPStore] = None,
-        otp_manager: Optional[OTPManager] = None,
-        registration_intent_store: Optional[RegistrationIntentStore] = None,
-        intent_store: Optional[UserIDIntentStore] = None,
+        user_repo: Optional["UserRepository"] = None,
+        user_reader: Optional["UserReaderRepository"] = None,
+        user_writer: Optional["UserWriterRepository"] = None,
+        password_manager: Optional["PasswordManager"] = None,
+        session_service: Optional["AuthSessionService"] = None,
+        otp_store: Optional["OTPStore"] = None,
+        otp_manager: Optional["OTPManager"] = None,
+        registration_intent_store: Optional["RegistrationIntentStore"] = None,
+        intent_store: Optional["UserIDIntentStore"] = None,
+        password_rehasher: Optional["PasswordRehasher"] = None,
+        credential_memo: Optional["CredentialMemo"] = None,
+        speculative_hasher: Optional["SpeculativeHasher"] = None,
+        password_screener: Optional["PasswordScreener"] = None,
         **kwargs
     ):
         """
         Updates the current AuthKit instance with new dependencies.
         
-        This method mutates the current instance. Use with caution in multi-threaded environments.
+        The new adapters, and every use case already resolved from the old ones,
+        are built off to the side and published with a single reference swap.
+        Concurrent readers keep using the previous snapshot until the swap and
+        never see a half-updated configuration, so adapters can be hot-swapped
+        (e.g. failover to a replica repository) on a facade shared by many threads.
+        Use cases that a caller already holds keep their previous adapters.
         
         Args:
             user_repo: Unified repository for both reading and writing.
@@ -156,6 +237,10 @@ class AuthKit:
             otp_manager: Service for generating/validating OTPs.
             registration_intent_store: Storage for pending registrations.
             intent_store: Storage for user ID intents.
+            password_rehasher: Re-hashes outdated password hashes after logins.
+            credential_memo: Remembers recent password verifications.
+            speculative_hasher: Hashes registration passwords in the background.
+            password_screener: Rejects new passwords known from data breaches.
         """
         # Collect explicit args
         updates = {
@@ -167,7 +252,11 @@ class AuthKit:
             'otp_store': otp_store,
             'otp_manager': otp_manager,
             'registration_intent_store': registration_intent_store,
-            'intent_store': intent_store
+            'intent_store': intent_store,
+            'password_rehasher': password_rehasher,
+            'credential_memo': credential_memo,
+            'speculative_hasher': speculative_hasher,
+            'password_screener': password_screener,
         }
         # Filter None (meaning "no change")
         updates = {k: v for k, v in updates.items() if v is not None}
@@ -175,33 +264,142 @@ class AuthKit:
         # Merge with kwargs
         all_updates = {**updates, **kwargs}
         
-        # FIX: If user_repo is updated, we must clear inferred reader/writer
-        # to avoid "Ambiguous configuration" error in __post_init__.
-        if 'user_repo' in all_updates:
-            if 'user_reader' not in all_updates:
-                setattr(self._adapters, 'user_reader', None)
-            if 'user_writer' not in all_updates:
-                setattr(self._adapters, 'user_writer', None)
-
-        # Update existing adapters with new values
-        for key, value in all_updates.items():
-            setattr(self._adapters, key, value)
-            
-        # Re-run validation logic (optional but recommended)
-        if hasattr(self._adapters, '__post_init__'):
-            self._adapters.__post_init__()
+        with self._configure_lock:
+            current = self._snapshot
+            # Build the updated adapters off to the side (see AuthAdapters.replace),
+            # which also re-runs validation.
+            snapshot = _Snapshot(current.adapters.replace(**all_updates))
+
+            # CRITICAL: Rebuild the use cases in use so they get the NEW dependencies,
+            # before publishing, so the hot path never resolves after a swap.
+            for name in list(current.use_cases):
+                try:
+                    self._resolve(snapshot, name)
+                except AttributeError:
+                    # No longer resolvable with the new adapters: fails lazily on access.
+                    pass
 
-        # CRITICAL: Re-instantiate use cases so they get the NEW dependencies.
-        self._rebind_use_cases()
+            # Publish: a single reference assignment is atomic.
+            self._snapshot = snapshot
             
         return self
 
-    def _rebind_use_cases(self):
-        """Helper to instantiate/re-instantiate all use cases from the Registry."""
-        for name, cls in Registry.items():
-            try:
-                instance = Resolver.resolve(cls, self._adapters)
-                setattr(self, name, instance)
-            except Exception as e:
-                # Log warning but don't crash
-                 pass
+    def scope(self, **overrides: Any) -> "AuthKit":
+        """
+        Returns a cheap, request-scoped child of this AuthKit instance.
+
+        The child shares every adapter of the parent except `overrides`, and
+        resolves its own use cases lazily. The parent is never mutated, so a
+        single application-wide instance can be scoped per request or per
+        Unit of Work.
+
+        Usage:
+            >>> auth = AuthKit(password_manager=pm, session_service=sessions,
+            ...                otp_store=Provider(lambda: RedisOTPStore(redis)))
+            >>> with Session() as session:
+            ...     auth.scope(user_repo=SQLUserRepo(session)).login.execute(...)
+
+        Args:
+            **overrides: Adapters to replace in the child (same names as `configure`).
+                `None` values mean "no change".
+
+        Returns:
+            A new AuthKit instance of the same type.
+        """
+        updates = {k: v for k, v in overrides.items() if v is not None}
+        child = object.__new__(type(self))
+        child.__dict__.update(self.__dict__)
+        child._snapshot = _Snapshot(self._snapshot.adapters.replace(**updates))
+        child._configure_lock = threading.Lock()
+        return child
+
+    def warmup(self, *, freeze: bool = False) -> "AuthKit":
+        """
+        Pays one-time startup costs up front, typically in a pre-fork master process.
+
+        Imports every use case module this instance can serve (see `features`),
+        compiles their injection plans and calls `warmup()` on every adapter that
+        defines one. With `freeze=True` the garbage collector is run and all
+        surviving objects are moved to the permanent generation (`gc.freeze()`),
+        so forked workers do not touch, and therefore do not copy, those pages.
+
+        Adapters held by a `Provider` are not built: connections and thread pools
+        created before `fork()` would be shared with, or lost in, the workers.
+
+        Args:
+            freeze: Whether to call `gc.freeze()` after warming up.
+
+        Returns:
+            This AuthKit instance, for chaining.
+        """
+        names = self._registry.names() if self._features is None else self._features
+        for name in sorted(names):
+            cls = self._registry.get(name)
+            if cls is not None:
+                Resolver.plan(cls)
+
+        adapters = self._snapshot.adapters
+        primed = set()
+        for value in vars(adapters).values():
+            hook = getattr(value, 'warmup', None)
+            if callable(hook) and id(value) not in primed:
+                primed.add(id(value))
+                hook()
+
+        if freeze:
+            import gc
+            gc.collect()
+            gc.freeze()
+        return self
+
+    def _port_wrapper(self) -> Optional[Callable[[str, Any], Any]]:
+        """Returns the hook applied to each port injected into a use case, if any."""
+        return None
+
+    @property
+    def _adapters(self) -> AuthAdapters:
+        """The adapters of the current snapshot."""
+        return self._snapshot.adapters
+
+    def __getattr__(self, name: str) -> Any:
+        """
+        Returns a registered use case, resolving it on first access.
+
+        Use cases are cached in the current snapshot, not set as instance
+        attributes (so `configure()` can swap them all at once): every
+        `auth.<use_case>` access goes through here. Once resolved, that costs
+        a snapshot dictionary lookup; `_resolve` only runs on the first access
+        per snapshot. Regular attributes never reach this method.
+        """
+        # Read the snapshot once: everything below sees one consistent configuration.
+        # (Guards against lookups before __init__ has run, e.g. copy/pickle.)
+        snapshot = self.__dict__.get('_snapshot')
+        if snapshot is None:
+            raise AttributeError(name)
+        instance = snapshot.use_cases.get(name)
+        if instance is not None:
+            return instance
+        return self._resolve(snapshot, name)
+
+    def _resolve(self, snapshot: _Snapshot, name: str) -> Any:
+        """Resolves the use case `name` against `snapshot` and caches it there."""
+        if self._features is not None and name not in self._features:
+            if name in self._registry.names():
+                raise AttributeError(f"Use case '{name}' is not enabled in this AuthKit instance's features.")
+            raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+        cls = self._registry.get(name)
+        if cls is None:
+            raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+        try:
+            instance = Resolver.resolve(cls, snapshot.adapters, wrap_port=self._port_wrapper(),
+                                        interceptors=self._interceptors, name=name)
+        except Exception as e:
+            # A use case that cannot be built (e.g. a custom dependency is missing)
+            # behaves like an absent attribute, so hasattr() keeps working.
+            raise AttributeError(f"Use case '{name}' could not be resolved: {e}") from e
+        # Two threads may race to resolve the same name; both get the same instance.
+        return snapshot.use_cases.setdefault(name, instance)
+
+    def __dir__(self):
+        names = self._registry.names() if self._features is None else self._features
+        return sorted(set(super().__dir__()) | names)
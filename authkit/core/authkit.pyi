@@ -1,8 +1,9 @@
-from typing import Optional
+from typing import Any, Iterable, Optional
 from authkit.core.adapters import AuthAdapters
+from authkit.core.interceptors import Interceptor
 from authkit.ports import (
     UserRepository, UserReaderRepository, UserWriterRepository,
-    PasswordManager, AuthSessionService,
+    PasswordManager, PasswordRehasher, CredentialMemo, SpeculativeHasher, PasswordScreener, AuthSessionService,
     OTPStore, OTPManager,
     RegistrationIntentStore, UserIDIntentStore
 )
@@ -12,6 +13,8 @@ class AuthKit:
     """
     The main entry point for the AuthKit library.
     """
+    authenticate: authkit.usecases.AuthenticateUseCase
+    authenticate_many: authkit.usecases.AuthenticateManyUseCase
     login: authkit.usecases.LoginUseCase
     register: authkit.usecases.RegistrationUseCase
     logout: authkit.usecases.LogoutUseCase
@@ -41,7 +44,13 @@ class AuthKit:
         otp_manager: Optional[OTPManager] = None,
         registration_intent_store: Optional[RegistrationIntentStore] = None,
         intent_store: Optional[UserIDIntentStore] = None,
+        password_rehasher: Optional[PasswordRehasher] = None,
+        credential_memo: Optional[CredentialMemo] = None,
+        speculative_hasher: Optional[SpeculativeHasher] = None,
+        password_screener: Optional[PasswordScreener] = None,
         adapters: Optional[AuthAdapters] = None,
+        features: Optional[Iterable[str]] = None,
+        interceptors: Optional[Iterable[Interceptor]] = None,
     ) -> None: ...
 
     def configure(
@@ -55,4 +64,29 @@ class AuthKit:
         otp_manager: Optional[OTPManager] = None,
         registration_intent_store: Optional[RegistrationIntentStore] = None,
         intent_store: Optional[UserIDIntentStore] = None,
+        password_rehasher: Optional[PasswordRehasher] = None,
+        credential_memo: Optional[CredentialMemo] = None,
+        speculative_hasher: Optional[SpeculativeHasher] = None,
+        password_screener: Optional[PasswordScreener] = None,
     ) -> "AuthKit": ...
+
+    def scope(
+        self,
+        *,
+        user_repo: Optional[UserRepository] = None,
+        user_reader: Optional[UserReaderRepository] = None,
+        user_writer: Optional[UserWriterRepository] = None,
+        password_manager: Optional[PasswordManager] = None,
+        session_service: Optional[AuthSessionService] = None,
+        otp_store: Optional[OTPStore] = None,
+        otp_manager: Optional[OTPManager] = None,
+        registration_intent_store: Optional[RegistrationIntentStore] = None,
+        intent_store: Optional[UserIDIntentStore] = None,
+        password_rehasher: Optional[PasswordRehasher] = None,
+        credential_memo: Optional[CredentialMemo] = None,
+        speculative_hasher: Optional[SpeculativeHasher] = None,
+        password_screener: Optional[PasswordScreener] = None,
+        **overrides: Any,
+    ) -> "AuthKit": ...
+
+    def warmup(self, *, freeze: bool = False) -> "AuthKit": ...
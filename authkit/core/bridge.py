@@ -0,0 +1,158 @@
+"""
+Bridges that let synchronous adapters serve the async ports of `AsyncAuthKit`.
+"""
+import asyncio
+import contextvars
+import functools
+import inspect
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable
+
+# Per adapter class: whether every public method is already a coroutine function.
+_async_classes: dict[type, bool] = {}
+
+
+def _is_async_adapter(cls: type) -> bool:
+    """Returns True when `cls` implements its methods natively with `async def`."""
+    cached = _async_classes.get(cls)
+    if cached is None:
+        methods = [
+            member for name, member in inspect.getmembers(cls, callable)
+            if not name.startswith('_') and not isinstance(member, type)
+        ]
+        cached = bool(methods) and all(inspect.iscoroutinefunction(m) for m in methods)
+        _async_classes[cls] = cached
+    return cached
+
+
+class SyncPortBridge:
+    """
+    Exposes a synchronous adapter through an async port.
+
+    Every public method of the wrapped adapter becomes a coroutine function:
+
+    * coroutine methods are returned unchanged;
+    * if the adapter also defines a `<method>_async` coroutine (e.g. `verify_async`),
+      that one is used instead of `<method>`;
+    * adapters marked with `__authkit_nonblocking__ = True` (e.g. in-memory stores)
+      are called inline, on the event loop;
+    * anything else runs in the port's bounded thread pool, with the caller's
+      context variables copied over.
+
+    Wrapped methods are cached on the bridge, so each adapter method is only
+    inspected once per bridge.
+    """
+    def __init__(self, adapter: Any, executor: Callable[[], ThreadPoolExecutor]):
+        """
+        Args:
+            adapter: The synchronous adapter to expose.
+            executor: Returns the thread pool to run blocking calls in (created lazily).
+        """
+        self._adapter = adapter
+        self._executor = executor
+        self._inline = getattr(adapter, '__authkit_nonblocking__', False)
+
+    def __getattr__(self, name: str) -> Any:
+        adapter = self._adapter
+        attr = getattr(adapter, name)
+        if name.startswith('_') or not callable(attr) or inspect.iscoroutinefunction(attr):
+            return attr
+
+        native = getattr(adapter, f"{name}_async", None)
+        if native is not None and inspect.iscoroutinefunction(native):
+            bridged = native
+        elif self._inline:
+            bridged = self._inline_call(attr)
+        else:
+            bridged = self._offloaded_call(attr)
+        self.__dict__[name] = bridged
+        return bridged
+
+    @staticmethod
+    def _inline_call(method: Callable[..., Any]) -> Callable[..., Any]:
+        @functools.wraps(method)
+        async def call(*args: Any, **kwargs: Any) -> Any:
+            return method(*args, **kwargs)
+        return call
+
+    def _offloaded_call(self, method: Callable[..., Any]) -> Callable[..., Any]:
+        executor = self._executor
+
+        @functools.wraps(method)
+        async def call(*args: Any, **kwargs: Any) -> Any:
+            loop = asyncio.get_running_loop()
+            context = contextvars.copy_context()
+            return await loop.run_in_executor(
+                executor(), functools.partial(context.run, method, *args, **kwargs)
+            )
+        return call
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self._adapter!r})"
+
+
+class PortBridges:
+    """
+    The thread pools backing the `SyncPortBridge`s of one `AsyncAuthKit` instance.
+
+    Each port (`user_reader`, `session_service`, ...) gets its own bounded pool,
+    created the first time one of its blocking methods is called, so a slow
+    dependency can only exhaust its own workers. Natively async adapters are
+    injected unwrapped and never create a pool.
+    """
+
+    def __init__(self, max_workers: int = 4):
+        """
+        Args:
+            max_workers: Size of each per-port thread pool.
+        """
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+        self.max_workers = max_workers
+        self._executors: dict[str, ThreadPoolExecutor] = {}
+        self._getters: dict[str, Callable[[], ThreadPoolExecutor]] = {}
+        self._lock = threading.Lock()
+
+    def wrap(self, port: str, adapter: Any) -> Any:
+        """
+        Returns `adapter` ready to be injected into an async use case as `port`.
+
+        Args:
+            port: The name of the port (the use case constructor parameter).
+            adapter: The configured adapter.
+
+        Returns:
+            The adapter itself if it is natively async, otherwise a `SyncPortBridge` around it.
+        """
+        if isinstance(adapter, SyncPortBridge) or _is_async_adapter(type(adapter)):
+            return adapter
+        getter = self._getters.get(port)
+        if getter is None:
+            getter = self._getters.setdefault(port, functools.partial(self.executor, port))
+        return SyncPortBridge(adapter, getter)
+
+    def executor(self, port: str) -> ThreadPoolExecutor:
+        """Returns the thread pool of `port`, creating it on first use."""
+        executor = self._executors.get(port)
+        if executor is None:
+            with self._lock:
+                executor = self._executors.get(port)
+                if executor is None:
+                    executor = self._executors[port] = ThreadPoolExecutor(
+                        max_workers=self.max_workers,
+                        thread_name_prefix=f"authkit-{port}",
+                    )
+        return executor
+
+    def shutdown(self, wait: bool = True) -> None:
+        """
+        Shuts down every thread pool created so far.
+
+        Args:
+            wait: Whether to block until pending calls have finished.
+        """
+        with self._lock:
+            executors, self._executors = self._executors, {}
+        for executor in executors.values():
+            executor.shutdown(wait=wait)
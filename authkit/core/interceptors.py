@@ -0,0 +1,176 @@
+"""
+Interceptors: hooks around use case execution and port calls.
+"""
+import functools
+import inspect
+from typing import Any, Callable, Iterable
+
+
+class Interceptor:
+    """
+    Base class for AuthKit interceptors (middleware).
+
+    Override any of the hooks below; the defaults simply pass the call through.
+    Each hook receives `proceed`, the next step of the chain, and must call it
+    (or not, e.g. to serve a cached result) and return its result.
+
+    `AuthKit` calls the sync hooks, `AsyncAuthKit` calls the `*_async` hooks.
+    Hooks that are not overridden are left out of the chain entirely.
+
+    Usage:
+        >>> class Timing(Interceptor):
+        ...     def intercept_port(self, port, method, proceed, *args, **kwargs):
+        ...         start = time.perf_counter()
+        ...         try:
+        ...             return proceed(*args, **kwargs)
+        ...         finally:
+        ...             metrics.observe(f"{port}.{method}", time.perf_counter() - start)
+        >>> auth = AuthKit(..., interceptors=[Timing()])
+    """
+
+    def intercept_execute(self, use_case: str, proceed: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """
+        Wraps `execute()` of a use case, and `try_execute()` where it exists.
+
+        Args:
+            use_case: The facade name of the use case (e.g. "login").
+            proceed: Calls the rest of the chain, ending with the real `execute()`
+                (or `try_execute()`, which returns a `Result` instead of raising).
+            *args: Positional arguments of the call.
+            **kwargs: Keyword arguments of the call.
+
+        Returns:
+            The result to hand back to the caller.
+        """
+        return proceed(*args, **kwargs)
+
+    def intercept_port(self, port: str, method: str, proceed: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """
+        Wraps a method call on an injected port.
+
+        Args:
+            port: The name of the port (e.g. "user_reader").
+            method: The name of the called method (e.g. "get_by_id").
+            proceed: Calls the rest of the chain, ending with the adapter method.
+            *args: Positional arguments of the call.
+            **kwargs: Keyword arguments of the call.
+
+        Returns:
+            The result to hand back to the use case.
+        """
+        return proceed(*args, **kwargs)
+
+    async def intercept_execute_async(self, use_case: str, proceed: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """Async counterpart of `intercept_execute`; `proceed` returns an awaitable."""
+        return await proceed(*args, **kwargs)
+
+    async def intercept_port_async(self, port: str, method: str, proceed: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """Async counterpart of `intercept_port`; `proceed` returns an awaitable."""
+        return await proceed(*args, **kwargs)
+
+
+# Use case methods wrapped by the execute hooks.
+_ENTRY_POINTS = ('execute', 'try_execute')
+
+
+def _overrides(interceptor: Interceptor, hook: str) -> bool:
+    return getattr(type(interceptor), hook) is not getattr(Interceptor, hook)
+
+
+class InterceptorChain:
+    """
+    An ordered set of interceptors, split per hook once so that resolution only
+    composes the hooks that are actually overridden.
+
+    The first interceptor is the outermost one: it sees the call first and the
+    result last.
+    """
+    __slots__ = ("interceptors", "_hooks")
+
+    def __init__(self, interceptors: Iterable[Interceptor]):
+        self.interceptors = tuple(interceptors)
+        self._hooks = {
+            hook: tuple(getattr(i, hook) for i in self.interceptors if _overrides(i, hook))
+            for hook in ('intercept_execute', 'intercept_port',
+                         'intercept_execute_async', 'intercept_port_async')
+        }
+
+    @property
+    def intercepts_ports(self) -> bool:
+        """Whether any interceptor wraps port calls."""
+        return bool(self._hooks['intercept_port'] or self._hooks['intercept_port_async'])
+
+    def wrap_use_case(self, name: str, use_case: Any) -> Any:
+        """
+        Composes the execute hooks around `use_case.execute` (and `try_execute`), in place.
+
+        Args:
+            name: The facade name of the use case.
+            use_case: The freshly built use case instance.
+
+        Returns:
+            The same instance.
+        """
+        for entry_point in _ENTRY_POINTS:
+            method = getattr(use_case, entry_point, None)
+            if method is None:
+                continue
+            is_async = inspect.iscoroutinefunction(method)
+            hooks = self._hooks['intercept_execute_async' if is_async else 'intercept_execute']
+            if hooks:
+                setattr(use_case, entry_point, _compose(method, hooks, (name,)))
+        return use_case
+
+    def wrap_port(self, port: str, adapter: Any) -> Any:
+        """
+        Returns `adapter` with the port hooks composed around its public methods.
+
+        Args:
+            port: The name of the port.
+            adapter: The adapter about to be injected.
+        """
+        return InterceptedPort(port, adapter, self._hooks)
+
+
+class InterceptedPort:
+    """
+    Proxy composing the port hooks around each public method of an adapter.
+
+    Methods are composed on first access and cached on the proxy.
+    """
+
+    def __init__(self, port: str, adapter: Any, hooks: dict):
+        self._port = port
+        self._adapter = adapter
+        self._hooks = hooks
+
+    def __getattr__(self, name: str) -> Any:
+        attr = getattr(self._adapter, name)
+        if name.startswith('_') or not callable(attr):
+            return attr
+        is_async = inspect.iscoroutinefunction(attr)
+        hooks = self._hooks['intercept_port_async' if is_async else 'intercept_port']
+        wrapped = _compose(attr, hooks, (self._port, name)) if hooks else attr
+        self.__dict__[name] = wrapped
+        return wrapped
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self._port!r}, {self._adapter!r})"
+
+
+def _compose(target: Callable[..., Any], hooks: tuple, labels: tuple) -> Callable[..., Any]:
+    """Chains `hooks` (outermost first) around `target`."""
+    call = target
+    for hook in reversed(hooks):
+        call = _link(hook, labels, call)
+    return functools.wraps(target)(call) if hooks else call
+
+
+def _link(hook: Callable[..., Any], labels: tuple, proceed: Callable[..., Any]) -> Callable[..., Any]:
+    if inspect.iscoroutinefunction(hook):
+        async def step(*args: Any, **kwargs: Any) -> Any:
+            return await hook(*labels, proceed, *args, **kwargs)
+    else:
+        def step(*args: Any, **kwargs: Any) -> Any:
+            return hook(*labels, proceed, *args, **kwargs)
+    return step
@@ -0,0 +1,64 @@
+"""
+Static manifest of the built-in use cases.
+
+Maps every facade attribute name to the `module:ClassName` implementing it,
+so the Registry can import a use case module the first time that use case is
+needed instead of importing all of them at startup.
+
+Keep in sync with the `@Registry.register(...)` decorators in `authkit.usecases`
+and the `@AsyncRegistry.register(...)` decorators in `authkit.usecases.aio`.
+"""
+from typing import Dict
+
+BUILTIN_USE_CASES: Dict[str, str] = {
+    # Authentication
+    "authenticate": "authkit.usecases.Authentication.authenticate:AuthenticateUseCase",
+    "authenticate_many": "authkit.usecases.Authentication.authenticate_many:AuthenticateManyUseCase",
+    "login": "authkit.usecases.Authentication.login:LoginUseCase",
+    "login_otp_start": "authkit.usecases.Authentication.login_with_otp_start:StartLoginWithOTPUseCase",
+    "login_otp_verify": "authkit.usecases.Authentication.login_with_otp_verify:VerifyLoginWithOTPUseCase",
+    "logout": "authkit.usecases.Authentication.logout:LogoutUseCase",
+    "logout_all": "authkit.usecases.Authentication.logout_all:LogoutAllUseCase",
+    "logout_all_otp_start": "authkit.usecases.Authentication.logout_all_with_otp_start:StartLogoutAllWithOTPUseCase",
+    "logout_all_otp_verify": "authkit.usecases.Authentication.logout_all_with_otp_verify:VerifyLogoutAllWithOTPUseCase",
+    "register": "authkit.usecases.Authentication.registration:RegistrationUseCase",
+    "register_otp_start": "authkit.usecases.Authentication.registration_with_otp_start:StartRegistrationWithOTPUseCase",
+    "register_otp_verify": "authkit.usecases.Authentication.registration_with_otp_verify:VerifyRegistrationWithOTPUseCase",
+
+    # Account
+    "delete_account": "authkit.usecases.Account.delete_account:DeleteAccountUseCase",
+    "delete_account_otp_start": "authkit.usecases.Account.delete_account_with_otp_start:StartDeleteAccountWithOTPUseCase",
+    "delete_account_otp_verify": "authkit.usecases.Account.delete_account_with_otp_verify:VerifyDeleteAccountWithOTPUseCase",
+
+    # Credential
+    "change_password": "authkit.usecases.Credential.change_password_cqrs:ChangePasswordUseCase",
+    "forget_password_start": "authkit.usecases.Credential.forget_password_start:StartForgetPasswordUseCase",
+    "forget_password_verify": "authkit.usecases.Credential.forget_password_verify:VerifyForgetPasswordUseCase",
+}
+
+# Async twins of the use cases above, served by `AsyncAuthKit`.
+BUILTIN_ASYNC_USE_CASES: Dict[str, str] = {
+    # Authentication
+    "authenticate": "authkit.usecases.aio.Authentication.authenticate:AsyncAuthenticateUseCase",
+    "authenticate_many": "authkit.usecases.aio.Authentication.authenticate_many:AsyncAuthenticateManyUseCase",
+    "login": "authkit.usecases.aio.Authentication.login:AsyncLoginUseCase",
+    "login_otp_start": "authkit.usecases.aio.Authentication.login_with_otp_start:AsyncStartLoginWithOTPUseCase",
+    "login_otp_verify": "authkit.usecases.aio.Authentication.login_with_otp_verify:AsyncVerifyLoginWithOTPUseCase",
+    "logout": "authkit.usecases.aio.Authentication.logout:AsyncLogoutUseCase",
+    "logout_all": "authkit.usecases.aio.Authentication.logout_all:AsyncLogoutAllUseCase",
+    "logout_all_otp_start": "authkit.usecases.aio.Authentication.logout_all_with_otp_start:AsyncStartLogoutAllWithOTPUseCase",
+    "logout_all_otp_verify": "authkit.usecases.aio.Authentication.logout_all_with_otp_verify:AsyncVerifyLogoutAllWithOTPUseCase",
+    "register": "authkit.usecases.aio.Authentication.registration:AsyncRegistrationUseCase",
+    "register_otp_start": "authkit.usecases.aio.Authentication.registration_with_otp_start:AsyncStartRegistrationWithOTPUseCase",
+    "register_otp_verify": "authkit.usecases.aio.Authentication.registration_with_otp_verify:AsyncVerifyRegistrationWithOTPUseCase",
+
+    # Account
+    "delete_account": "authkit.usecases.aio.Account.delete_account:AsyncDeleteAccountUseCase",
+    "delete_account_otp_start": "authkit.usecases.aio.Account.delete_account_with_otp_start:AsyncStartDeleteAccountWithOTPUseCase",
+    "delete_account_otp_verify": "authkit.usecases.aio.Account.delete_account_with_otp_verify:AsyncVerifyDeleteAccountWithOTPUseCase",
+
+    # Credential
+    "change_password": "authkit.usecases.aio.Credential.change_password_cqrs:AsyncChangePasswordUseCase",
+    "forget_password_start": "authkit.usecases.aio.Credential.forget_password_start:AsyncStartForgetPasswordUseCase",
+    "forget_password_verify": "authkit.usecases.aio.Credential.forget_password_verify:AsyncVerifyForgetPasswordUseCase",
+}
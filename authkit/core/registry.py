@@ -1,12 +1,19 @@
-from typing import Type, TypeVar, Dict
+from importlib import import_module
+from typing import Type, TypeVar, Dict, Optional, Set
+
+from .manifest import BUILTIN_USE_CASES, BUILTIN_ASYNC_USE_CASES
 
 T = TypeVar("T")
 
 class Registry:
     """
     A simple registry to hold use case classes.
+
+    Built-in use cases are listed in a static manifest and only imported when
+    first looked up; custom use cases register themselves with `register`.
     """
     _use_cases: Dict[str, Type] = {}
+    _manifest: Dict[str, str] = BUILTIN_USE_CASES
 
     @classmethod
     def register(cls, name: str):
@@ -20,11 +27,53 @@ class Registry:
              raise ValueError("Registry.register() require a non-empty name string.")
 
         def decorator(use_case_cls: Type):
+            # A built-in module imported lazily must not clobber a custom use case
+            # that was registered under the same name before it.
+            if name in cls._use_cases and \
+               cls._manifest.get(name) == f"{use_case_cls.__module__}:{use_case_cls.__qualname__}":
+                return use_case_cls
             # No auto-naming anymore
             cls._use_cases[name] = use_case_cls
             return use_case_cls
         return decorator
 
+    @classmethod
+    def get(cls, name: str) -> Optional[Type]:
+        """
+        Returns the use case class registered under `name`, or None.
+
+        Built-in use cases are imported from the manifest on first lookup.
+        """
+        use_case_cls = cls._use_cases.get(name)
+        if use_case_cls is None:
+            target = cls._manifest.get(name)
+            if target is not None:
+                module, _, qualname = target.partition(":")
+                use_case_cls = cls._use_cases.setdefault(name, getattr(import_module(module), qualname))
+        return use_case_cls
+
+    @classmethod
+    def names(cls) -> Set[str]:
+        """
+        Returns the names of all known use cases without importing any of them.
+        """
+        return set(cls._manifest) | set(cls._use_cases)
+
     @classmethod
     def items(cls):
+        """
+        Returns all `(name, class)` pairs, importing every built-in use case.
+        """
+        for name in cls._manifest:
+            cls.get(name)
         return cls._use_cases.items()
+
+
+class AsyncRegistry(Registry):
+    """
+    Registry of the async use cases served by `AsyncAuthKit`.
+
+    Register custom async use cases with `@AsyncRegistry.register("name")`.
+    """
+    _use_cases: Dict[str, Type] = {}
+    _manifest: Dict[str, str] = BUILTIN_ASYNC_USE_CASES
@@ -1,45 +1,144 @@
-import inspect
-from typing import Type, Any, TYPE_CHECKING
+from typing import Type, Any, Callable, Dict, Optional, Tuple, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from authkit.core.adapters import AuthAdapters
+    from authkit.core.interceptors import InterceptorChain
+
+
+_MISSING = object()
+
+# Configuration values rather than adapters: never passed to `wrap_port`.
+_PLAIN_VALUES = (str, bytes, int, float, bool)
+
+
+class InjectionPlan:
+    """
+    Precompiled constructor call for a use case class.
+
+    Holds the names of the `__init__` parameters that can be injected from
+    `AuthAdapters`, so building an instance is a handful of attribute lookups
+    instead of a full signature introspection.
+
+    Parameters defaulting to None (`optional`) are optional ports: a None
+    adapter leaves them to their default, so the use case sees the feature
+    as disabled instead of receiving a `MissingDependencyProxy`.
+    """
+    __slots__ = ("use_case_cls", "params", "optional")
+
+    def __init__(self, use_case_cls: Type, params: Tuple[str, ...], optional: frozenset = frozenset()):
+        self.use_case_cls = use_case_cls
+        self.params = params
+        self.optional = optional
+
+    def __call__(
+        self,
+        adapters: "AuthAdapters",
+        wrap_port: Optional[Callable[[str, Any], Any]] = None,
+        use_case: Optional[str] = None,
+    ) -> Any:
+        kwargs = {}
+        for param_name in self.params:
+            # 1. Try to find by name in adapters
+            val = getattr(adapters, param_name, _MISSING)
+            if val is _MISSING:
+                # Not provided at all: let the use case default (or fail) on its own.
+                continue
+
+            # If dependency is explicitly missing (None) in the adapters (e.g. otp_store),
+            # inject a Proxy that acts as a "poison pill". It will raise a clear error
+            # only when the use case tries to ACCESS it. Optional ports keep their None default.
+            if val is None:
+                if param_name not in self.optional:
+                    kwargs[param_name] = MissingDependencyProxy(param_name)
+                continue
+
+            # Adapters that behave per use case (e.g. a HashScheduler routing jobs
+            # to priority classes) hand out a view bound to the use case being built.
+            # Only the injected adapter is bound: wrappers forward it to what they wrap.
+            if use_case is not None:
+                bind = getattr(type(val), 'bind_use_case', None)
+                if bind is not None:
+                    val = bind(val, use_case)
+
+            if wrap_port is None or isinstance(val, _PLAIN_VALUES):
+                kwargs[param_name] = val
+            else:
+                kwargs[param_name] = wrap_port(param_name, val)
+
+            # 2. (Optional) match by type...
+
+        return self.use_case_cls(**kwargs)
 
 
 class Resolver:
     """
     Dependency Resolver for AuthKit use cases.
     """
-    
-    @staticmethod
-    def resolve(use_case_cls: Type, adapters: "AuthAdapters") -> Any:
+    _plans: Dict[Type, InjectionPlan] = {}
+
+    @classmethod
+    def plan(cls, use_case_cls: Type) -> InjectionPlan:
+        """
+        Returns the cached injection plan for a use case class, compiling it on first use.
+
+        The plan is computed once per class by inspecting its `__init__` signature.
+        """
+        plan = cls._plans.get(use_case_cls)
+        if plan is None:
+            # Imported here: `inspect` is only needed the first time a class is resolved.
+            import inspect
+            sig = inspect.signature(use_case_cls.__init__)
+            params = tuple(
+                param_name
+                for param_name, param in sig.parameters.items()
+                if param_name != 'self'
+                and param.kind in (param.POSITIONAL_OR_KEYWORD, param.KEYWORD_ONLY)
+            )
+            optional = frozenset(
+                param_name for param_name in params if sig.parameters[param_name].default is None
+            )
+            plan = cls._plans[use_case_cls] = InjectionPlan(use_case_cls, params, optional)
+        return plan
+
+    @classmethod
+    def resolve(
+        cls,
+        use_case_cls: Type,
+        adapters: "AuthAdapters",
+        wrap_port: Optional[Callable[[str, Any], Any]] = None,
+        interceptors: Optional["InterceptorChain"] = None,
+        name: Optional[str] = None,
+    ) -> Any:
         """
         Instantiates a use case class by injecting matching adapters.
-        
-        It inspects the `__init__` method of the use case and matches arguments
-        by name or type against the properties in `AuthAdapters`.
+
+        It matches the arguments of the use case `__init__` by name against
+        the properties in `AuthAdapters`, using a cached `InjectionPlan`.
+
+        Interceptors are composed here, once per resolved instance: with none
+        configured the use case and its ports are injected untouched.
+
+        Args:
+            use_case_cls: The use case class to instantiate.
+            adapters: The adapters to inject from.
+            wrap_port: Optional `(name, adapter) -> adapter` hook applied once to
+                every configured adapter before it is injected.
+            interceptors: Optional chain composed around `execute()` and the ports.
+            name: The facade name of the use case, reported to interceptors (defaults
+                to the class name) and passed to adapters defining `bind_use_case(name)`.
         """
-        sig = inspect.signature(use_case_cls.__init__)
-        kwargs = {}
-        
-        for param_name, param in sig.parameters.items():
-            if param_name == 'self':
-                continue
-            
-            # 1. Try to find by name in adapters
-            if hasattr(adapters, param_name):
-                val = getattr(adapters, param_name)
-                
-                # If dependency is explicitly missing (None) in the adapters (e.g. otp_store),
-                # inject a Proxy that acts as a "poison pill". It will raise a clear error
-                # only when the use case tries to ACCESS it.
-                if val is None:
-                    kwargs[param_name] = MissingDependencyProxy(param_name)
-                else:
-                    kwargs[param_name] = val
-            
-            # 2. (Optional) match by type...
-            
-        return use_case_cls(**kwargs)
+        plan = cls.plan(use_case_cls)
+        if interceptors is None:
+            return plan(adapters, wrap_port, name)
+
+        if interceptors.intercepts_ports:
+            if wrap_port is None:
+                wrap_port = interceptors.wrap_port
+            else:
+                inner = wrap_port
+                wrap_port = lambda port, adapter: interceptors.wrap_port(port, inner(port, adapter))
+        instance = plan(adapters, wrap_port, name)
+        return interceptors.wrap_use_case(name or use_case_cls.__name__, instance)
 
 class MissingDependencyProxy:
     """
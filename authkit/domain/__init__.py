@@ -3,9 +3,12 @@ Exposes the domain entities and enums for the AuthKit module.
 """
 from authkit.domain.entities import *
 from authkit.domain.enum import *
+from authkit.domain.result import Result
 
 __all__ = [
     "User", 
     "RegistrationIntent", 
-    "OTPPurpose"
+    "OTPPurpose",
+    "AuthErrorCode",
+    "Result",
     ]
@@ -1 +1,2 @@
 from authkit.domain.enum.otp import OTPPurpose
+from authkit.domain.enum.error import AuthErrorCode
@@ -0,0 +1,8 @@
+from enum import Enum
+
+class AuthErrorCode(Enum):
+    """
+    Enumeration of expected failures reported by `try_execute()` instead of an exception.
+    """
+    USER_NOT_FOUND = "user_not_found"
+    INVALID_PASSWORD = "invalid_password"
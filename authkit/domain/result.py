@@ -0,0 +1,72 @@
+from typing import Generic, Optional, TypeVar
+
+from authkit.domain.enum.error import AuthErrorCode
+from authkit.exceptions.auth import AuthError, InvalidCredentialsError
+
+T = TypeVar("T")
+
+# Exception raised by `Result.unwrap()` (and so by `execute()`) for each error code.
+_ERRORS: dict[AuthErrorCode, tuple[type[AuthError], str]] = {
+    AuthErrorCode.USER_NOT_FOUND: (InvalidCredentialsError, "User not found"),
+    AuthErrorCode.INVALID_PASSWORD: (InvalidCredentialsError, "Invalid password"),
+}
+
+
+class Result(Generic[T]):
+    """
+    Outcome of a `try_execute()` call: either a value or an `AuthErrorCode`.
+
+    Expected failures (e.g. a wrong password) are returned rather than raised,
+    which keeps high-failure paths free of exception construction and unwinding.
+    Failures carry no per-call state, so one shared instance per error code is
+    used and the failure path allocates nothing.
+
+    Usage:
+        >>> result = auth.login.try_execute(email, password)
+        >>> if not result.ok:
+        ...     return reject(result.error)
+        >>> session = result.value
+    """
+    __slots__ = ("value", "error")
+
+    def __init__(self, value: Optional[T] = None, error: Optional[AuthErrorCode] = None):
+        self.value = value
+        self.error = error
+
+    @classmethod
+    def success(cls, value: T) -> "Result[T]":
+        """Returns a successful result holding `value`."""
+        return cls(value)
+
+    @classmethod
+    def failure(cls, error: AuthErrorCode) -> "Result[T]":
+        """Returns the shared failed result for `error`."""
+        return _FAILURES[error]
+
+    @property
+    def ok(self) -> bool:
+        """Whether the call succeeded."""
+        return self.error is None
+
+    def __bool__(self) -> bool:
+        return self.error is None
+
+    def unwrap(self) -> T:
+        """
+        Returns the value, or raises the exception `execute()` raises for the error.
+
+        Raises:
+            AuthError: The subclass matching the error code (e.g. InvalidCredentialsError).
+        """
+        if self.error is None:
+            return self.value  # type: ignore[return-value]
+        exc_type, message = _ERRORS[self.error]
+        raise exc_type(message)
+
+    def __repr__(self) -> str:
+        if self.error is None:
+            return f"Result.success({self.value!r})"
+        return f"Result.failure({self.error})"
+
+
+_FAILURES: dict[AuthErrorCode, Result] = {code: Result(error=code) for code in AuthErrorCode}
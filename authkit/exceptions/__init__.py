@@ -9,6 +9,8 @@ from .auth import (
     NotFoundError,
     UserNotFoundError,
     FeatureNotConfiguredError,
+    OverloadedError,
+    BreachedPasswordError,
 )
 
 __all__ = [
@@ -19,4 +21,6 @@ __all__ = [
     "NotFoundError",
     "UserNotFoundError",
     "FeatureNotConfiguredError",
+    "OverloadedError",
+    "BreachedPasswordError",
 ]
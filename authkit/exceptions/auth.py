@@ -24,4 +24,12 @@ class UserNotFoundError(NotFoundError):
 
 class FeatureNotConfiguredError(AuthError):
     """Raised when a feature cannot be used because its dependencies are missing."""
-    ...
\ No newline at end of file
+    ...
+
+class OverloadedError(AuthError):
+    """Raised when a request is shed because the service is over capacity; safe to retry later."""
+    ...
+
+class BreachedPasswordError(AuthError):
+    """Raised when a new password appears in a list of breached passwords."""
+    ...
@@ -1,13 +1,21 @@
 """
 Exposes the ports (interfaces) for the AuthKit module.
 """
-from authkit.ports.intents import *
-from authkit.ports.otp import *
-from authkit.ports.user_repo_cqrs import *
-from authkit.ports.session_service import AuthSessionService, AuthSession
-from authkit.ports.passwd_manager import PasswordManager
-from authkit.ports.security_event import SecurityEventPublisher
-from authkit.ports.user_repo import UserRepository
+from typing import TYPE_CHECKING
+from authkit._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from authkit.ports.intents import *
+    from authkit.ports.otp import *
+    from authkit.ports.user_repo_cqrs import *
+    from authkit.ports.session_service import AuthSessionService, AuthSession, BatchAuthSessionService
+    from authkit.ports.session_revocation import SessionRevocationStore, SyncableRevocationStore, RevocationChanges
+    from authkit.ports.session_store import SessionStore, SessionRecord
+    from authkit.ports.passwd_manager import PasswordManager, RehashablePasswordManager, PasswordRehasher, SpeculativeHasher
+    from authkit.ports.credential_memo import CredentialMemo
+    from authkit.ports.passwd_screener import PasswordScreener
+    from authkit.ports.security_event import SecurityEventPublisher
+    from authkit.ports.user_repo import UserRepository
 
 __all__ = [
     "RegistrationIntentStore",
@@ -17,13 +25,54 @@ __all__ = [
     "OTPStore",
 
     "UserReaderRepository",
+    "BatchUserReaderRepository",
     "UserWriterRepository",
     
     "AuthSessionService",
     "AuthSession",
+    "BatchAuthSessionService",
+    "SessionRevocationStore",
+    "SyncableRevocationStore",
+    "RevocationChanges",
+    "SessionStore",
+    "SessionRecord",
     
     "PasswordManager",
+    "RehashablePasswordManager",
+    "PasswordRehasher",
+    "SpeculativeHasher",
+    "CredentialMemo",
+    "PasswordScreener",
     "UserRepository",
     # "SecurityEventPublisher",
 ]
 
+__getattr__, __dir__ = lazy_exports(__name__, {
+    "RegistrationIntentStore": "authkit.ports.intents.registration_intent_store",
+    "UserIDIntentStore": "authkit.ports.intents.user_id_intent_store",
+
+    "OTPManager": "authkit.ports.otp.otp_manager",
+    "OTPStore": "authkit.ports.otp.otp_store",
+
+    "UserReaderRepository": "authkit.ports.user_repo_cqrs._reader",
+    "BatchUserReaderRepository": "authkit.ports.user_repo_cqrs._reader",
+    "UserWriterRepository": "authkit.ports.user_repo_cqrs._writer",
+
+    "AuthSessionService": "authkit.ports.session_service",
+    "AuthSession": "authkit.ports.session_service",
+    "BatchAuthSessionService": "authkit.ports.session_service",
+    "SessionRevocationStore": "authkit.ports.session_revocation",
+    "SyncableRevocationStore": "authkit.ports.session_revocation",
+    "RevocationChanges": "authkit.ports.session_revocation",
+    "SessionStore": "authkit.ports.session_store",
+    "SessionRecord": "authkit.ports.session_store",
+
+    "PasswordManager": "authkit.ports.passwd_manager",
+    "RehashablePasswordManager": "authkit.ports.passwd_manager",
+    "PasswordRehasher": "authkit.ports.passwd_manager",
+    "SpeculativeHasher": "authkit.ports.passwd_manager",
+    "CredentialMemo": "authkit.ports.credential_memo",
+    "PasswordScreener": "authkit.ports.passwd_screener",
+    "SecurityEventPublisher": "authkit.ports.security_event",
+    "UserRepository": "authkit.ports.user_repo",
+})
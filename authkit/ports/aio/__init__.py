@@ -0,0 +1,37 @@
+"""
+Exposes the async variants of the AuthKit ports, used by `AsyncAuthKit`.
+
+Adapters implementing the sync ports can be used with `AsyncAuthKit` too:
+their blocking methods are run in a per-port thread pool.
+"""
+from authkit.ports.aio.user_repo import (
+    AsyncUserReaderRepository, AsyncBatchUserReaderRepository, AsyncUserWriterRepository, AsyncUserRepository,
+)
+from authkit.ports.aio.session_service import AsyncAuthSessionService, AsyncBatchAuthSessionService
+from authkit.ports.aio.passwd_manager import AsyncPasswordManager, AsyncPasswordRehasher, AsyncSpeculativeHasher
+from authkit.ports.aio.credential_memo import AsyncCredentialMemo
+from authkit.ports.aio.passwd_screener import AsyncPasswordScreener
+from authkit.ports.aio.otp import AsyncOTPManager, AsyncOTPStore
+from authkit.ports.aio.intents import AsyncRegistrationIntentStore, AsyncUserIDIntentStore
+
+__all__ = [
+    "AsyncRegistrationIntentStore",
+    "AsyncUserIDIntentStore",
+
+    "AsyncOTPManager",
+    "AsyncOTPStore",
+
+    "AsyncUserReaderRepository",
+    "AsyncBatchUserReaderRepository",
+    "AsyncUserWriterRepository",
+    "AsyncUserRepository",
+
+    "AsyncAuthSessionService",
+    "AsyncBatchAuthSessionService",
+
+    "AsyncPasswordManager",
+    "AsyncPasswordRehasher",
+    "AsyncSpeculativeHasher",
+    "AsyncCredentialMemo",
+    "AsyncPasswordScreener",
+]
@@ -0,0 +1,34 @@
+from typing import Protocol
+from uuid import UUID
+
+from authkit.domain import User
+from authkit.ports.aio.passwd_manager import AsyncPasswordManager
+
+
+class AsyncCredentialMemo(Protocol):
+    """
+    Async interface for remembering recent password verification results (see `CredentialMemo`).
+    """
+    async def verify(self, identifier: str, password: str, user: User, password_manager: AsyncPasswordManager) -> bool:
+        """
+        Verifies `password` against `user.password_hash`, from the memo when possible.
+
+        Args:
+            identifier: The identifier the user logged in with.
+            password: The plain text password.
+            user: The user found for `identifier`.
+            password_manager: Verifies the password on a memo miss.
+
+        Returns:
+            True if the password matches the user's hash, False otherwise.
+        """
+        ...
+
+    async def invalidate(self, user_id: UUID) -> None:
+        """
+        Forgets every entry of a user.
+
+        Args:
+            user_id: The ID of the user.
+        """
+        ...
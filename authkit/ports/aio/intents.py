@@ -0,0 +1,78 @@
+from typing import Protocol
+from uuid import UUID
+from authkit.domain import RegistrationIntent
+
+class AsyncRegistrationIntentStore(Protocol):
+    """
+    Async interface for storing temporary registration data (see `RegistrationIntentStore`),
+    optionally with an `async def update(key, intent)`.
+    """
+    async def store(self, intent: RegistrationIntent) -> UUID: 
+        """
+        Stores registration intent data.
+        
+        Args:
+            intent: The RegistrationIntent object.
+            
+        Returns:
+            A new unique key (UUID) for accessing this intent.
+        """
+        ...
+        
+    async def get(self, key: UUID) -> RegistrationIntent | None: 
+        """
+        Retrieves registration intent data.
+        
+        Args:
+            key: The intent key.
+            
+        Returns:
+            The RegistrationIntent object if found, None otherwise.
+        """
+        ...
+        
+    async def delete(self, key: UUID) -> None: 
+        """
+        Deletes a registration intent.
+        
+        Args:
+            key: The intent key to delete.
+        """
+        ...
+
+class AsyncUserIDIntentStore(Protocol):
+    """
+    Async interface for storing temporary intents mapped to User IDs (see `UserIDIntentStore`).
+    """
+    async def store(self, intent: UUID) -> UUID: 
+        """
+        Stores a user ID as an intent.
+        
+        Args:
+            intent: The User ID to store.
+            
+        Returns:
+            A new unique key (UUID) for accessing this intent.
+        """
+        ...
+        
+    async def get(self, key: UUID) -> UUID | None: 
+        """
+        Retrieves a user ID by its intent key.
+        
+        Args:
+            key: The intent key.
+            
+        Returns:
+            The User ID if found, None otherwise.
+        """
+        ...
+        
+    async def delete(self, key: UUID) -> None: 
+        """
+        Deletes an intent.
+        
+        Args:
+            key: The intent key to delete.
+        """
+        ...
@@ -0,0 +1,58 @@
+from typing import Protocol, Any
+from uuid import UUID
+from authkit.domain import OTPPurpose
+
+class AsyncOTPManager(Protocol):
+    """
+    Async interface for generating and sending OTPs (see `OTPManager`).
+    """
+
+    async def generate(self) -> str: 
+        """
+        Generates a new OTP code.
+        
+        Returns:
+            The generated OTP string.
+        """
+        ...
+
+    async def send(self, identifier: str, metadata: dict[str, Any], code: str, purpose: OTPPurpose) -> None: 
+        """
+        Sends an OTP to a user.
+        
+        Args:
+            identifier: The destination (e.g., email or phone number).
+            metadata: The user's metadata.
+            code: The OTP code to send.
+            purpose: The purpose of the OTP (e.g., login, registration).
+        """
+        ...
+
+class AsyncOTPStore(Protocol):
+    """
+    Async interface for storing and verifying OTPs (see `OTPStore`).
+    """
+    async def store(self, token: UUID, code: str, purpose: OTPPurpose) -> None: 
+        """
+        Stores an OTP for verification.
+        
+        Args:
+            token: The verification token associated with the OTP.
+            code: The OTP code.
+            purpose: The purpose of the OTP.
+        """
+        ...
+
+    async def verify(self, token: UUID, code: str, purpose: OTPPurpose) -> bool: 
+        """
+        Verifies an OTP against the stored value.
+        
+        Args:
+            token: The verification token.
+            code: The OTP code to verify.
+            purpose: The purpose of the OTP.
+            
+        Returns:
+            True if the OTP is valid, False otherwise.
+        """
+        ...
@@ -0,0 +1,95 @@
+from typing import Any, Callable, Optional, Protocol
+
+from authkit.domain import User
+from authkit.ports.aio.user_repo import AsyncUserWriterRepository
+
+class AsyncPasswordManager(Protocol):
+    """
+    Async interface for hashing and verifying passwords (see `PasswordManager`).
+    """
+    async def hash(self, password: str) -> str: 
+        """
+        Hashes a plain text password.
+        
+        Args:
+            password: The plain text password to hash.
+            
+        Returns:
+            The hashed password string.
+        """
+        ...
+
+    async def verify(self, password: str, hashed_password: str) -> bool: 
+        """
+        Verifies a plain text password against a hash.
+        
+        Args:
+            password: The plain text password.
+            hashed_password: The hashed password to verify against.
+            
+        Returns:
+            True if the password matches the hash, False otherwise.
+        """
+        ...
+
+
+class AsyncPasswordRehasher(Protocol):
+    """
+    Async interface for upgrading password hashes after a successful login (see `PasswordRehasher`).
+    """
+    async def submit(self, user: User, password: str, user_writer: AsyncUserWriterRepository) -> bool:
+        """
+        Schedules re-hashing `password` with current parameters if `user`'s hash is out of date.
+
+        Must return without waiting for the hashing or the write.
+
+        Args:
+            user: The authenticated user, with the hash that was just verified.
+            password: The verified plain text password.
+            user_writer: The writer of the login use case, to persist the new hash with.
+
+        Returns:
+            True if a re-hash was scheduled, False otherwise.
+        """
+        ...
+
+
+class AsyncSpeculativeHasher(Protocol):
+    """
+    Async interface for hashing passwords in the background while a flow carries on (see `SpeculativeHasher`).
+    """
+    async def start(self, password: str) -> str:
+        """
+        Starts hashing `password` in the background.
+
+        Args:
+            password: The plain text password to hash.
+
+        Returns:
+            A placeholder for the hash. It holds no information about the password.
+        """
+        ...
+
+    async def attach(self, placeholder: str, on_ready: Callable[[str], Any]) -> None:
+        """
+        Calls `on_ready(hash)` on the event loop once the hash for `placeholder` is
+        computed; an awaitable result is run as a task.
+
+        Args:
+            placeholder: A placeholder returned by `start()`.
+            on_ready: Receives the hash.
+        """
+        ...
+
+    async def resolve(self, password_hash: str) -> Optional[str]:
+        """
+        Returns the hash for a placeholder, waiting for it if needed.
+
+        Args:
+            password_hash: A stored hash, or a placeholder returned by `start()`.
+
+        Returns:
+            `password_hash` itself if it is not a placeholder, the computed hash
+            otherwise, or None if this hasher does not know the placeholder.
+        """
+        ...
@@ -0,0 +1,17 @@
+from typing import Protocol
+
+class AsyncPasswordScreener(Protocol):
+    """
+    Async interface for rejecting passwords known from data breaches (see `PasswordScreener`).
+    """
+    async def is_breached(self, password: str) -> bool:
+        """
+        Checks a password against a list of breached passwords.
+
+        Args:
+            password: The plain text password.
+
+        Returns:
+            True if the password is (probably) breached, False otherwise.
+        """
+        ...
@@ -0,0 +1,75 @@
+from typing import Protocol, Sequence
+from uuid import UUID
+from authkit.ports.session_service import AuthSession
+
+class AsyncAuthSessionService(Protocol):
+    """
+    Async interface for Token Management (see `AuthSessionService`).
+    """
+
+    async def issue(self, user_id: UUID, creds_version: int) -> AuthSession: 
+        """
+        Generates and issues a new authentication token for a user.
+        
+        Args:
+            user_id (UUID): The unique ID of the user.
+            creds_version (int): The current security version of the user's credentials.
+            
+        Returns:
+            AuthSession: A simplified object containing the token string and ID.
+        """
+        ...
+        
+    async def verify(self, session_token: str, creds_version: int, user_id: UUID) -> bool: 
+        """
+        Validates an incoming token string.
+        
+        Args:
+            session_token (str): The raw token string to verify.
+            creds_version (int): The current credential version from the User entity.
+            user_id (UUID): The user the token must have been issued to.
+            
+        Returns:
+            bool: True if valid, False if expired, tampered, obsolete or issued to another user.
+        """
+        ...
+        
+    async def revoke(self, user_id: UUID, session_id: UUID) -> bool: 
+        """
+        Revokes a single specific session.
+        
+        Args:
+            user_id (UUID): The owner of the session.
+            session_id (UUID): The unique ID of the session to revoke.
+            
+        Returns:
+            bool: True if successfully revoked, False if the session is unknown
+                or not owned by `user_id` (nothing is revoked then).
+        """
+        ...
+        
+    async def revoke_all(self, user_id: UUID) -> None: 
+        """
+        Global Logout: Revokes ALL tokens for a given user.
+        
+        Args:
+            user_id (UUID): The user to globally log out.
+        """
+        ...
+
+
+class AsyncBatchAuthSessionService(AsyncAuthSessionService, Protocol):
+    """
+    Async interface for verifying many tokens in one call (see `BatchAuthSessionService`).
+    """
+    async def verify_many(self, items: Sequence[tuple[str, int, UUID]]) -> list[bool]:
+        """
+        Validates a batch of tokens, each against its own credentials version and owner.
+
+        Args:
+            items: `(session_token, creds_version, user_id)` triples.
+
+        Returns:
+            One result per item, in order.
+        """
+        ...
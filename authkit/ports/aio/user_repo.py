@@ -0,0 +1,106 @@
+from typing import Iterable, Mapping, Protocol
+from uuid import UUID
+from authkit.domain import User
+
+class AsyncUserReaderRepository(Protocol):
+    """
+    Async interface for user data persistence (see `UserReaderRepository`).
+    """
+    async def get_by_identifier(self, identifier: str) -> User | None:
+        """
+        Retrieves a user by their identifier (e.g., email or username).
+
+        Args:
+            identifier: The user's unique identifier.
+
+        Returns:
+            The User object if found, None otherwise.
+        """
+        ...
+
+    async def get_by_id(self, user_id: UUID) -> User | None:
+        """
+        Retrieves a user by their unique ID.
+
+        Args:
+            user_id: The user's UUID.
+
+        Returns:
+            The User object if found, None otherwise.
+        """
+        ...
+
+class AsyncBatchUserReaderRepository(AsyncUserReaderRepository, Protocol):
+    """
+    Async interface for retrieving many users in one call (see `BatchUserReaderRepository`).
+    """
+    async def get_many_by_id(self, user_ids: Iterable[UUID]) -> Mapping[UUID, User]:
+        """
+        Retrieves several users by their unique IDs.
+
+        Args:
+            user_ids: The users' UUIDs.
+
+        Returns:
+            The users found, by ID; unknown IDs are left out.
+        """
+        ...
+
+class AsyncUserWriterRepository(Protocol):
+    """
+    Async interface for user data modification (see `UserWriterRepository`).
+    """
+    async def add(self, user: User) -> User:
+        """
+        Persists a new user.
+
+        Args:
+            user: The User object to add.
+
+        Returns:
+            The added User object.
+        """
+        ...
+
+    async def update_last_login(self, user_id: UUID) -> None:
+        """
+        Updates the last login timestamp for a user.
+
+        Args:
+            user_id: The ID of the user.
+        """
+        ...
+
+    async def delete(self, user_id: UUID) -> None:
+        """
+        Deletes (or soft-deletes) a user.
+
+        Args:
+            user_id: The ID of the user to delete.
+        """
+        ...
+
+    async def increment_credentials_version(self, user_id: UUID) -> None:
+        """
+        Increments the user's credential version, invalidating existing tokens.
+
+        Args:
+            user_id: The ID of the user.
+        """
+        ...
+
+    async def change_password(self, user_id: UUID, new_password_hash: str) -> None:
+        """
+        Updates the user's password hash.
+
+        Args:
+            user_id: The ID of the user.
+            new_password_hash: The new hashed password.
+        """
+        ...
+
+class AsyncUserRepository(AsyncUserReaderRepository, AsyncUserWriterRepository, Protocol):
+    """
+    Composite async interface combining both read and write operations for users.
+    """
+    ...
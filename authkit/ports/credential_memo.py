@@ -0,0 +1,39 @@
+from typing import Protocol
+from uuid import UUID
+
+from authkit.domain import User
+from authkit.ports.passwd_manager import PasswordManager
+
+
+class CredentialMemo(Protocol):
+    """
+    Interface for remembering recent password verification results.
+
+    Lets repeated logins with the same credentials skip the password hashing.
+    Entries must be bound to the user's current `password_hash` and
+    `credentials_version`, so a changed password or a bumped version is never
+    answered from the memo.
+    """
+    def verify(self, identifier: str, password: str, user: User, password_manager: PasswordManager) -> bool:
+        """
+        Verifies `password` against `user.password_hash`, from the memo when possible.
+
+        Args:
+            identifier: The identifier the user logged in with.
+            password: The plain text password.
+            user: The user found for `identifier`.
+            password_manager: Verifies the password on a memo miss.
+
+        Returns:
+            True if the password matches the user's hash, False otherwise.
+        """
+        ...
+
+    def invalidate(self, user_id: UUID) -> None:
+        """
+        Forgets every entry of a user.
+
+        Args:
+            user_id: The ID of the user.
+        """
+        ...
@@ -6,6 +6,12 @@ class RegistrationIntentStore(Protocol):
     """
     Interface for storing temporary registration data.
     Suggestion: save the otp using key like intent:registration:{intent.id}
+
+    Stores may also implement `update(key: UUID, intent: RegistrationIntent) -> None`,
+    replacing a stored intent without changing its expiry (and doing nothing if it
+    is gone). A `SpeculativeHasher` uses it to attach the password hash once computed.
+    The existence check and the write must be atomic: `update` can run while the
+    flow deletes the intent, and must not recreate it.
     """
     def store(self, intent: RegistrationIntent) -> UUID: 
         """
@@ -1,4 +1,7 @@
-from typing import Protocol
+from typing import Any, Callable, Optional, Protocol
+
+from authkit.domain import User
+from authkit.ports.user_repo_cqrs import UserWriterRepository
 
 class PasswordManager(Protocol):
     """
@@ -27,4 +30,94 @@ class PasswordManager(Protocol):
         Returns:
             True if the password matches the hash, False otherwise.
         """
-        ...
\ No newline at end of file
+        ...
+
+class RehashablePasswordManager(PasswordManager, Protocol):
+    """
+    A `PasswordManager` that can tell when a stored hash is out of date.
+
+    Optional capability: login flows configured with a `PasswordRehasher`
+    only upgrade hashes of managers implementing it.
+    """
+    def needs_rehash(self, hashed_password: str) -> bool:
+        """
+        Checks whether a hash was made with other parameters (or another
+        algorithm) than the ones used for new hashes.
+
+        Must be cheap: it only inspects the hash, it never hashes.
+
+        Args:
+            hashed_password: The stored hash.
+
+        Returns:
+            True if the hash should be replaced by a fresh `hash()` of the password.
+        """
+        ...
+
+
+class PasswordRehasher(Protocol):
+    """
+    Interface for upgrading password hashes after a successful login.
+    """
+    def submit(self, user: User, password: str, user_writer: UserWriterRepository) -> bool:
+        """
+        Schedules re-hashing `password` with current parameters if `user`'s hash is out of date.
+
+        Called on the login path right after the password was verified: it must
+        return quickly and do the hashing and persisting in the background.
+
+        Args:
+            user: The authenticated user, with the hash that was just verified.
+            password: The verified plain text password.
+            user_writer: The writer of the login use case, to persist the new hash with.
+
+        Returns:
+            True if a re-hash was scheduled, False otherwise.
+        """
+        ...
+
+
+class SpeculativeHasher(Protocol):
+    """
+    Interface for hashing passwords in the background while a flow carries on.
+
+    `start()` returns a placeholder to store in place of the hash; the real
+    hash is handed to the `attach()` callback once computed, and `resolve()`
+    returns it (waiting if needed) when it is finally needed.
+    """
+    def start(self, password: str) -> str:
+        """
+        Starts hashing `password` in the background.
+
+        Args:
+            password: The plain text password to hash.
+
+        Returns:
+            A placeholder for the hash. It holds no information about the password.
+        """
+        ...
+
+    def attach(self, placeholder: str, on_ready: Callable[[str], Any]) -> None:
+        """
+        Calls `on_ready(hash)` once the hash for `placeholder` is computed, e.g. to
+        write it into the stored record holding the placeholder.
+
+        Args:
+            placeholder: A placeholder returned by `start()`.
+            on_ready: Receives the hash; may return an awaitable under asyncio.
+        """
+        ...
+
+    def resolve(self, password_hash: str) -> Optional[str]:
+        """
+        Returns the hash for a placeholder, waiting for it if needed.
+
+        Args:
+            password_hash: A stored hash, or a placeholder returned by `start()`.
+
+        Returns:
+            `password_hash` itself if it is not a placeholder, the computed hash
+            otherwise, or None if this hasher does not know the placeholder
+            (e.g. it was started by another process and never attached).
+        """
+        ...
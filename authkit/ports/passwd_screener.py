@@ -0,0 +1,20 @@
+from typing import Protocol
+
+class PasswordScreener(Protocol):
+    """
+    Interface for rejecting passwords known from data breaches.
+    """
+    def is_breached(self, password: str) -> bool:
+        """
+        Checks a password against a list of breached passwords.
+
+        Called before a new password is hashed (registration, password change
+        and reset), so it should answer without network round trips.
+
+        Args:
+            password: The plain text password.
+
+        Returns:
+            True if the password is (probably) breached, False otherwise.
+        """
+        ...
@@ -0,0 +1,95 @@
+from dataclasses import dataclass, field
+from typing import Protocol
+from uuid import UUID
+
+
+@dataclass(frozen=True)
+class RevocationChanges:
+    """
+    Revocations recorded in a `SyncableRevocationStore` after a cursor.
+
+    Attributes:
+        cursor: Pass it to the next `changes` call to get only newer revocations.
+        sessions: `(session_id, expires_at)` of the revoked sessions.
+        users: `(user_id, revoked_at, expires_at)` of the users' revocation epochs.
+    """
+    cursor: int
+    sessions: list[tuple[UUID, float]] = field(default_factory=list)
+    users: list[tuple[UUID, float, float]] = field(default_factory=list)
+
+
+class SessionRevocationStore(Protocol):
+    """
+    Interface for remembering revoked sessions of a stateless session service.
+
+    Signed tokens stay valid until they expire, so revocations are recorded
+    here and checked on every `verify`. Entries only need to be kept until
+    the tokens they concern would have expired anyway, which keeps the store
+    small. `is_revoked` runs on every `verify`: implementations should answer
+    it without blocking I/O (e.g. in memory, kept in sync by the application),
+    or sit behind a `FilteredRevocationStore`, which only consults them when
+    its in-memory filter matches.
+    """
+    def revoke_session(self, session_id: UUID, expires_at: float) -> None:
+        """
+        Revokes a single session.
+
+        Args:
+            session_id: The ID of the session.
+            expires_at: When the session's token expires (epoch seconds); the
+                entry may be dropped after that.
+        """
+        ...
+
+    def revoke_user(self, user_id: UUID, revoked_at: float, expires_at: float) -> None:
+        """
+        Revokes every session of a user issued before `revoked_at`.
+
+        Args:
+            user_id: The ID of the user.
+            revoked_at: Sessions issued before this time (epoch seconds) are revoked.
+            expires_at: When the last of those sessions expires (epoch seconds);
+                the entry may be dropped after that.
+        """
+        ...
+
+    def is_revoked(self, user_id: UUID, session_id: UUID, issued_at: float) -> bool:
+        """
+        Checks a session against the recorded revocations.
+
+        Args:
+            user_id: The owner of the session.
+            session_id: The ID of the session.
+            issued_at: When the session was issued (epoch seconds).
+
+        Returns:
+            True if the session or all the user's sessions of that age were revoked.
+        """
+        ...
+
+
+class SyncableRevocationStore(SessionRevocationStore, Protocol):
+    """
+    A `SessionRevocationStore` that can list its revocations, to keep local copies in sync.
+
+    Optional capability: `FilteredRevocationStore` loads every live
+    revocation when created and pulls the new ones periodically, so
+    revocations made by other processes (or before a restart) are seen
+    without a lookup per `verify`. Shared stores typically keep a sequence
+    number per entry (e.g. a Redis sorted set scored by an `INCR` counter).
+    """
+    def changes(self, cursor: int) -> RevocationChanges:
+        """
+        Lists the revocations recorded after `cursor`.
+
+        Entries whose tokens have all expired may be left out. A store that
+        lost its history (e.g. restarted) returns a cursor below `cursor`:
+        callers then list everything again from 0.
+
+        Args:
+            cursor: 0 for every live revocation, else the cursor of the previous call.
+
+        Returns:
+            The newer revocations and the cursor to pass next time.
+        """
+        ...
@@ -1,4 +1,4 @@
-from typing import Protocol
+from typing import Protocol, Sequence
 from uuid import UUID
 
 class AuthSession(Protocol):
@@ -37,7 +37,7 @@ class AuthSessionService(Protocol):
         """
         ...
         
-    def verify(self, session_token: str, creds_version: int) -> bool: 
+    def verify(self, session_token: str, creds_version: int, user_id: UUID) -> bool: 
         """
         Validates an incoming token string.
         
@@ -45,13 +45,17 @@ class AuthSessionService(Protocol):
         1. Signature validity.
         2. Expiration time.
         3. Credential Version matching (session version == user version).
+        4. Ownership: the session was issued to `user_id`. The caller's user ID
+           usually comes from the request, so without this check any valid
+           token would authenticate as any user.
         
         Args:
             token (str): The raw token string to verify.
             creds_version (int): The current credential version from the User entity.
+            user_id (UUID): The user the token must have been issued to.
             
         Returns:
-            bool: True if valid, False if expired, tampered, or obsolete.
+            bool: True if valid, False if expired, tampered, obsolete or issued to another user.
         """
         ...
         
@@ -64,7 +68,8 @@ class AuthSessionService(Protocol):
             session_id (UUID): The unique ID of the session to revoke.
             
         Returns:
-            bool: True if successfully revoked.
+            bool: True if successfully revoked, False if the session is unknown
+                or not owned by `user_id` (nothing is revoked then).
         """
         ...
         
@@ -78,4 +83,26 @@ class AuthSessionService(Protocol):
         Args:
             user_id (UUID): The user to globally log out.
         """
-        ...
\ No newline at end of file
+        ...
+
+
+class BatchAuthSessionService(AuthSessionService, Protocol):
+    """
+    An `AuthSessionService` that verifies many tokens in one call.
+
+    Optional capability: `authenticate_many` uses it when present and falls
+    back to one `verify` per token otherwise. Implementations should share
+    the work across the batch, e.g. fetch every stored session in a single
+    round trip.
+    """
+    def verify_many(self, items: Sequence[tuple[str, int, UUID]]) -> list[bool]:
+        """
+        Validates a batch of tokens, each against its own credentials version and owner.
+
+        Args:
+            items: `(session_token, creds_version, user_id)` triples.
+
+        Returns:
+            One result per item, in order, as `verify` would return it.
+        """
+        ...
@@ -0,0 +1,90 @@
+from dataclasses import dataclass
+from typing import Iterable, Mapping, Optional, Protocol
+from uuid import UUID
+
+
+@dataclass(frozen=True)
+class SessionRecord:
+    """
+    A server-side session, as kept by a `SessionStore`.
+
+    Attributes:
+        session_id: The ID of the session.
+        user_id: The owner of the session.
+        credentials_version: The user's credentials version when the session was issued.
+        token_digest: SHA-256 of the token secret; the token itself is never stored.
+        expires_at: When the session expires (epoch seconds).
+    """
+    session_id: UUID
+    user_id: UUID
+    credentials_version: int
+    token_digest: bytes
+    expires_at: int
+
+
+class SessionStore(Protocol):
+    """
+    Interface for storing server-side sessions with a per-user index.
+
+    Besides the records themselves, implementations keep the set of session
+    IDs of every user, so `remove_user` touches only that user's sessions
+    (one batched delete) instead of scanning the whole store. Expired
+    records must not be returned; they may be dropped lazily.
+    """
+    def add(self, record: SessionRecord) -> None:
+        """
+        Stores a session and adds it to its user's index.
+
+        Args:
+            record: The session to store.
+        """
+        ...
+
+    def get(self, session_id: UUID) -> Optional[SessionRecord]:
+        """
+        Finds a session.
+
+        Args:
+            session_id: The ID of the session.
+
+        Returns:
+            The session, or None if unknown, removed or expired.
+        """
+        ...
+
+    def get_many(self, session_ids: Iterable[UUID]) -> Mapping[UUID, SessionRecord]:
+        """
+        Finds several sessions at once (one round trip for remote stores).
+
+        Args:
+            session_ids: The IDs of the sessions.
+
+        Returns:
+            The sessions found, by ID; unknown, removed and expired ones are left out.
+        """
+        ...
+
+    def remove(self, user_id: UUID, session_id: UUID) -> bool:
+        """
+        Removes a single session of a user.
+
+        Args:
+            user_id: The owner of the session.
+            session_id: The ID of the session.
+
+        Returns:
+            True if the session existed and belonged to the user.
+        """
+        ...
+
+    def remove_user(self, user_id: UUID) -> int:
+        """
+        Removes every session of a user, through the user's index.
+
+        Args:
+            user_id: The ID of the user.
+
+        Returns:
+            The number of sessions removed.
+        """
+        ...
@@ -1,4 +1,4 @@
-from typing import Protocol
+from typing import Iterable, Mapping, Protocol
 from uuid import UUID
 from authkit.domain import User
 
@@ -28,4 +28,25 @@ class UserReaderRepository(Protocol):
         Returns:
             The User object if found, None otherwise.
         """
-        ...
\ No newline at end of file
+        ...
+
+
+class BatchUserReaderRepository(UserReaderRepository, Protocol):
+    """
+    A `UserReaderRepository` that retrieves many users in one call.
+
+    Optional capability: `authenticate_many` uses it when present and falls
+    back to one `get_by_id` per distinct user otherwise. Implementations
+    should fetch the users in a single query or round trip.
+    """
+    def get_many_by_id(self, user_ids: Iterable[UUID]) -> Mapping[UUID, User]:
+        """
+        Retrieves several users by their unique IDs.
+
+        Args:
+            user_ids: The users' UUIDs.
+
+        Returns:
+            The users found, by ID; unknown IDs are left out.
+        """
+        ...
@@ -1,12 +1,22 @@
 """
 Use cases for account management (deletion, etc.).
 """
-from authkit.usecases.Account.delete_account import DeleteAccountUseCase
-from authkit.usecases.Account.delete_account_with_otp_start import StartDeleteAccountWithOTPUseCase
-from authkit.usecases.Account.delete_account_with_otp_verify import VerifyDeleteAccountWithOTPUseCase
+from typing import TYPE_CHECKING
+from authkit._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from authkit.usecases.Account.delete_account import DeleteAccountUseCase
+    from authkit.usecases.Account.delete_account_with_otp_start import StartDeleteAccountWithOTPUseCase
+    from authkit.usecases.Account.delete_account_with_otp_verify import VerifyDeleteAccountWithOTPUseCase
 
 __all__ = [
     "DeleteAccountUseCase",
     "StartDeleteAccountWithOTPUseCase",
     "VerifyDeleteAccountWithOTPUseCase",
-    ]
\ No newline at end of file
+    ]
+
+__getattr__, __dir__ = lazy_exports(__name__, {
+    "DeleteAccountUseCase": "authkit.usecases.Account.delete_account",
+    "StartDeleteAccountWithOTPUseCase": "authkit.usecases.Account.delete_account_with_otp_start",
+    "VerifyDeleteAccountWithOTPUseCase": "authkit.usecases.Account.delete_account_with_otp_verify",
+})
@@ -1,18 +1,26 @@
 """
 Use cases for authentication flows (login, logout, registration).
 """
-from authkit.usecases.Authentication.login import LoginUseCase
-from authkit.usecases.Authentication.login_with_otp_start import StartLoginWithOTPUseCase
-from authkit.usecases.Authentication.login_with_otp_verify import VerifyLoginWithOTPUseCase
-from authkit.usecases.Authentication.logout import LogoutUseCase
-from authkit.usecases.Authentication.logout_all import LogoutAllUseCase
-from authkit.usecases.Authentication.logout_all_with_otp_start import StartLogoutAllWithOTPUseCase
-from authkit.usecases.Authentication.logout_all_with_otp_verify import VerifyLogoutAllWithOTPUseCase
-from authkit.usecases.Authentication.registration import RegistrationUseCase
-from authkit.usecases.Authentication.registration_with_otp_start import StartRegistrationWithOTPUseCase            
-from authkit.usecases.Authentication.registration_with_otp_verify import VerifyRegistrationWithOTPUseCase
+from typing import TYPE_CHECKING
+from authkit._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from authkit.usecases.Authentication.authenticate import AuthenticateUseCase
+    from authkit.usecases.Authentication.authenticate_many import AuthenticateManyUseCase
+    from authkit.usecases.Authentication.login import LoginUseCase
+    from authkit.usecases.Authentication.login_with_otp_start import StartLoginWithOTPUseCase
+    from authkit.usecases.Authentication.login_with_otp_verify import VerifyLoginWithOTPUseCase
+    from authkit.usecases.Authentication.logout import LogoutUseCase
+    from authkit.usecases.Authentication.logout_all import LogoutAllUseCase
+    from authkit.usecases.Authentication.logout_all_with_otp_start import StartLogoutAllWithOTPUseCase
+    from authkit.usecases.Authentication.logout_all_with_otp_verify import VerifyLogoutAllWithOTPUseCase
+    from authkit.usecases.Authentication.registration import RegistrationUseCase
+    from authkit.usecases.Authentication.registration_with_otp_start import StartRegistrationWithOTPUseCase
+    from authkit.usecases.Authentication.registration_with_otp_verify import VerifyRegistrationWithOTPUseCase
 
 __all__ = [
+    "AuthenticateUseCase",
+    "AuthenticateManyUseCase",
     "LoginUseCase",
     "StartLoginWithOTPUseCase",
     "VerifyLoginWithOTPUseCase",
@@ -23,4 +31,19 @@ __all__ = [
     "RegistrationUseCase",
     "StartRegistrationWithOTPUseCase",
     "VerifyRegistrationWithOTPUseCase",
-]
\ No newline at end of file
+]
+
+__getattr__, __dir__ = lazy_exports(__name__, {
+    "AuthenticateUseCase": "authkit.usecases.Authentication.authenticate",
+    "AuthenticateManyUseCase": "authkit.usecases.Authentication.authenticate_many",
+    "LoginUseCase": "authkit.usecases.Authentication.login",
+    "StartLoginWithOTPUseCase": "authkit.usecases.Authentication.login_with_otp_start",
+    "VerifyLoginWithOTPUseCase": "authkit.usecases.Authentication.login_with_otp_verify",
+    "LogoutUseCase": "authkit.usecases.Authentication.logout",
+    "LogoutAllUseCase": "authkit.usecases.Authentication.logout_all",
+    "StartLogoutAllWithOTPUseCase": "authkit.usecases.Authentication.logout_all_with_otp_start",
+    "VerifyLogoutAllWithOTPUseCase": "authkit.usecases.Authentication.logout_all_with_otp_verify",
+    "RegistrationUseCase": "authkit.usecases.Authentication.registration",
+    "StartRegistrationWithOTPUseCase": "authkit.usecases.Authentication.registration_with_otp_start",
+    "VerifyRegistrationWithOTPUseCase": "authkit.usecases.Authentication.registration_with_otp_verify",
+})
@@ -0,0 +1,61 @@
+from authkit.ports.user_repo_cqrs import UserReaderRepository
+from authkit.ports.session_service import AuthSessionService
+from authkit.domain import User
+from typing import Iterable, Optional
+from uuid import UUID
+
+from authkit.core import Registry
+
+@Registry.register("authenticate_many")
+class AuthenticateManyUseCase:
+    """
+    Use case for authenticating a batch of requests, e.g. the messages of a
+    websocket fan-out or the items of a bulk API call.
+    """
+    def __init__(self,
+                 user_reader: UserReaderRepository,
+                 session_service: AuthSessionService):
+        self.user_reader = user_reader
+        self.session_service = session_service
+
+    def execute(self, requests: Iterable[tuple[UUID, str]]) -> list[Optional[User]]:
+        """
+        Verifies many session tokens, each against its user's current credentials version.
+
+        The distinct users are looked up in a single `get_many_by_id` call if
+        the user reader supports it (`BatchUserReaderRepository`), with one
+        `get_by_id` per user otherwise. The tokens are then verified in a
+        single `verify_many` call if the session service supports it
+        (`BatchAuthSessionService`), with one `verify` per token otherwise.
+
+        Args:
+            requests: `(user_id, session_token)` pairs.
+
+        Returns:
+            For every request, in order, the authenticated User, or None if the
+            user is not found or the token is invalid, expired or revoked.
+        """
+        requests = list(requests)
+        user_ids = list(dict.fromkeys(user_id for user_id, _ in requests))
+        get_many_by_id = getattr(self.user_reader, 'get_many_by_id', None)
+        if get_many_by_id is not None:
+            found = get_many_by_id(user_ids) if user_ids else {}
+            users = {user_id: found.get(user_id) for user_id in user_ids}
+        else:
+            users = {user_id: self.user_reader.get_by_id(user_id) for user_id in user_ids}
+        pending = [(index, session_token, users[user_id])
+                   for index, (user_id, session_token) in enumerate(requests) if users[user_id]]
+        items = [(session_token, user.credentials_version, user.id) for _, session_token, user in pending]
+
+        verify_many = getattr(self.session_service, 'verify_many', None)
+        if verify_many is not None:
+            valid = verify_many(items)
+        else:
+            valid = [self.session_service.verify(session_token, creds_version, user_id)
+                     for session_token, creds_version, user_id in items]
+
+        results: list[Optional[User]] = [None] * len(requests)
+        for (index, _, user), ok in zip(pending, valid):
+            if ok:
+                results[index] = user
+        return results
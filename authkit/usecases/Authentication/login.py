@@ -1,7 +1,9 @@
 from authkit.ports.user_repo_cqrs import UserReaderRepository , UserWriterRepository
-from authkit.ports.passwd_manager import PasswordManager 
+from authkit.ports.passwd_manager import PasswordManager , PasswordRehasher
 from authkit.ports.session_service import AuthSessionService , AuthSession
-from authkit.exceptions import InvalidCredentialsError
+from authkit.ports.credential_memo import CredentialMemo
+from authkit.domain import AuthErrorCode, Result
+from typing import Optional
 
 from authkit.core import Registry
 
@@ -15,12 +17,16 @@ class LoginUseCase:
                  user_writer: UserWriterRepository,
                  password_manager: PasswordManager,
                  session_service: AuthSessionService,
+                 password_rehasher: Optional[PasswordRehasher] = None,
+                 credential_memo: Optional[CredentialMemo] = None,
                  ):
 
         self.user_reader = user_reader
         self.password_manager = password_manager
         self.session_service = session_service
         self.user_writer = user_writer
+        self.password_rehasher = password_rehasher
+        self.credential_memo = credential_memo
 
     def execute(self, identifier: str, password: str ) -> AuthSession:
         """
@@ -36,12 +42,33 @@ class LoginUseCase:
         Raises:
             InvalidCredentialsError: If the user is not found or password is incorrect.
         """
+        # Looked up on the class: interceptors wrap the instance's methods, not this call.
+        result = type(self).try_execute(self, identifier, password)
+        return result.unwrap()
+
+    def try_execute(self, identifier: str, password: str) -> Result[AuthSession]:
+        """
+        Same as `execute`, but reports invalid credentials instead of raising.
+        
+        Args:
+            identifier: The user's identifier (email/username).
+            password: The user's password.
+            
+        Returns:
+            A Result holding the AuthSession, or the error code
+            USER_NOT_FOUND / INVALID_PASSWORD.
+        """
         user = self.user_reader.get_by_identifier(identifier)
         if not user:
-            raise InvalidCredentialsError("User not found")
-        valid = self.password_manager.verify(password, user.password_hash)
+            return Result.failure(AuthErrorCode.USER_NOT_FOUND)
+        if self.credential_memo is not None:
+            valid = self.credential_memo.verify(identifier, password, user, self.password_manager)
+        else:
+            valid = self.password_manager.verify(password, user.password_hash)
         if not valid:
-            raise InvalidCredentialsError("Invalid password")
+            return Result.failure(AuthErrorCode.INVALID_PASSWORD)
         token = self.session_service.issue(user_id=user.id, creds_version=user.credentials_version)
         self.user_writer.update_last_login(user_id=user.id)
-        return token
\ No newline at end of file
+        if self.password_rehasher is not None:
+            self.password_rehasher.submit(user, password, self.user_writer)
+        return Result.success(token)
\ No newline at end of file
@@ -1,11 +1,12 @@
 from authkit.ports.otp.otp_manager import OTPManager
 from authkit.ports.otp.otp_store import OTPStore
-from authkit.ports.user_repo_cqrs import UserReaderRepository
-from authkit.ports.passwd_manager import PasswordManager
+from authkit.ports.user_repo_cqrs import UserReaderRepository, UserWriterRepository
+from authkit.ports.passwd_manager import PasswordManager, PasswordRehasher
 from authkit.ports.intents.user_id_intent_store import  UserIDIntentStore
-from authkit.exceptions.auth import InvalidCredentialsError 
-from authkit.domain import OTPPurpose
+from authkit.ports.credential_memo import CredentialMemo
+from authkit.domain import OTPPurpose, AuthErrorCode, Result
 from uuid import UUID
+from typing import Optional
 
 
 from authkit.core import Registry
@@ -22,12 +23,18 @@ class StartLoginWithOTPUseCase:
         intent_store: UserIDIntentStore,
         otp_store: OTPStore,
         otp_manager: OTPManager,
+        user_writer: Optional[UserWriterRepository] = None,
+        password_rehasher: Optional[PasswordRehasher] = None,
+        credential_memo: Optional[CredentialMemo] = None,
     ):
         self.user_reader = user_reader
         self.password_manager = password_manager
         self.otp_store = otp_store
         self.otp_manager = otp_manager
         self.intent_store = intent_store
+        self.user_writer = user_writer
+        self.password_rehasher = password_rehasher
+        self.credential_memo = credential_memo
 
     def execute(self, identifier: str, password: str) -> UUID:
         """
@@ -43,12 +50,35 @@ class StartLoginWithOTPUseCase:
         Raises:
             InvalidCredentialsError: If credentials are invalid.
         """
+        # Looked up on the class: interceptors wrap the instance's methods, not this call.
+        result = type(self).try_execute(self, identifier, password)
+        return result.unwrap()
+
+    def try_execute(self, identifier: str, password: str) -> Result[UUID]:
+        """
+        Same as `execute`, but reports invalid credentials instead of raising.
+        
+        Args:
+            identifier: The user's identifier.
+            password: The user's password.
+            
+        Returns:
+            A Result holding the verification token, or the error code
+            USER_NOT_FOUND / INVALID_PASSWORD.
+        """
         user = self.user_reader.get_by_identifier(identifier=identifier)
         if not user:
-            raise InvalidCredentialsError("User not found")
-        if not self.password_manager.verify(password=password, 
-                                                    hashed_password=user.password_hash):
-            raise InvalidCredentialsError("Invalid password")
+            return Result.failure(AuthErrorCode.USER_NOT_FOUND)
+        if self.credential_memo is not None:
+            valid = self.credential_memo.verify(identifier, password, user, self.password_manager)
+        else:
+            valid = self.password_manager.verify(password=password,
+                                                 hashed_password=user.password_hash)
+        if not valid:
+            return Result.failure(AuthErrorCode.INVALID_PASSWORD)
+        # Rehashed hashes are stored through the writer: without one, nothing to do.
+        if self.password_rehasher is not None and self.user_writer is not None:
+            self.password_rehasher.submit(user, password, self.user_writer)
         verification_token = self.intent_store.store(intent=user.id)
         otp = self.otp_manager.generate()
         self.otp_store.store(token=verification_token,
@@ -58,4 +88,4 @@ class StartLoginWithOTPUseCase:
                                     code=otp,
                                     metadata=user.metadata,
                                     purpose=OTPPurpose.MFA)
-        return verification_token
\ No newline at end of file
+        return Result.success(verification_token)
\ No newline at end of file
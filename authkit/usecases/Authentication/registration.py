@@ -1,8 +1,10 @@
 from authkit.ports.user_repo_cqrs import UserWriterRepository
 from authkit.ports.passwd_manager import PasswordManager
+from authkit.ports.passwd_screener import PasswordScreener
+from authkit.exceptions.auth import BreachedPasswordError
 from authkit.domain import User
 from uuid import uuid4
-from typing import Any
+from typing import Any, Optional
 
 from authkit.core import Registry
 
@@ -11,9 +13,11 @@ class RegistrationUseCase:
     """
     Use case for registering a new user locally.
     """
-    def __init__(self , user_writer: UserWriterRepository , password_manager: PasswordManager):
+    def __init__(self , user_writer: UserWriterRepository , password_manager: PasswordManager,
+                 password_screener: Optional[PasswordScreener] = None):
         self.user_writer = user_writer
         self.password_manager = password_manager
+        self.password_screener = password_screener
     
     def execute(self, identifier: str, password: str, metadata: dict[str, Any] | None = None):
         """
@@ -26,7 +30,12 @@ class RegistrationUseCase:
             
         Returns:
             The newly created User object.
+
+        Raises:
+            BreachedPasswordError: If the password appears in a data breach.
         """
+        if self.password_screener is not None and self.password_screener.is_breached(password):
+            raise BreachedPasswordError("Password appears in a data breach")
         hashed_password = self.password_manager.hash(password)
         user = User(
             id=uuid4(),
@@ -2,11 +2,13 @@ from authkit.ports.intents.registration_intent_store import RegistrationIntentSt
 from authkit.ports.otp.otp_store import OTPStore , OTPPurpose
 from authkit.ports.otp.otp_manager import OTPManager
 from authkit.ports.user_repo_cqrs import UserReaderRepository
-from authkit.ports.passwd_manager import PasswordManager
-from authkit.exceptions.auth import ConflictError
+from authkit.ports.passwd_manager import PasswordManager, SpeculativeHasher
+from authkit.ports.passwd_screener import PasswordScreener
+from authkit.exceptions.auth import ConflictError, BreachedPasswordError
 from authkit.domain import  RegistrationIntent
 from uuid import UUID
-from typing import Any
+from typing import Any, Optional
+from dataclasses import replace
 
 from authkit.core import Registry
 
@@ -20,17 +22,24 @@ class StartRegistrationWithOTPUseCase:
                  password_manager: PasswordManager,
                  registration_intent_store: RegistrationIntentStore,
                  otp_store: OTPStore,
-                 otp_manager: OTPManager):
+                 otp_manager: OTPManager,
+                 speculative_hasher: Optional[SpeculativeHasher] = None,
+                 password_screener: Optional[PasswordScreener] = None):
         self.user_reader = user_reader
         self.password_manager = password_manager
         self.registration_intent_store = registration_intent_store
         self.otp_store = otp_store
         self.otp_manager = otp_manager
         self.otp_purpose = OTPPurpose.REGISTRATION
+        self.speculative_hasher = speculative_hasher
+        self.password_screener = password_screener
 
     def execute(self, identifier: str, password: str, metadata: dict[str, Any] | None = None) -> UUID:
         """
         Validates new user details and sends a verification OTP.
+
+        With a `speculative_hasher`, the password is hashed in the background
+        and the OTP is sent without waiting for it.
         
         Args:
             identifier: The user's identifier.
@@ -42,11 +51,18 @@ class StartRegistrationWithOTPUseCase:
             
         Raises:
             ConflictError: If the user already exists.
+            BreachedPasswordError: If the password appears in a data breach.
         """
         user = self.user_reader.get_by_identifier(identifier=identifier)
         if user is None:
             raise ConflictError("User already exists")
-        hashed_password = self.password_manager.hash(password=password)
+        if self.password_screener is not None and self.password_screener.is_breached(password):
+            raise BreachedPasswordError("Password appears in a data breach")
+        if self.speculative_hasher is not None:
+            # Placeholder now, hash attached to the intent once computed in the background.
+            hashed_password = self.speculative_hasher.start(password)
+        else:
+            hashed_password = self.password_manager.hash(password=password)
         
         # Create intent (no ID or OTP code here, as per domain definition)
         intent = RegistrationIntent(
@@ -58,6 +74,13 @@ class StartRegistrationWithOTPUseCase:
         
         # Store intent to get the token (ID)
         token = self.registration_intent_store.store(intent=intent)
+        if self.speculative_hasher is not None:
+            update = getattr(self.registration_intent_store, 'update', None)
+            if update is not None:
+                self.speculative_hasher.attach(
+                    hashed_password,
+                    lambda password_hash: update(key=token, intent=replace(intent, password_hash=password_hash)),
+                )
         
         # Generate and store OTP
         otp_code = self.otp_manager.generate()
@@ -1,9 +1,11 @@
 from authkit.ports.intents.registration_intent_store import RegistrationIntentStore
 from authkit.ports.otp.otp_store import OTPStore , OTPPurpose
 from authkit.ports.user_repo_cqrs import UserWriterRepository
+from authkit.ports.passwd_manager import SpeculativeHasher
 from authkit.exceptions.auth import InvalidOTPError 
 from authkit.domain import User
 from uuid import UUID , uuid4
+from typing import Optional
 from authkit.core import Registry
 
 @Registry.register("register_otp_verify")
@@ -14,10 +16,12 @@ class VerifyRegistrationWithOTPUseCase:
     def __init__(self, 
                  user_writer: UserWriterRepository,
                  registration_intent_store: RegistrationIntentStore,
-                 otp_store: OTPStore):
+                 otp_store: OTPStore,
+                 speculative_hasher: Optional[SpeculativeHasher] = None):
         self.registration_intent_store = registration_intent_store
         self.otp_store = otp_store
         self.user_writer = user_writer
+        self.speculative_hasher = speculative_hasher
     
     def execute(self, verification_token: UUID , code: str) -> User:
         """
@@ -31,7 +35,8 @@ class VerifyRegistrationWithOTPUseCase:
             The newly created User object.
             
         Raises:
-            InvalidOTPError: If OTP or intent is invalid.
+            InvalidOTPError: If OTP or intent is invalid, or the password hash
+                computed in the background is not available.
         """
         intent = self.registration_intent_store.get(key=verification_token)
         if intent is None:
@@ -39,10 +44,16 @@ class VerifyRegistrationWithOTPUseCase:
         valid = self.otp_store.verify(token=verification_token, code=code, purpose=OTPPurpose.REGISTRATION)
         if not valid:
             raise InvalidOTPError("Invalid OTP")
+        password_hash = intent.password_hash
+        if self.speculative_hasher is not None:
+            # Waits for the background hash if it was not attached to the intent yet.
+            password_hash = self.speculative_hasher.resolve(password_hash)
         self.registration_intent_store.delete(key=verification_token)
+        if password_hash is None:
+            raise InvalidOTPError("Registration expired, please start again")
         user = User(id=uuid4(),
                     identifier=intent.identifier,
-                    password_hash=intent.password_hash,
+                    password_hash=password_hash,
                     credentials_version=intent.credentials_version,
                     metadata=intent.metadata)
         user = self.user_writer.add(user=user)
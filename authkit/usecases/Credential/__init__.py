@@ -1,12 +1,22 @@
 """
 Use cases for credential management (password change, reset).
 """
-from authkit.usecases.Credential.change_password_cqrs import ChangePasswordUseCase
-from authkit.usecases.Credential.forget_password_start import StartForgetPasswordUseCase
-from authkit.usecases.Credential.forget_password_verify import VerifyForgetPasswordUseCase
+from typing import TYPE_CHECKING
+from authkit._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from authkit.usecases.Credential.change_password_cqrs import ChangePasswordUseCase
+    from authkit.usecases.Credential.forget_password_start import StartForgetPasswordUseCase
+    from authkit.usecases.Credential.forget_password_verify import VerifyForgetPasswordUseCase
 
 __all__ = [
     "ChangePasswordUseCase",
     "StartForgetPasswordUseCase",
     "VerifyForgetPasswordUseCase",
-]
\ No newline at end of file
+]
+
+__getattr__, __dir__ = lazy_exports(__name__, {
+    "ChangePasswordUseCase": "authkit.usecases.Credential.change_password_cqrs",
+    "StartForgetPasswordUseCase": "authkit.usecases.Credential.forget_password_start",
+    "VerifyForgetPasswordUseCase": "authkit.usecases.Credential.forget_password_verify",
+})
@@ -1,8 +1,10 @@
 from authkit.ports.passwd_manager import PasswordManager
 from authkit.ports.user_repo_cqrs import UserReaderRepository , UserWriterRepository
 from authkit.ports.session_service import AuthSessionService
-from authkit.exceptions import NotFoundError , InvalidCredentialsError
+from authkit.ports.passwd_screener import PasswordScreener
+from authkit.exceptions import NotFoundError , InvalidCredentialsError , BreachedPasswordError
 from uuid import UUID
+from typing import Optional
 
 from authkit.core import Registry
 
@@ -15,11 +17,13 @@ class ChangePasswordUseCase:
                  user_reader: UserReaderRepository,
                  user_writer: UserWriterRepository,
                  password_manager: PasswordManager,
-                 session_service: AuthSessionService):
+                 session_service: AuthSessionService,
+                 password_screener: Optional[PasswordScreener] = None):
         self.user_reader = user_reader
         self.user_writer = user_writer
         self.password_manager = password_manager
         self.session_service = session_service
+        self.password_screener = password_screener
     
     def execute(self, user_id: UUID, old_password: str, new_password: str) -> None:
         """
@@ -36,9 +40,12 @@ class ChangePasswordUseCase:
         Raises:
             InvalidCredentialsError: If possible password reuse or invalid old password.
             NotFoundError: If user not found.
+            BreachedPasswordError: If the password appears in a data breach.
         """
         if old_password == new_password:
             raise InvalidCredentialsError("New password must be different")
+        if self.password_screener is not None and self.password_screener.is_breached(new_password):
+            raise BreachedPasswordError("Password appears in a data breach")
         user = self.user_reader.get_by_id(user_id=user_id)
         if not user:
             raise NotFoundError("User not found")
@@ -4,9 +4,11 @@ from authkit.ports.otp.otp_store import OTPStore
 from authkit.ports.otp.otp_manager import OTPManager
 from authkit.ports.passwd_manager import PasswordManager
 from authkit.ports.intents.user_id_intent_store import UserIDIntentStore
+from authkit.ports.passwd_screener import PasswordScreener
 from authkit.domain import OTPPurpose
-from authkit.exceptions import InvalidOTPError
+from authkit.exceptions import InvalidOTPError , BreachedPasswordError
 from uuid import UUID
+from typing import Optional
 
 from authkit.core import Registry
 
@@ -21,13 +23,15 @@ class VerifyForgetPasswordUseCase:
                  password_manager: PasswordManager,
                  intent_store: UserIDIntentStore,
                  otp_store: OTPStore,
-                 otp_manager: OTPManager):
+                 otp_manager: OTPManager,
+                 password_screener: Optional[PasswordScreener] = None):
         self.user_writer = user_writer
         self.session_service = session_service
         self.otp_store = otp_store
         self.otp_manager = otp_manager
         self.password_manager = password_manager
         self.intent_store = intent_store
+        self.password_screener = password_screener
 
     def execute(self, forget_token: UUID, code: str , new_password: str) -> None:
         """
@@ -40,10 +44,14 @@ class VerifyForgetPasswordUseCase:
             
         Raises:
             InvalidOTPError: If the OTP or intent is invalid.
+            BreachedPasswordError: If the password appears in a data breach.
         """
         intent = self.intent_store.get(key=forget_token)
         if intent is None:
             raise InvalidOTPError("Intent not found")
+        # Checked before the OTP, so that a rejected password does not use up the code.
+        if self.password_screener is not None and self.password_screener.is_breached(new_password):
+            raise BreachedPasswordError("Password appears in a data breach")
         valid = self.otp_store.verify(token=forget_token, 
                                     purpose=OTPPurpose.FORGET_PASSWORD, 
                                     code=code)
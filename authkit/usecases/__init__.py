@@ -1,15 +1,21 @@
 """
 Exposes the core business logic (use cases) for Authentication, Account management, and Credential handling.
 """
-from authkit.usecases.Authentication import *
-from authkit.usecases.Account import *
-from authkit.usecases.Credential import *
+from typing import TYPE_CHECKING
+from authkit._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from authkit.usecases.Authentication import *
+    from authkit.usecases.Account import *
+    from authkit.usecases.Credential import *
 
 __all__ = [
     "DeleteAccountUseCase",
     "StartDeleteAccountWithOTPUseCase",
     "VerifyDeleteAccountWithOTPUseCase",
 
+    "AuthenticateUseCase",
+    "AuthenticateManyUseCase",
     "LoginUseCase",
     "StartLoginWithOTPUseCase",
     "VerifyLoginWithOTPUseCase",
@@ -25,4 +31,27 @@ __all__ = [
     "StartForgetPasswordUseCase",
     "VerifyForgetPasswordUseCase",
 
-]
\ No newline at end of file
+]
+
+__getattr__, __dir__ = lazy_exports(__name__, {
+    "DeleteAccountUseCase": "authkit.usecases.Account.delete_account",
+    "StartDeleteAccountWithOTPUseCase": "authkit.usecases.Account.delete_account_with_otp_start",
+    "VerifyDeleteAccountWithOTPUseCase": "authkit.usecases.Account.delete_account_with_otp_verify",
+
+    "AuthenticateUseCase": "authkit.usecases.Authentication.authenticate",
+    "AuthenticateManyUseCase": "authkit.usecases.Authentication.authenticate_many",
+    "LoginUseCase": "authkit.usecases.Authentication.login",
+    "StartLoginWithOTPUseCase": "authkit.usecases.Authentication.login_with_otp_start",
+    "VerifyLoginWithOTPUseCase": "authkit.usecases.Authentication.login_with_otp_verify",
+    "LogoutUseCase": "authkit.usecases.Authentication.logout",
+    "LogoutAllUseCase": "authkit.usecases.Authentication.logout_all",
+    "StartLogoutAllWithOTPUseCase": "authkit.usecases.Authentication.logout_all_with_otp_start",
+    "VerifyLogoutAllWithOTPUseCase": "authkit.usecases.Authentication.logout_all_with_otp_verify",
+    "RegistrationUseCase": "authkit.usecases.Authentication.registration",
+    "StartRegistrationWithOTPUseCase": "authkit.usecases.Authentication.registration_with_otp_start",
+    "VerifyRegistrationWithOTPUseCase": "authkit.usecases.Authentication.registration_with_otp_verify",
+
+    "ChangePasswordUseCase": "authkit.usecases.Credential.change_password_cqrs",
+    "StartForgetPasswordUseCase": "authkit.usecases.Credential.forget_password_start",
+    "VerifyForgetPasswordUseCase": "authkit.usecases.Credential.forget_password_verify",
+})
@@ -0,0 +1,22 @@
+"""
+Async use cases for account management (deletion, etc.).
+"""
+from typing import TYPE_CHECKING
+from authkit._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from authkit.usecases.aio.Account.delete_account import AsyncDeleteAccountUseCase
+    from authkit.usecases.aio.Account.delete_account_with_otp_start import AsyncStartDeleteAccountWithOTPUseCase
+    from authkit.usecases.aio.Account.delete_account_with_otp_verify import AsyncVerifyDeleteAccountWithOTPUseCase
+
+__all__ = [
+    "AsyncDeleteAccountUseCase",
+    "AsyncStartDeleteAccountWithOTPUseCase",
+    "AsyncVerifyDeleteAccountWithOTPUseCase",
+]
+
+__getattr__, __dir__ = lazy_exports(__name__, {
+    "AsyncDeleteAccountUseCase": "authkit.usecases.aio.Account.delete_account",
+    "AsyncStartDeleteAccountWithOTPUseCase": "authkit.usecases.aio.Account.delete_account_with_otp_start",
+    "AsyncVerifyDeleteAccountWithOTPUseCase": "authkit.usecases.aio.Account.delete_account_with_otp_verify",
+})
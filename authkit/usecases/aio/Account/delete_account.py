@@ -0,0 +1,41 @@
+from authkit.ports.aio import AsyncAuthSessionService , AsyncUserReaderRepository , AsyncUserWriterRepository
+from uuid import UUID
+
+from authkit.usecases.aio._steps import gather
+from authkit.core import AsyncRegistry
+
+@AsyncRegistry.register("delete_account")
+class AsyncDeleteAccountUseCase:
+    """
+    Use case for deleting a user account using CQRS pattern.
+    """
+    def __init__(self, 
+                 user_reader: AsyncUserReaderRepository,
+                 user_writer: AsyncUserWriterRepository,
+                session_service: AsyncAuthSessionService,
+                 concurrent_steps: bool = True):
+        self.user_reader = user_reader
+        self.user_writer = user_writer
+        self.session_service = session_service
+        self.concurrent_steps = concurrent_steps
+
+    async def execute(self, user_id: UUID) -> UUID:
+        """
+        Deletes the user account and revokes all associated tokens.
+        
+        Args:
+            user_id: The ID of the user to delete.
+            
+        Returns:
+            The ID of the deleted user.
+        """
+        user = await self.user_reader.get_by_id(user_id)
+        if user is None:
+            return user_id
+        await gather(
+            self.session_service.revoke_all(user_id),
+            self.user_writer.delete(user_id),
+            concurrent=self.concurrent_steps,
+        )
+        return user_id
+        
\ No newline at end of file
@@ -0,0 +1,52 @@
+from authkit.ports.aio import AsyncAuthSessionService , AsyncUserReaderRepository , AsyncUserWriterRepository , AsyncOTPManager , AsyncOTPStore , AsyncUserIDIntentStore
+from authkit.domain import OTPPurpose
+from uuid import UUID
+from authkit.exceptions import InvalidCredentialsError
+from authkit.usecases.aio._steps import gather
+from authkit.core import AsyncRegistry
+
+@AsyncRegistry.register("delete_account_otp_start")
+class AsyncStartDeleteAccountWithOTPUseCase:
+    """
+    Use case for initiating account deletion with OTP.
+    """
+    def __init__(self, 
+                 user_reader: AsyncUserReaderRepository,
+                 intent_store: AsyncUserIDIntentStore,
+                 otp_store: AsyncOTPStore,
+                 otp_manager: AsyncOTPManager,
+                 session_service: AsyncAuthSessionService,
+                 concurrent_steps: bool = True):
+        self.user_reader = user_reader
+        self.otp_store = otp_store
+        self.otp_manager = otp_manager
+        self.intent_store = intent_store
+        self.session_service = session_service
+        self.concurrent_steps = concurrent_steps
+
+    async def execute(self, user_id: UUID) -> UUID:
+        """
+        Deletes the user account and revokes all associated tokens.
+        
+        Args:
+            user_id: The ID of the user to delete.
+            
+        Returns:
+            The verification token (UUID) to be used in the verify step.
+        """
+        user = await self.user_reader.get_by_id(user_id)
+        if user is None:
+            raise InvalidCredentialsError("User not found")
+        verification_token, otp = await gather(
+            self.intent_store.store(intent=user.id),
+            self.otp_manager.generate(),
+            concurrent=self.concurrent_steps,
+        )
+        await self.otp_store.store(token=verification_token,
+                                         code=otp,
+                                         purpose=OTPPurpose.MFA)
+        await self.otp_manager.send(identifier=user.identifier,
+                                          code=otp,
+                                          metadata=user.metadata,
+                                          purpose=OTPPurpose.MFA)
+        return verification_token
\ No newline at end of file
@@ -0,0 +1,62 @@
+from authkit.ports.aio import AsyncAuthSessionService , AsyncUserReaderRepository , AsyncUserWriterRepository , AsyncOTPManager , AsyncOTPStore , AsyncUserIDIntentStore
+from authkit.domain import OTPPurpose
+from uuid import UUID
+from authkit.exceptions import InvalidOTPError ,InvalidCredentialsError
+from authkit.usecases.aio._steps import gather
+from authkit.core import AsyncRegistry
+
+@AsyncRegistry.register("delete_account_otp_verify")
+class AsyncVerifyDeleteAccountWithOTPUseCase:
+    """
+    Use case for verifying OTP and deleting account.
+    """
+    def __init__(self, 
+                 user_reader: AsyncUserReaderRepository,
+                 user_writer: AsyncUserWriterRepository,
+                 session_service: AsyncAuthSessionService,
+                 intent_store: AsyncUserIDIntentStore,
+                 otp_store: AsyncOTPStore,
+                 otp_manager: AsyncOTPManager,
+                 concurrent_steps: bool = True):
+        self.user_reader = user_reader
+        self.user_writer = user_writer
+        self.session_service = session_service
+        self.otp_store = otp_store
+        self.otp_manager = otp_manager
+        self.intent_store = intent_store
+        self.concurrent_steps = concurrent_steps
+
+    async def execute(self, verification_token: UUID, code: str) -> UUID:
+
+        """
+        Verifies OTP and deletes the user account.
+        
+        Args:
+            verification_token: The token received from start step.
+            code: The OTP code provided by user.
+            
+        Returns:
+            The ID of the deleted user.
+        """
+        intent = await self.intent_store.get(key=verification_token)
+        if intent is None:
+            raise InvalidOTPError("Intent not found")
+        # Reading the user does not depend on the OTP; every write below does.
+        valid, user = await gather(
+            self.otp_store.verify(token=verification_token, purpose=OTPPurpose.MFA, code=code),
+            self.user_reader.get_by_id(user_id=intent),
+            concurrent=self.concurrent_steps,
+        )
+        if not valid:
+            raise InvalidOTPError("Invalid OTP")
+        if not user:
+            await self.intent_store.delete(key=verification_token)
+            raise InvalidCredentialsError("User not found")
+        await gather(
+            self.intent_store.delete(key=verification_token),
+            self.session_service.revoke_all(user_id=user.id),
+            self.user_writer.delete(user_id=user.id),
+            concurrent=self.concurrent_steps,
+        )
+        return user.id
+        
\ No newline at end of file
@@ -0,0 +1,49 @@
+"""
+Async use cases for authentication flows (login, logout, registration).
+"""
+from typing import TYPE_CHECKING
+from authkit._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from authkit.usecases.aio.Authentication.authenticate import AsyncAuthenticateUseCase
+    from authkit.usecases.aio.Authentication.authenticate_many import AsyncAuthenticateManyUseCase
+    from authkit.usecases.aio.Authentication.login import AsyncLoginUseCase
+    from authkit.usecases.aio.Authentication.login_with_otp_start import AsyncStartLoginWithOTPUseCase
+    from authkit.usecases.aio.Authentication.login_with_otp_verify import AsyncVerifyLoginWithOTPUseCase
+    from authkit.usecases.aio.Authentication.logout import AsyncLogoutUseCase
+    from authkit.usecases.aio.Authentication.logout_all import AsyncLogoutAllUseCase
+    from authkit.usecases.aio.Authentication.logout_all_with_otp_start import AsyncStartLogoutAllWithOTPUseCase
+    from authkit.usecases.aio.Authentication.logout_all_with_otp_verify import AsyncVerifyLogoutAllWithOTPUseCase
+    from authkit.usecases.aio.Authentication.registration import AsyncRegistrationUseCase
+    from authkit.usecases.aio.Authentication.registration_with_otp_start import AsyncStartRegistrationWithOTPUseCase
+    from authkit.usecases.aio.Authentication.registration_with_otp_verify import AsyncVerifyRegistrationWithOTPUseCase
+
+__all__ = [
+    "AsyncAuthenticateUseCase",
+    "AsyncAuthenticateManyUseCase",
+    "AsyncLoginUseCase",
+    "AsyncStartLoginWithOTPUseCase",
+    "AsyncVerifyLoginWithOTPUseCase",
+    "AsyncLogoutUseCase",
+    "AsyncLogoutAllUseCase",
+    "AsyncStartLogoutAllWithOTPUseCase",
+    "AsyncVerifyLogoutAllWithOTPUseCase",
+    "AsyncRegistrationUseCase",
+    "AsyncStartRegistrationWithOTPUseCase",
+    "AsyncVerifyRegistrationWithOTPUseCase",
+]
+
+__getattr__, __dir__ = lazy_exports(__name__, {
+    "AsyncAuthenticateUseCase": "authkit.usecases.aio.Authentication.authenticate",
+    "AsyncAuthenticateManyUseCase": "authkit.usecases.aio.Authentication.authenticate_many",
+    "AsyncLoginUseCase": "authkit.usecases.aio.Authentication.login",
+    "AsyncStartLoginWithOTPUseCase": "authkit.usecases.aio.Authentication.login_with_otp_start",
+    "AsyncVerifyLoginWithOTPUseCase": "authkit.usecases.aio.Authentication.login_with_otp_verify",
+    "AsyncLogoutUseCase": "authkit.usecases.aio.Authentication.logout",
+    "AsyncLogoutAllUseCase": "authkit.usecases.aio.Authentication.logout_all",
+    "AsyncStartLogoutAllWithOTPUseCase": "authkit.usecases.aio.Authentication.logout_all_with_otp_start",
+    "AsyncVerifyLogoutAllWithOTPUseCase": "authkit.usecases.aio.Authentication.logout_all_with_otp_verify",
+    "AsyncRegistrationUseCase": "authkit.usecases.aio.Authentication.registration",
+    "AsyncStartRegistrationWithOTPUseCase": "authkit.usecases.aio.Authentication.registration_with_otp_start",
+    "AsyncVerifyRegistrationWithOTPUseCase": "authkit.usecases.aio.Authentication.registration_with_otp_verify",
+})
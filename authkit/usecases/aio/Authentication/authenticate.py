@@ -0,0 +1,40 @@
+from authkit.ports.aio import AsyncUserReaderRepository , AsyncAuthSessionService
+from authkit.exceptions.auth import InvalidCredentialsError
+from authkit.domain import User
+from uuid import UUID
+
+from authkit.core import AsyncRegistry
+
+@AsyncRegistry.register("authenticate")
+class AsyncAuthenticateUseCase:
+    """
+    Use case for authenticating a request with an issued session token.
+    """
+    def __init__(self,
+                 user_reader: AsyncUserReaderRepository,
+                 session_service: AsyncAuthSessionService):
+        self.user_reader = user_reader
+        self.session_service = session_service
+
+    async def execute(self, user_id: UUID, session_token: str) -> User:
+        """
+        Verifies a session token against the user's current credentials version.
+        
+        Args:
+            user_id: The ID of the user the token was issued to.
+            session_token: The raw session token presented by the client.
+            
+        Returns:
+            The authenticated User object.
+            
+        Raises:
+            InvalidCredentialsError: If the user is not found or the token is invalid,
+                expired or revoked.
+        """
+        user = await self.user_reader.get_by_id(user_id)
+        if not user:
+            raise InvalidCredentialsError("User not found")
+        # Binds the token to the user: the user ID comes from the request, not from the token.
+        if not await self.session_service.verify(session_token, user.credentials_version, user.id):
+            raise InvalidCredentialsError("Invalid session")
+        return user
@@ -0,0 +1,63 @@
+from authkit.ports.aio import AsyncUserReaderRepository , AsyncAuthSessionService
+from authkit.domain import User
+from typing import Iterable, Optional
+from uuid import UUID
+
+from authkit.core import AsyncRegistry
+
+@AsyncRegistry.register("authenticate_many")
+class AsyncAuthenticateManyUseCase:
+    """
+    Use case for authenticating a batch of requests, e.g. the messages of a
+    websocket fan-out or the items of a bulk API call.
+    """
+    def __init__(self,
+                 user_reader: AsyncUserReaderRepository,
+                 session_service: AsyncAuthSessionService):
+        self.user_reader = user_reader
+        self.session_service = session_service
+
+    async def execute(self, requests: Iterable[tuple[UUID, str]]) -> list[Optional[User]]:
+        """
+        Verifies many session tokens, each against its user's current credentials version.
+
+        The distinct users are looked up in a single `get_many_by_id` call if
+        the user reader supports it (`AsyncBatchUserReaderRepository`), with
+        one `get_by_id` per user otherwise. The tokens are then verified in a
+        single `verify_many` call if the session service supports it
+        (`AsyncBatchAuthSessionService`), with one `verify` per token otherwise.
+        Calls to a same port are awaited one after the other, never concurrently.
+
+        Args:
+            requests: `(user_id, session_token)` pairs.
+
+        Returns:
+            For every request, in order, the authenticated User, or None if the
+            user is not found or the token is invalid, expired or revoked.
+        """
+        requests = list(requests)
+        user_ids = list(dict.fromkeys(user_id for user_id, _ in requests))
+        get_many_by_id = getattr(self.user_reader, 'get_many_by_id', None)
+        if get_many_by_id is not None:
+            found = await get_many_by_id(user_ids) if user_ids else {}
+            users = {user_id: found.get(user_id) for user_id in user_ids}
+        else:
+            users = {}
+            for user_id in user_ids:
+                users[user_id] = await self.user_reader.get_by_id(user_id)
+        pending = [(index, session_token, users[user_id])
+                   for index, (user_id, session_token) in enumerate(requests) if users[user_id]]
+        items = [(session_token, user.credentials_version, user.id) for _, session_token, user in pending]
+
+        verify_many = getattr(self.session_service, 'verify_many', None)
+        if verify_many is not None:
+            valid = await verify_many(items)
+        else:
+            valid = [await self.session_service.verify(session_token, creds_version, user_id)
+                     for session_token, creds_version, user_id in items]
+
+        results: list[Optional[User]] = [None] * len(requests)
+        for (index, _, user), ok in zip(pending, valid):
+            if ok:
+                results[index] = user
+        return results
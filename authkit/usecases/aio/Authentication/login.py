@@ -0,0 +1,79 @@
+from authkit.ports.aio import AsyncUserReaderRepository , AsyncUserWriterRepository , AsyncPasswordManager , AsyncAuthSessionService , AsyncPasswordRehasher
+from authkit.ports.aio import AsyncCredentialMemo
+from authkit.ports.session_service import AuthSession
+from authkit.domain import AuthErrorCode, Result
+from typing import Optional
+
+from authkit.usecases.aio._steps import gather
+from authkit.core import AsyncRegistry
+
+@AsyncRegistry.register("login")
+class AsyncLoginUseCase:
+    """
+    Use case for authenticating a user with credentials using CQRS pattern.
+    """
+    def __init__(self,
+                 user_reader: AsyncUserReaderRepository,
+                 user_writer: AsyncUserWriterRepository,
+                 password_manager: AsyncPasswordManager,
+                 session_service: AsyncAuthSessionService,
+                 password_rehasher: Optional[AsyncPasswordRehasher] = None,
+                 credential_memo: Optional[AsyncCredentialMemo] = None,
+                 concurrent_steps: bool = True,
+                 ):
+
+        self.user_reader = user_reader
+        self.password_manager = password_manager
+        self.session_service = session_service
+        self.user_writer = user_writer
+        self.password_rehasher = password_rehasher
+        self.credential_memo = credential_memo
+        self.concurrent_steps = concurrent_steps
+
+    async def execute(self, identifier: str, password: str ) -> AuthSession:
+        """
+        Authenticates a user and issues a token using CQRS repositories.
+        
+        Args:
+            identifier: The user's identifier (email/username).
+            password: The user's password.
+            
+        Returns:
+            A AuthSession object representing the authenticated session.
+            
+        Raises:
+            InvalidCredentialsError: If the user is not found or password is incorrect.
+        """
+        # Looked up on the class: interceptors wrap the instance's methods, not this call.
+        result = await type(self).try_execute(self, identifier, password)
+        return result.unwrap()
+
+    async def try_execute(self, identifier: str, password: str) -> Result[AuthSession]:
+        """
+        Same as `execute`, but reports invalid credentials instead of raising.
+        
+        Args:
+            identifier: The user's identifier (email/username).
+            password: The user's password.
+            
+        Returns:
+            A Result holding the AuthSession, or the error code
+            USER_NOT_FOUND / INVALID_PASSWORD.
+        """
+        user = await self.user_reader.get_by_identifier(identifier)
+        if not user:
+            return Result.failure(AuthErrorCode.USER_NOT_FOUND)
+        if self.credential_memo is not None:
+            valid = await self.credential_memo.verify(identifier, password, user, self.password_manager)
+        else:
+            valid = await self.password_manager.verify(password, user.password_hash)
+        if not valid:
+            return Result.failure(AuthErrorCode.INVALID_PASSWORD)
+        token, _ = await gather(
+            self.session_service.issue(user_id=user.id, creds_version=user.credentials_version),
+            self.user_writer.update_last_login(user_id=user.id),
+            concurrent=self.concurrent_steps,
+        )
+        if self.password_rehasher is not None:
+            await self.password_rehasher.submit(user, password, self.user_writer)
+        return Result.success(token)
\ No newline at end of file
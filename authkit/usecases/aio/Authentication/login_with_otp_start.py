@@ -0,0 +1,92 @@
+from authkit.ports.aio import AsyncOTPManager , AsyncOTPStore , AsyncUserReaderRepository , AsyncUserWriterRepository , AsyncPasswordManager , AsyncPasswordRehasher , AsyncUserIDIntentStore , AsyncCredentialMemo
+from authkit.domain import OTPPurpose, AuthErrorCode, Result
+from uuid import UUID
+from typing import Optional
+
+
+from authkit.usecases.aio._steps import gather
+from authkit.core import AsyncRegistry
+
+@AsyncRegistry.register("login_otp_start")
+class AsyncStartLoginWithOTPUseCase:
+    """
+    Use case to initiate login with OTP (MFA).
+    """
+    def __init__(
+        self,
+        user_reader: AsyncUserReaderRepository,
+        password_manager: AsyncPasswordManager,
+        intent_store: AsyncUserIDIntentStore,
+        otp_store: AsyncOTPStore,
+        otp_manager: AsyncOTPManager,
+        user_writer: Optional[AsyncUserWriterRepository] = None,
+        password_rehasher: Optional[AsyncPasswordRehasher] = None,
+        credential_memo: Optional[AsyncCredentialMemo] = None,
+        concurrent_steps: bool = True,
+    ):
+        self.user_reader = user_reader
+        self.password_manager = password_manager
+        self.otp_store = otp_store
+        self.otp_manager = otp_manager
+        self.intent_store = intent_store
+        self.user_writer = user_writer
+        self.password_rehasher = password_rehasher
+        self.credential_memo = credential_memo
+        self.concurrent_steps = concurrent_steps
+
+    async def execute(self, identifier: str, password: str) -> UUID:
+        """
+        Validates credentials and starts the OTP login flow.
+        
+        Args:
+            identifier: The user's identifier.
+            password: The user's password.
+            
+        Returns:
+            A UUID token representing the verification intent.
+            
+        Raises:
+            InvalidCredentialsError: If credentials are invalid.
+        """
+        # Looked up on the class: interceptors wrap the instance's methods, not this call.
+        result = await type(self).try_execute(self, identifier, password)
+        return result.unwrap()
+
+    async def try_execute(self, identifier: str, password: str) -> Result[UUID]:
+        """
+        Same as `execute`, but reports invalid credentials instead of raising.
+        
+        Args:
+            identifier: The user's identifier.
+            password: The user's password.
+            
+        Returns:
+            A Result holding the verification token, or the error code
+            USER_NOT_FOUND / INVALID_PASSWORD.
+        """
+        user = await self.user_reader.get_by_identifier(identifier=identifier)
+        if not user:
+            return Result.failure(AuthErrorCode.USER_NOT_FOUND)
+        if self.credential_memo is not None:
+            valid = await self.credential_memo.verify(identifier, password, user, self.password_manager)
+        else:
+            valid = await self.password_manager.verify(password=password,
+                                                       hashed_password=user.password_hash)
+        if not valid:
+            return Result.failure(AuthErrorCode.INVALID_PASSWORD)
+        # Rehashed hashes are stored through the writer: without one, nothing to do.
+        if self.password_rehasher is not None and self.user_writer is not None:
+            await self.password_rehasher.submit(user, password, self.user_writer)
+        verification_token, otp = await gather(
+            self.intent_store.store(intent=user.id),
+            self.otp_manager.generate(),
+            concurrent=self.concurrent_steps,
+        )
+        await self.otp_store.store(token=verification_token,
+                                         code=otp,
+                                         purpose=OTPPurpose.MFA)
+        await self.otp_manager.send(identifier=identifier,
+                                          code=otp,
+                                          metadata=user.metadata,
+                                          purpose=OTPPurpose.MFA)
+        return Result.success(verification_token)
\ No newline at end of file
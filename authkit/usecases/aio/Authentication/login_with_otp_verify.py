@@ -0,0 +1,65 @@
+from authkit.ports.aio import AsyncOTPStore , AsyncUserReaderRepository , AsyncUserWriterRepository , AsyncAuthSessionService , AsyncUserIDIntentStore
+from authkit.ports.session_service import AuthSession
+from authkit.exceptions.auth import InvalidOTPError
+from authkit.domain import OTPPurpose
+from uuid import UUID
+
+from authkit.usecases.aio._steps import gather
+from authkit.core import AsyncRegistry
+
+@AsyncRegistry.register("login_otp_verify")
+class AsyncVerifyLoginWithOTPUseCase:
+    """
+    Use case to verify OTP and complete login using CQRS pattern.
+    """
+    def __init__(
+        self,
+        user_reader: AsyncUserReaderRepository,
+        user_writer: AsyncUserWriterRepository,
+        intent_store: AsyncUserIDIntentStore,
+        session_service: AsyncAuthSessionService,
+        otp_store: AsyncOTPStore,
+        concurrent_steps: bool = True,
+    ):
+        self.user_reader = user_reader
+        self.user_writer = user_writer
+        self.session_service = session_service
+        self.otp_store = otp_store
+        self.intent_store = intent_store
+        self.concurrent_steps = concurrent_steps
+
+    async def execute(self, verification_token: UUID, code: str) -> AuthSession:
+        """
+        Verifies the OTP and issues an authentication token.
+        
+        Args:
+            verification_token: The intent token from the start flow.
+            code: The OTP provided by the user.
+            
+        Returns:
+            A Token object.
+            
+        Raises:
+            InvalidOTPError: If OTP or intent is invalid.
+        """
+        intent = await self.intent_store.get(key=verification_token)
+        if intent is None:
+            raise InvalidOTPError("Intent not found")
+        # Reading the user does not depend on the OTP; every write below does.
+        valid, user = await gather(
+            self.otp_store.verify(token=verification_token, purpose=OTPPurpose.MFA, code=code),
+            self.user_reader.get_by_id(user_id=intent),
+            concurrent=self.concurrent_steps,
+        )
+        if not valid:
+            raise InvalidOTPError("Invalid OTP")
+        if not user:
+            await self.intent_store.delete(key=verification_token)
+            raise InvalidOTPError("User not found")
+        _, auth_token, _ = await gather(
+            self.intent_store.delete(key=verification_token),
+            self.session_service.issue(user_id=user.id, creds_version=user.credentials_version),
+            self.user_writer.update_last_login(user_id=user.id),
+            concurrent=self.concurrent_steps,
+        )
+        return auth_token
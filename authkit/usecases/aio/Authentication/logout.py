@@ -0,0 +1,28 @@
+from authkit.ports.aio import AsyncAuthSessionService
+from uuid import UUID
+from authkit.exceptions.auth import NotFoundError
+
+from authkit.core import AsyncRegistry
+
+@AsyncRegistry.register("logout")
+class AsyncLogoutUseCase:
+    """
+    Use case for logging out a user (revoking a single token).
+    """
+    def __init__(self, session_service: AsyncAuthSessionService):
+        self.session_service = session_service
+    
+    async def execute(self, user_id: UUID, session_id: UUID):
+        """
+        Revokes a specific session token.
+        
+        Args:
+            user_id: The ID of the user.
+            session_id: The ID of the session to revoke.
+            
+        Raises:
+            NotFoundError: If the session is invalid or does not belong to the user.
+        """
+        revoked = await self.session_service.revoke(user_id, session_id)
+        if not revoked:
+            raise NotFoundError("Session not found or not owned by user")
\ No newline at end of file
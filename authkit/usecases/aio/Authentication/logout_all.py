@@ -0,0 +1,41 @@
+from authkit.ports.aio import AsyncAuthSessionService , AsyncUserWriterRepository , AsyncUserReaderRepository
+from authkit.exceptions.auth import NotFoundError
+from uuid import UUID
+
+from authkit.usecases.aio._steps import gather
+from authkit.core import AsyncRegistry
+
+@AsyncRegistry.register("logout_all")
+class AsyncLogoutAllUseCase:
+    """
+    Use case for logging out a user from all sessions using CQRS pattern.
+    """
+    def __init__(self, 
+                 user_writer: AsyncUserWriterRepository,
+                 user_reader: AsyncUserReaderRepository,
+                 session_service: AsyncAuthSessionService,
+                 concurrent_steps: bool = True):
+        self.user_writer = user_writer
+        self.user_reader = user_reader
+        self.session_service = session_service
+        self.concurrent_steps = concurrent_steps
+
+    async def execute(self , user_id: UUID):
+        """
+        Revokes all tokens for a user and increments their credential version.
+        
+        Args:
+            user_id: The ID of the user.
+            
+        Raises:
+            NotFoundError: If the user does not exist.
+        """
+        user = await self.user_reader.get_by_id(user_id)
+        if not user:
+            raise NotFoundError("User not found")
+
+        await gather(
+            self.session_service.revoke_all(user_id),
+            self.user_writer.increment_credentials_version(user_id),
+            concurrent=self.concurrent_steps,
+        )
@@ -0,0 +1,57 @@
+from authkit.ports.aio import AsyncUserReaderRepository , AsyncAuthSessionService , AsyncOTPStore , AsyncOTPManager , AsyncUserIDIntentStore
+from authkit.domain import OTPPurpose 
+from authkit.exceptions.auth import   InvalidCredentialsError
+from uuid import  UUID
+
+from authkit.usecases.aio._steps import gather
+from authkit.core import AsyncRegistry
+
+@AsyncRegistry.register("logout_all_otp_start")
+class AsyncStartLogoutAllWithOTPUseCase:
+    """
+    Use case to initiate global logout using OTP.
+    """
+    def __init__(self,
+                 user_reader: AsyncUserReaderRepository,
+                 session_service: AsyncAuthSessionService,
+                 intent_store: AsyncUserIDIntentStore,
+                 otp_store: AsyncOTPStore,
+                 otp_manager: AsyncOTPManager,
+                 concurrent_steps: bool = True,
+                 ):
+        self.user_reader = user_reader
+        self.session_service = session_service
+        self.otp_store = otp_store
+        self.otp_manager = otp_manager
+        self.intent_store = intent_store
+        self.concurrent_steps = concurrent_steps
+
+    async def execute(self, user_id: UUID) -> UUID:
+        """
+        Starts the global logout flow by sending an OTP.
+        
+        Args:
+            user_id: The ID of the authenticated user.
+            
+        Returns:
+            A UUID token representing the logout intent.
+            
+        Raises:
+            InvalidCredentialsError: If the user is not found.
+        """
+        user = await self.user_reader.get_by_id(user_id)
+        if not user:
+            raise InvalidCredentialsError("User not found")
+        logout_token, otp = await gather(
+            self.intent_store.store(intent=user.id),
+            self.otp_manager.generate(),
+            concurrent=self.concurrent_steps,
+        )
+        await self.otp_store.store(token=logout_token, 
+                                         code=otp, 
+                                         purpose=OTPPurpose.MFA)
+        await self.otp_manager.send(identifier=user.identifier, 
+                                          code=otp, 
+                                          metadata=user.metadata,
+                                          purpose=OTPPurpose.MFA)
+        return logout_token
\ No newline at end of file
@@ -0,0 +1,51 @@
+from authkit.ports.aio import AsyncUserWriterRepository , AsyncAuthSessionService , AsyncOTPStore , AsyncUserIDIntentStore
+from authkit.exceptions.auth import InvalidOTPError
+from authkit.domain import OTPPurpose
+from uuid import UUID
+
+from authkit.usecases.aio._steps import gather
+from authkit.core import AsyncRegistry
+
+@AsyncRegistry.register("logout_all_otp_verify")
+class AsyncVerifyLogoutAllWithOTPUseCase:
+    """
+    Use case to verify OTP and execute global logout.
+    """
+    def __init__(self,
+                 user_writer: AsyncUserWriterRepository,
+                 intent_store: AsyncUserIDIntentStore,
+                 session_service: AsyncAuthSessionService,
+                 otp_store: AsyncOTPStore,
+                 concurrent_steps: bool = True,
+                 ):
+        self.user_writer = user_writer
+        self.intent_store = intent_store
+        self.session_service = session_service
+        self.otp_store = otp_store
+        self.concurrent_steps = concurrent_steps
+
+    async def execute(self, logout_token: UUID, code: str) -> None:
+        """
+        Verifies the OTP and revokes all tokens for the user.
+        
+        Args:
+            logout_token: The intent token from the start flow.
+            code: The OTP provided by the user.
+            
+        Raises:
+            InvalidOTPError: If OTP or intent is invalid.
+        """
+        intent = await self.intent_store.get(key=logout_token)
+        if intent is None:
+            raise InvalidOTPError("Intent not found")
+        valid = await self.otp_store.verify(token=logout_token, 
+                                          purpose=OTPPurpose.MFA, 
+                                          code=code)
+        if not valid:
+            raise InvalidOTPError("Invalid OTP")
+        await gather(
+            self.intent_store.delete(key=logout_token),
+            self.session_service.revoke_all(user_id=intent),
+            self.user_writer.increment_credentials_version(user_id=intent),
+            concurrent=self.concurrent_steps,
+        )
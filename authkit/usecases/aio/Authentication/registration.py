@@ -0,0 +1,46 @@
+from authkit.ports.aio import AsyncUserWriterRepository , AsyncPasswordManager , AsyncPasswordScreener
+from authkit.exceptions.auth import BreachedPasswordError
+from authkit.domain import User
+from uuid import uuid4
+from typing import Any, Optional
+
+from authkit.core import AsyncRegistry
+
+@AsyncRegistry.register("register")
+class AsyncRegistrationUseCase:
+    """
+    Use case for registering a new user locally.
+    """
+    def __init__(self , user_writer: AsyncUserWriterRepository , password_manager: AsyncPasswordManager,
+                 password_screener: Optional[AsyncPasswordScreener] = None):
+        self.user_writer = user_writer
+        self.password_manager = password_manager
+        self.password_screener = password_screener
+    
+    async def execute(self, identifier: str, password: str, metadata: dict[str, Any] | None = None):
+        """
+        Registers a new user with an identifier and password.
+        
+        Args:
+            identifier: The user's public identifier (e.g., email).
+            password: The validation password.
+            metadata: Optional dictionary for additional user data.
+            
+        Returns:
+            The newly created User object.
+
+        Raises:
+            BreachedPasswordError: If the password appears in a data breach.
+        """
+        if self.password_screener is not None and await self.password_screener.is_breached(password):
+            raise BreachedPasswordError("Password appears in a data breach")
+        hashed_password = await self.password_manager.hash(password)
+        user = User(
+            id=uuid4(),
+            identifier=identifier, 
+            password_hash=hashed_password, 
+            credentials_version=0,
+            metadata=metadata or {}
+        )
+        user_added = await self.user_writer.add(user)
+        return user_added
\ No newline at end of file
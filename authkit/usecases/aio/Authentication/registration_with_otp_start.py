@@ -0,0 +1,95 @@
+from authkit.ports.aio import AsyncRegistrationIntentStore , AsyncOTPStore , AsyncOTPManager , AsyncUserReaderRepository , AsyncPasswordManager , AsyncSpeculativeHasher , AsyncPasswordScreener
+from authkit.domain import OTPPurpose
+from authkit.exceptions.auth import ConflictError, BreachedPasswordError
+from authkit.domain import  RegistrationIntent
+from uuid import UUID
+from typing import Any, Optional
+from dataclasses import replace
+
+from authkit.usecases.aio._steps import gather
+from authkit.core import AsyncRegistry
+
+@AsyncRegistry.register("register_otp_start")
+class AsyncStartRegistrationWithOTPUseCase:
+    """
+    Use case to initiate registration with OTP verification.
+    """
+    def __init__(self, 
+                 user_reader: AsyncUserReaderRepository,
+                 password_manager: AsyncPasswordManager,
+                 registration_intent_store: AsyncRegistrationIntentStore,
+                 otp_store: AsyncOTPStore,
+                 otp_manager: AsyncOTPManager,
+                 speculative_hasher: Optional[AsyncSpeculativeHasher] = None,
+                 password_screener: Optional[AsyncPasswordScreener] = None,
+                 concurrent_steps: bool = True):
+        self.user_reader = user_reader
+        self.password_manager = password_manager
+        self.registration_intent_store = registration_intent_store
+        self.otp_store = otp_store
+        self.otp_manager = otp_manager
+        self.otp_purpose = OTPPurpose.REGISTRATION
+        self.speculative_hasher = speculative_hasher
+        self.password_screener = password_screener
+        self.concurrent_steps = concurrent_steps
+
+    async def execute(self, identifier: str, password: str, metadata: dict[str, Any] | None = None) -> UUID:
+        """
+        Validates new user details and sends a verification OTP.
+
+        With a `speculative_hasher`, the password is hashed in the background
+        and the OTP is sent without waiting for it.
+        
+        Args:
+            identifier: The user's identifier.
+            password: The user's password.
+            metadata: Optional dictionary for additional user data.
+            
+        Returns:
+            A UUID token representing the registration intent.
+            
+        Raises:
+            ConflictError: If the user already exists.
+            BreachedPasswordError: If the password appears in a data breach.
+        """
+        user = await self.user_reader.get_by_identifier(identifier=identifier)
+        if user is None:
+            raise ConflictError("User already exists")
+        if self.password_screener is not None and await self.password_screener.is_breached(password):
+            raise BreachedPasswordError("Password appears in a data breach")
+        if self.speculative_hasher is not None:
+            # Placeholder now, hash attached to the intent once computed in the background.
+            hashed_password = await self.speculative_hasher.start(password)
+        else:
+            hashed_password = await self.password_manager.hash(password=password)
+        
+        # Create intent (no ID or OTP code here, as per domain definition)
+        intent = RegistrationIntent(
+            identifier=identifier,
+            password_hash=hashed_password,
+            credentials_version=0,
+            metadata=metadata or {}
+        )
+        
+        # Store intent to get the token (ID), generating the OTP meanwhile
+        token, otp_code = await gather(
+            self.registration_intent_store.store(intent=intent),
+            self.otp_manager.generate(),
+            concurrent=self.concurrent_steps,
+        )
+        if self.speculative_hasher is not None:
+            update = getattr(self.registration_intent_store, 'update', None)
+            if update is not None:
+                await self.speculative_hasher.attach(
+                    hashed_password,
+                    lambda password_hash: update(key=token, intent=replace(intent, password_hash=password_hash)),
+                )
+        
+        # Store and send OTP
+        await self.otp_store.store(token=token, code=otp_code, purpose=self.otp_purpose)
+        await self.otp_manager.send(identifier=identifier,
+                                          code=otp_code,
+                                          metadata=user.metadata,
+                                          purpose=self.otp_purpose)
+        
+        return token
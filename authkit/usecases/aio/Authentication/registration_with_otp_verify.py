@@ -0,0 +1,64 @@
+from authkit.ports.aio import AsyncRegistrationIntentStore , AsyncOTPStore , AsyncUserWriterRepository , AsyncSpeculativeHasher
+from authkit.domain import OTPPurpose
+from authkit.exceptions.auth import InvalidOTPError 
+from authkit.domain import User
+from uuid import UUID , uuid4
+from typing import Optional
+from authkit.core import AsyncRegistry
+
+@AsyncRegistry.register("register_otp_verify")
+class AsyncVerifyRegistrationWithOTPUseCase:
+    """
+    Use case to verify registration OTP and create the user.
+    """
+    def __init__(self, 
+                 user_writer: AsyncUserWriterRepository,
+                 registration_intent_store: AsyncRegistrationIntentStore,
+                 otp_store: AsyncOTPStore,
+                 speculative_hasher: Optional[AsyncSpeculativeHasher] = None,
+                 concurrent_steps: bool = True):
+        self.registration_intent_store = registration_intent_store
+        self.otp_store = otp_store
+        self.user_writer = user_writer
+        self.speculative_hasher = speculative_hasher
+        self.concurrent_steps = concurrent_steps
+    
+    async def execute(self, verification_token: UUID , code: str) -> User:
+        """
+        Verifies the OTP and creates the new user account.
+        
+        Args:
+            verification_token: The intent token from the start flow.
+            code: The OTP provided by the user.
+            
+        Returns:
+            The newly created User object.
+            
+        Raises:
+            InvalidOTPError: If OTP or intent is invalid, or the password hash
+                computed in the background is not available.
+        """
+        intent = await self.registration_intent_store.get(key=verification_token)
+        if intent is None:
+            raise InvalidOTPError("Intent not found")
+        valid = await self.otp_store.verify(token=verification_token, code=code, purpose=OTPPurpose.REGISTRATION)
+        if not valid:
+            raise InvalidOTPError("Invalid OTP")
+        password_hash = intent.password_hash
+        if self.speculative_hasher is not None:
+            # Waits for the background hash if it was not attached to the intent yet.
+            # Not overlapped with the delete: the hasher's `update` of the intent
+            # would race with it and could write the intent back.
+            password_hash = await self.speculative_hasher.resolve(password_hash)
+        await self.registration_intent_store.delete(key=verification_token)
+        if password_hash is None:
+            raise InvalidOTPError("Registration expired, please start again")
+        user = User(id=uuid4(),
+                    identifier=intent.identifier,
+                    password_hash=password_hash,
+                    credentials_version=intent.credentials_version,
+                    metadata=intent.metadata)
+        user = await self.user_writer.add(user=user)
+        return user
+        
+        
\ No newline at end of file
@@ -0,0 +1,22 @@
+"""
+Async use cases for credential management (password changes, recovery).
+"""
+from typing import TYPE_CHECKING
+from authkit._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from authkit.usecases.aio.Credential.change_password_cqrs import AsyncChangePasswordUseCase
+    from authkit.usecases.aio.Credential.forget_password_start import AsyncStartForgetPasswordUseCase
+    from authkit.usecases.aio.Credential.forget_password_verify import AsyncVerifyForgetPasswordUseCase
+
+__all__ = [
+    "AsyncChangePasswordUseCase",
+    "AsyncStartForgetPasswordUseCase",
+    "AsyncVerifyForgetPasswordUseCase",
+]
+
+__getattr__, __dir__ = lazy_exports(__name__, {
+    "AsyncChangePasswordUseCase": "authkit.usecases.aio.Credential.change_password_cqrs",
+    "AsyncStartForgetPasswordUseCase": "authkit.usecases.aio.Credential.forget_password_start",
+    "AsyncVerifyForgetPasswordUseCase": "authkit.usecases.aio.Credential.forget_password_verify",
+})
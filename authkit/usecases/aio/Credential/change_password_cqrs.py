@@ -0,0 +1,61 @@
+from authkit.ports.aio import AsyncPasswordManager , AsyncUserReaderRepository , AsyncUserWriterRepository , AsyncAuthSessionService , AsyncPasswordScreener
+from authkit.exceptions import NotFoundError , InvalidCredentialsError , BreachedPasswordError
+from uuid import UUID
+from typing import Optional
+
+from authkit.usecases.aio._steps import gather
+from authkit.core import AsyncRegistry
+
+@AsyncRegistry.register("change_password")
+class AsyncChangePasswordUseCase:
+    """
+    Use case for changing a user's password using CQRS pattern.
+    """
+    def __init__(self,
+                 user_reader: AsyncUserReaderRepository,
+                 user_writer: AsyncUserWriterRepository,
+                 password_manager: AsyncPasswordManager,
+                 session_service: AsyncAuthSessionService,
+                 password_screener: Optional[AsyncPasswordScreener] = None,
+                 concurrent_steps: bool = True):
+        self.user_reader = user_reader
+        self.user_writer = user_writer
+        self.password_manager = password_manager
+        self.session_service = session_service
+        self.password_screener = password_screener
+        self.concurrent_steps = concurrent_steps
+    
+    async def execute(self, user_id: UUID, old_password: str, new_password: str) -> None:
+        """
+        Changes the user's password.
+        
+        Verifies the old password, revokes all existing tokens, increments the 
+        credential version, and updates the password hash.
+        
+        Args:
+            user_id: The ID of the user.
+            old_password: The current password.
+            new_password: The new password.
+            
+        Raises:
+            InvalidCredentialsError: If possible password reuse or invalid old password.
+            NotFoundError: If user not found.
+            BreachedPasswordError: If the password appears in a data breach.
+        """
+        if old_password == new_password:
+            raise InvalidCredentialsError("New password must be different")
+        if self.password_screener is not None and await self.password_screener.is_breached(new_password):
+            raise BreachedPasswordError("Password appears in a data breach")
+        user = await self.user_reader.get_by_id(user_id=user_id)
+        if not user:
+            raise NotFoundError("User not found")
+        if not await self.password_manager.verify(password=old_password, hashed_password=user.password_hash):
+            raise InvalidCredentialsError("Invalid password")
+        # Only once the old password is verified: revoke and bump while the new one is hashed.
+        _, _, hashed_password = await gather(
+            self.session_service.revoke_all(user_id=user_id),
+            self.user_writer.increment_credentials_version(user_id=user_id),
+            self.password_manager.hash(password=new_password),
+            concurrent=self.concurrent_steps,
+        )
+        await self.user_writer.change_password(user_id=user_id, new_password_hash=hashed_password)
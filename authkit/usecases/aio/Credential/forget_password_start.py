@@ -0,0 +1,56 @@
+from authkit.ports.aio import AsyncUserReaderRepository , AsyncOTPStore , AsyncOTPManager , AsyncUserIDIntentStore
+from authkit.domain import OTPPurpose 
+from authkit.exceptions.auth import NotFoundError
+from uuid import  UUID
+
+from authkit.usecases.aio._steps import gather
+from authkit.core import AsyncRegistry
+
+@AsyncRegistry.register("forget_password_start")
+class AsyncStartForgetPasswordUseCase:
+    """
+    Use case to initiate the password recovery process.
+    """
+    def __init__(self,
+                 user_reader: AsyncUserReaderRepository,
+                 otp_store: AsyncOTPStore,
+                 otp_manager: AsyncOTPManager,
+                 intent_store: AsyncUserIDIntentStore,
+                 concurrent_steps: bool = True):
+        self.user_reader = user_reader
+        self.otp_store = otp_store
+        self.otp_manager = otp_manager
+        self.intent_store = intent_store
+        self.concurrent_steps = concurrent_steps
+
+    async def execute(self, identifier: str) -> UUID:
+        """
+        Starts the password recovery flow.
+        
+        Generates an OTP and temporarily stores the user's intent.
+        
+        Args:
+            identifier: The user's identifier (email/username).
+            
+        Returns:
+            A UUID token representing the recovery intent.
+            
+        Raises:
+            NotFoundError: If the user does not exist.
+        """
+        user = await self.user_reader.get_by_identifier(identifier)
+        if not user:
+            raise NotFoundError("User not found")
+        forget_token, otp = await gather(
+            self.intent_store.store(intent=user.id),
+            self.otp_manager.generate(),
+            concurrent=self.concurrent_steps,
+        )
+        await self.otp_store.store(token=forget_token, 
+                                         code=otp, 
+                                         purpose=OTPPurpose.FORGET_PASSWORD)
+        await self.otp_manager.send(identifier=identifier, 
+                                          code=otp, 
+                                          metadata=user.metadata,
+                                          purpose=OTPPurpose.FORGET_PASSWORD)
+        return forget_token
\ No newline at end of file
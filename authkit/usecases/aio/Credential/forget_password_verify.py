@@ -0,0 +1,64 @@
+from authkit.ports.aio import AsyncUserWriterRepository , AsyncAuthSessionService , AsyncOTPStore , AsyncOTPManager , AsyncPasswordManager , AsyncUserIDIntentStore , AsyncPasswordScreener
+from authkit.domain import OTPPurpose
+from authkit.exceptions import InvalidOTPError , BreachedPasswordError
+from uuid import UUID
+from typing import Optional
+
+from authkit.usecases.aio._steps import gather
+from authkit.core import AsyncRegistry
+
+@AsyncRegistry.register("forget_password_verify")
+class AsyncVerifyForgetPasswordUseCase:
+    """
+    Use case to complete the password recovery process.
+    """
+    def __init__(self,
+                 user_writer: AsyncUserWriterRepository,
+                 session_service: AsyncAuthSessionService,
+                 password_manager: AsyncPasswordManager,
+                 intent_store: AsyncUserIDIntentStore,
+                 otp_store: AsyncOTPStore,
+                 otp_manager: AsyncOTPManager,
+                 password_screener: Optional[AsyncPasswordScreener] = None,
+                 concurrent_steps: bool = True):
+        self.user_writer = user_writer
+        self.session_service = session_service
+        self.otp_store = otp_store
+        self.otp_manager = otp_manager
+        self.password_manager = password_manager
+        self.intent_store = intent_store
+        self.password_screener = password_screener
+        self.concurrent_steps = concurrent_steps
+
+    async def execute(self, forget_token: UUID, code: str , new_password: str) -> None:
+        """
+        Verifies the recovery OTP and updates the password.
+        
+        Args:
+            forget_token: The intent token returned by the start use case.
+            code: The OTP code provided by the user.
+            new_password: The new password to set.
+            
+        Raises:
+            InvalidOTPError: If the OTP or intent is invalid.
+            BreachedPasswordError: If the password appears in a data breach.
+        """
+        intent = await self.intent_store.get(key=forget_token)
+        if intent is None:
+            raise InvalidOTPError("Intent not found")
+        # Checked before the OTP, so that a rejected password does not use up the code.
+        if self.password_screener is not None and await self.password_screener.is_breached(new_password):
+            raise BreachedPasswordError("Password appears in a data breach")
+        valid = await self.otp_store.verify(token=forget_token, 
+                                          purpose=OTPPurpose.FORGET_PASSWORD, 
+                                          code=code)
+        if not valid:
+            raise InvalidOTPError("Invalid OTP")
+        _, _, _, hashed_password = await gather(
+            self.intent_store.delete(key=forget_token),
+            self.session_service.revoke_all(user_id=intent),
+            self.user_writer.increment_credentials_version(user_id=intent),
+            self.password_manager.hash(password=new_password),
+            concurrent=self.concurrent_steps,
+        )
+        await self.user_writer.change_password(user_id=intent, new_password_hash=hashed_password)
@@ -0,0 +1,59 @@
+"""
+Async twins of the use cases in `authkit.usecases`, served by `AsyncAuthKit`.
+
+Every `execute()` is a coroutine that awaits each port call, overlapping the
+calls that do not depend on each other (see `_steps.gather`).
+"""
+from typing import TYPE_CHECKING
+from authkit._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from authkit.usecases.aio.Account import *
+    from authkit.usecases.aio.Authentication import *
+    from authkit.usecases.aio.Credential import *
+
+__all__ = [
+    "AsyncDeleteAccountUseCase",
+    "AsyncStartDeleteAccountWithOTPUseCase",
+    "AsyncVerifyDeleteAccountWithOTPUseCase",
+
+    "AsyncAuthenticateUseCase",
+    "AsyncAuthenticateManyUseCase",
+    "AsyncLoginUseCase",
+    "AsyncStartLoginWithOTPUseCase",
+    "AsyncVerifyLoginWithOTPUseCase",
+    "AsyncLogoutUseCase",
+    "AsyncLogoutAllUseCase",
+    "AsyncStartLogoutAllWithOTPUseCase",
+    "AsyncVerifyLogoutAllWithOTPUseCase",
+    "AsyncRegistrationUseCase",
+    "AsyncStartRegistrationWithOTPUseCase",
+    "AsyncVerifyRegistrationWithOTPUseCase",
+
+    "AsyncChangePasswordUseCase",
+    "AsyncStartForgetPasswordUseCase",
+    "AsyncVerifyForgetPasswordUseCase",
+]
+
+__getattr__, __dir__ = lazy_exports(__name__, {
+    "AsyncDeleteAccountUseCase": "authkit.usecases.aio.Account.delete_account",
+    "AsyncStartDeleteAccountWithOTPUseCase": "authkit.usecases.aio.Account.delete_account_with_otp_start",
+    "AsyncVerifyDeleteAccountWithOTPUseCase": "authkit.usecases.aio.Account.delete_account_with_otp_verify",
+
+    "AsyncAuthenticateUseCase": "authkit.usecases.aio.Authentication.authenticate",
+    "AsyncAuthenticateManyUseCase": "authkit.usecases.aio.Authentication.authenticate_many",
+    "AsyncLoginUseCase": "authkit.usecases.aio.Authentication.login",
+    "AsyncStartLoginWithOTPUseCase": "authkit.usecases.aio.Authentication.login_with_otp_start",
+    "AsyncVerifyLoginWithOTPUseCase": "authkit.usecases.aio.Authentication.login_with_otp_verify",
+    "AsyncLogoutUseCase": "authkit.usecases.aio.Authentication.logout",
+    "AsyncLogoutAllUseCase": "authkit.usecases.aio.Authentication.logout_all",
+    "AsyncStartLogoutAllWithOTPUseCase": "authkit.usecases.aio.Authentication.logout_all_with_otp_start",
+    "AsyncVerifyLogoutAllWithOTPUseCase": "authkit.usecases.aio.Authentication.logout_all_with_otp_verify",
+    "AsyncRegistrationUseCase": "authkit.usecases.aio.Authentication.registration",
+    "AsyncStartRegistrationWithOTPUseCase": "authkit.usecases.aio.Authentication.registration_with_otp_start",
+    "AsyncVerifyRegistrationWithOTPUseCase": "authkit.usecases.aio.Authentication.registration_with_otp_verify",
+
+    "AsyncChangePasswordUseCase": "authkit.usecases.aio.Credential.change_password_cqrs",
+    "AsyncStartForgetPasswordUseCase": "authkit.usecases.aio.Credential.forget_password_start",
+    "AsyncVerifyForgetPasswordUseCase": "authkit.usecases.aio.Credential.forget_password_verify",
+})
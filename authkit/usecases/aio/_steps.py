@@ -0,0 +1,45 @@
+"""
+Overlapping the independent port calls of a use case.
+"""
+import asyncio
+from typing import Any, Awaitable
+
+
+async def gather(*steps: Awaitable[Any], concurrent: bool = True) -> tuple[Any, ...]:
+    """
+    Awaits independent steps, concurrently unless `concurrent` is False.
+
+    Callers only pass steps that do not depend on each other and never two
+    calls on the same port, so a port never sees concurrent calls from one
+    use case. If a step fails, the others are cancelled and the first error
+    is raised. Sequentially, steps run in the order given and the remaining
+    ones are closed without running.
+
+    Args:
+        *steps: The coroutines (or other awaitables) to run.
+        concurrent: False runs the steps one after the other, e.g. for adapters
+            sharing a connection that does not support concurrent calls.
+
+    Returns:
+        The results of the steps, in the order given.
+    """
+    if not concurrent or len(steps) < 2:
+        results = []
+        try:
+            for step in steps:
+                results.append(await step)
+        finally:
+            for step in steps[len(results) + 1:]:
+                close = getattr(step, 'close', None)
+                if close is not None:
+                    close()
+        return tuple(results)
+
+    tasks = [asyncio.ensure_future(step) for step in steps]
+    try:
+        return tuple(await asyncio.gather(*tasks))
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
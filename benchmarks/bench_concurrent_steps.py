@@ -0,0 +1,115 @@
+"""
+Macrobenchmark: async use case latency with and without concurrent steps.
+
+Every call of the async adapters below sleeps for a fixed round trip
+(``rtt``), and password hashing / verification for ``hash_ms``.
+With ``concurrent_steps`` the independent calls of a flow overlap, so a flow
+costs about the length of its longest dependency chain instead of the sum of
+its calls.
+
+Run from the project root:
+
+    python benchmarks/bench_concurrent_steps.py
+"""
+import asyncio
+import time
+from uuid import uuid4
+
+from authkit import User
+from authkit.core.async_authkit import AsyncAuthKit
+
+
+class Port:
+    def __init__(self, rtt: float):
+        self.rtt = rtt
+
+    async def _io(self):
+        await asyncio.sleep(self.rtt)
+
+
+class Users(Port):
+    def __init__(self, rtt: float):
+        super().__init__(rtt)
+        self.user = User(id=uuid4(), identifier="a@example.com", password_hash="h:pw", credentials_version=0)
+    async def get_by_identifier(self, identifier):
+        await self._io()
+        return self.user
+    async def get_by_id(self, user_id):
+        await self._io()
+        return self.user
+    async def update_last_login(self, user_id):
+        await self._io()
+    async def increment_credentials_version(self, user_id):
+        await self._io()
+    async def change_password(self, user_id, new_password_hash):
+        await self._io()
+        self.user.password_hash = new_password_hash
+
+
+class Passwords(Port):
+    async def hash(self, password):
+        await self._io()
+        return "h:" + password
+    async def verify(self, password, hashed_password):
+        await self._io()
+        return hashed_password == "h:" + password
+
+
+class Sessions(Port):
+    async def issue(self, user_id, creds_version):
+        await self._io()
+        return "token"
+    async def revoke_all(self, user_id):
+        await self._io()
+
+
+class OTPs(Port):
+    async def verify(self, token, purpose, code):
+        await self._io()
+        return True
+
+
+class Intents(Port):
+    async def store(self, intent):
+        await self._io()
+        return uuid4()
+    async def get(self, key):
+        await self._io()
+        return uuid4()
+    async def delete(self, key):
+        await self._io()
+
+
+async def bench(concurrent: bool, rtt: float, hash_ms: float, number: int):
+    users = Users(rtt)
+    user = users.user
+    auth = AsyncAuthKit(user_repo=users, password_manager=Passwords(hash_ms / 1e3), session_service=Sessions(rtt),
+                        otp_store=OTPs(rtt), intent_store=Intents(rtt), concurrent_steps=concurrent)
+    flows = {
+        "login": lambda: auth.login.execute("a@example.com", "pw"),
+        "login_otp_verify": lambda: auth.login_otp_verify.execute(uuid4(), "123456"),
+        "change_password": lambda: auth.change_password.execute(user.id, "pw", "new"),
+        "logout_all": lambda: auth.logout_all.execute(user.id),
+    }
+    rows = {}
+    for name, flow in flows.items():
+        start = time.perf_counter()
+        for _ in range(number):
+            user.password_hash = "h:pw"
+            await flow()
+        rows[name] = (time.perf_counter() - start) / number
+    auth.close()
+    return rows
+
+
+def main(rtt: float = 0.005, hash_ms: float = 20.0, number: int = 20):
+    sequential = asyncio.run(bench(False, rtt, hash_ms, number))
+    concurrent = asyncio.run(bench(True, rtt, hash_ms, number))
+    print(f"{rtt * 1e3:.0f} ms per port call, {hash_ms:.0f} ms per hash, mean of {number} runs\n")
+    print(f"{'':<18} {'sequential':>12} {'concurrent':>12}")
+    for name in sequential:
+        print(f"{name:<18} {sequential[name] * 1e3:9.1f} ms {concurrent[name] * 1e3:9.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""
+Microbenchmark: failure-path throughput of ``execute()`` vs ``try_execute()``.
+
+Simulates a credential-stuffing wave against ``login`` and ``login_otp_start``
+with in-memory adapters: every attempt fails, either because the user does
+not exist or because the password is wrong. ``execute()`` is timed the way a
+web handler uses it (``except Exception`` translation), ``try_execute()`` by
+checking the returned result.
+
+Run from the project root:
+
+    python benchmarks/bench_failure_path.py
+"""
+import timeit
+from uuid import uuid4
+
+from authkit import AuthKit, User
+
+
+class Repo:
+    def __init__(self, user):
+        self.user = user
+    def get_by_identifier(self, identifier):
+        return self.user if identifier == self.user.identifier else None
+
+
+class Passwords:
+    def verify(self, password, hashed_password):
+        return hashed_password == "h_" + password
+
+
+def main(number: int = 50000):
+    user = User(id=uuid4(), identifier="a@example.com", password_hash="h_pw", credentials_version=0)
+    auth = AuthKit(user_repo=Repo(user), password_manager=Passwords(),
+                   session_service=object(), intent_store=object(),
+                   otp_store=object(), otp_manager=object())
+
+    def raising(use_case, identifier):
+        def attempt():
+            try:
+                use_case.execute(identifier, "wrong")
+            except Exception as e:
+                str(e)
+        return attempt
+
+    def returning(use_case, identifier):
+        def attempt():
+            result = use_case.try_execute(identifier, "wrong")
+            if not result.ok:
+                result.error.value
+        return attempt
+
+    print(f"{number} failed attempts per run, best of 5\n")
+    print(f"{'scenario':<36} {'execute()':>14} {'try_execute()':>16} {'speedup':>9}")
+    for name in ("login", "login_otp_start"):
+        use_case = getattr(auth, name)
+        for reason, identifier in (("unknown user", "nobody@example.com"), ("wrong password", "a@example.com")):
+            timings = []
+            for factory in (raising, returning):
+                fn = factory(use_case, identifier)
+                timings.append(min(timeit.repeat(fn, number=number, repeat=5)) / number)
+            label = f"{name}, {reason}"
+            print(f"{label:<36} {timings[0] * 1e6:8.3f} us/op {timings[1] * 1e6:10.3f} us/op {timings[0] / timings[1]:8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""
+Microbenchmark: per-call cost of the interceptor chain.
+
+Times ``auth.login.execute(...)`` against in-memory adapters with no
+interceptors, with one pass-through interceptor on ``execute()`` only, and
+with one on every port call as well.
+
+Run from the project root:
+
+    python benchmarks/bench_interceptors.py
+"""
+import timeit
+from uuid import uuid4
+
+from authkit import AuthKit, User
+from authkit.core.interceptors import Interceptor
+
+
+class Repo:
+    def __init__(self, user):
+        self.user = user
+    def get_by_identifier(self, identifier):
+        return self.user
+    def update_last_login(self, user_id):
+        pass
+
+
+class Passwords:
+    def verify(self, password, hashed_password):
+        return True
+
+
+class Sessions:
+    def issue(self, user_id, creds_version):
+        return "token"
+
+
+class ExecuteOnly(Interceptor):
+    def intercept_execute(self, use_case, proceed, *args, **kwargs):
+        return proceed(*args, **kwargs)
+
+
+class Everything(ExecuteOnly):
+    def intercept_port(self, port, method, proceed, *args, **kwargs):
+        return proceed(*args, **kwargs)
+
+
+def main(number: int = 50000):
+    user = User(id=uuid4(), identifier="a@example.com", password_hash="h", credentials_version=0)
+    adapters = dict(user_repo=Repo(user), password_manager=Passwords(), session_service=Sessions())
+    rows = [
+        ("no interceptors", []),
+        ("1 interceptor, execute() only", [ExecuteOnly()]),
+        ("1 interceptor, execute() + ports", [Everything()]),
+    ]
+    print(f"login.execute(), {number} iterations\n")
+    for label, interceptors in rows:
+        login = AuthKit(**adapters, interceptors=interceptors).login
+        best = min(timeit.repeat(lambda: login.execute("a@example.com", "pw"), number=number, repeat=5)) / number
+        print(f"{label:<36} {best * 1e6:8.3f} us/op")
+
+
+if __name__ == "__main__":
+    main()
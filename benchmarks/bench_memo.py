@@ -0,0 +1,52 @@
+"""
+Microbenchmark: repeated logins with and without ``VerifiedCredentialMemo``.
+
+Times ``auth.login.execute(...)`` with the same valid credentials, then
+``try_execute`` with the same wrong password, against in-memory adapters and
+a real ``ScryptPasswordManager``. Without a memo every attempt pays for a
+full scrypt verify.
+
+Run from the project root:
+
+    python benchmarks/bench_memo.py
+"""
+import timeit
+from uuid import uuid4
+
+from authkit import AuthKit, User
+from authkit.adapters import ScryptPasswordManager, VerifiedCredentialMemo
+
+
+class Repo:
+    def __init__(self, user):
+        self.user = user
+    def get_by_identifier(self, identifier):
+        return self.user
+    def update_last_login(self, user_id):
+        pass
+
+
+class Sessions:
+    def issue(self, user_id, creds_version):
+        return "token"
+
+
+def main(number: int = 20, ln: int = 14):
+    passwords = ScryptPasswordManager(ln=ln)
+    user = User(id=uuid4(), identifier="a@example.com", password_hash=passwords.hash("pw"), credentials_version=0)
+    adapters = dict(user_repo=Repo(user), password_manager=passwords, session_service=Sessions())
+    rows = [
+        ("no memo", {}),
+        ("VerifiedCredentialMemo", {"credential_memo": VerifiedCredentialMemo()}),
+    ]
+    print(f"scrypt ln={ln}, {number} repeated attempts per run, best of 3\n")
+    print(f"{'':<24} {'valid login':>14} {'failed login':>15}")
+    for label, extra in rows:
+        login = AuthKit(**adapters, **extra).login
+        valid = min(timeit.repeat(lambda: login.execute("a@example.com", "pw"), number=number, repeat=3)) / number
+        failed = min(timeit.repeat(lambda: login.try_execute("a@example.com", "bad"), number=number, repeat=3)) / number
+        print(f"{label:<24} {valid * 1e3:8.3f} ms/op {failed * 1e3:9.3f} ms/op")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""
+Throughput benchmark: password verification from many request threads.
+
+Compares calling a password manager inline on the request threads with
+``OffloadedPasswordManager`` in thread and process mode, for:
+
+* a GIL-bound manager (pure-Python key stretching), and
+* the built-in ``PBKDF2PasswordManager`` (``hashlib`` releases the GIL).
+
+Run from the project root:
+
+    python benchmarks/bench_offload.py [request_threads] [verifies_per_thread]
+"""
+import hashlib
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from authkit.adapters import OffloadedPasswordManager, PBKDF2PasswordManager
+
+
+class PurePythonPasswordManager:
+    """Key stretching in a Python loop: holds the GIL for the whole computation."""
+    rounds = 20000
+
+    def hash(self, password):
+        digest = password.encode()
+        for _ in range(self.rounds):
+            digest = hashlib.sha256(digest).digest()
+        return digest.hex()
+
+    def verify(self, password, hashed_password):
+        return self.hash(password) == hashed_password
+
+
+def throughput(manager, hashed: str, threads: int, per_thread: int) -> float:
+    def worker():
+        for _ in range(per_thread):
+            manager.verify("pw", hashed)
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(threads) as pool:
+        for future in [pool.submit(worker) for _ in range(threads)]:
+            future.result()
+    return threads * per_thread / (time.perf_counter() - start)
+
+
+def main(threads: int = 16, per_thread: int = 8):
+    cores = os.cpu_count() or 1
+    print(f"{cores} cores, {threads} request threads x {per_thread} verifies\n")
+    print(f"{'manager':<18} {'mode':<10} {'verifies/s':>12}")
+    for label, inner in (("pure Python", PurePythonPasswordManager()),
+                         ("PBKDF2 (hashlib)", PBKDF2PasswordManager(iterations=50000))):
+        hashed = inner.hash("pw")
+        candidates = [("inline", inner)] + [
+            (mode, OffloadedPasswordManager(inner, mode=mode, max_workers=cores)) for mode in ("thread", "process")
+        ]
+        for mode, manager in candidates:
+            manager.verify("pw", hashed)  # start the pool outside the measurement
+            rate = throughput(manager, hashed, threads, per_thread)
+            print(f"{label:<18} {mode:<10} {rate:12.1f}")
+            if mode != "inline":
+                print(f"{'':<18} {'':<10} utilization={manager.stats().utilization:.2f}")
+                manager.shutdown()
+
+
+if __name__ == "__main__":
+    import sys
+    main(*(int(arg) for arg in sys.argv[1:]))
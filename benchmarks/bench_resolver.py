@@ -0,0 +1,87 @@
+"""
+Microbenchmark: use case resolution and facade construction cost.
+
+Compares the previous resolution strategy (``inspect.signature`` on every
+build) with the cached ``InjectionPlan`` used by ``Resolver.resolve``.
+
+Run from the project root:
+
+    python benchmarks/bench_resolver.py
+"""
+import inspect
+import timeit
+
+from authkit import AuthKit
+from authkit.core import Registry, Resolver
+from authkit.core.adapters import AuthAdapters
+from authkit.core.resolver import MissingDependencyProxy
+
+
+def legacy_resolve(use_case_cls, adapters):
+    """Resolution as it was done before injection plans were cached."""
+    sig = inspect.signature(use_case_cls.__init__)
+    kwargs = {}
+    for param_name, param in sig.parameters.items():
+        if param_name == 'self':
+            continue
+        if hasattr(adapters, param_name):
+            val = getattr(adapters, param_name)
+            kwargs[param_name] = MissingDependencyProxy(param_name) if val is None else val
+    return use_case_cls(**kwargs)
+
+
+class _Stub:
+    pass
+
+
+def main(number: int = 2000):
+    adapters = AuthAdapters(
+        user_repo=_Stub(),
+        password_manager=_Stub(),
+        session_service=_Stub(),
+        otp_store=_Stub(),
+        otp_manager=_Stub(),
+        intent_store=_Stub(),
+        registration_intent_store=_Stub(),
+    )
+    # Touch one use case so every built-in module is registered.
+    AuthKit(adapters=adapters).login
+    use_cases = [cls for _, cls in Registry.items()]
+    names = [name for name, _ in Registry.items()]
+
+    def legacy_all():
+        for cls in use_cases:
+            legacy_resolve(cls, adapters)
+
+    def cached_all():
+        for cls in use_cases:
+            Resolver.resolve(cls, adapters)
+
+    def facade_all():
+        auth = AuthKit(adapters=adapters)
+        for name in names:
+            getattr(auth, name)
+
+    def facade_one():
+        AuthKit(adapters=adapters).login
+
+    parent = AuthKit(adapters=adapters)
+
+    def scoped_one():
+        parent.scope(user_repo=_Stub()).login
+
+    rows = [
+        ("resolve all, inspect.signature (before)", legacy_all),
+        ("resolve all, cached plan (after)", cached_all),
+        ("AuthKit() + access every use case", facade_all),
+        ("AuthKit() + access login only", facade_one),
+        ("scope(user_repo=...) + access login only", scoped_one),
+    ]
+    print(f"{len(use_cases)} registered use cases, {number} iterations\n")
+    for label, fn in rows:
+        best = min(timeit.repeat(fn, number=number, repeat=5)) / number
+        print(f"{label:<45} {best * 1e6:9.2f} us/op")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""
+Microbenchmark: session verification against a shared revocation store.
+
+Compares ``HMACSessionService.verify`` asking a (simulated) remote
+revocation store on every call with the same store behind a
+``FilteredRevocationStore``, which only asks it on filter hits. The remote
+store adds a fixed latency per lookup to stand in for a network round trip.
+
+Run from the project root:
+
+    python benchmarks/bench_revocation.py
+"""
+import time
+from uuid import uuid4
+
+from authkit.adapters import FilteredRevocationStore, HMACSessionService, InMemoryRevocationStore
+
+
+class RemoteRevocationStore:
+    """In-memory store with a simulated round trip on each lookup."""
+
+    def __init__(self, latency: float):
+        self.latency = latency
+        self.lookups = 0
+        self._store = InMemoryRevocationStore()
+
+    def revoke_session(self, session_id, expires_at):
+        self._store.revoke_session(session_id, expires_at)
+
+    def revoke_user(self, user_id, revoked_at, expires_at):
+        self._store.revoke_user(user_id, revoked_at, expires_at)
+
+    def is_revoked(self, user_id, session_id, issued_at):
+        self.lookups += 1
+        self._round_trip()
+        return self._store.is_revoked(user_id, session_id, issued_at)
+
+    def changes(self, cursor):
+        self._round_trip()
+        return self._store.changes(cursor)
+
+    def _round_trip(self):
+        deadline = time.perf_counter() + self.latency
+        while time.perf_counter() < deadline:
+            pass
+
+
+def main(sessions: int = 20_000, revoked: int = 2_000, latency: float = 100e-6):
+    print(f"{sessions} sessions, {revoked} revoked, {latency * 1e6:.0f} us per remote lookup\n")
+    for label, wrap in (("remote store", lambda store: store),
+                        ("filtered store", lambda store: FilteredRevocationStore(store, capacity=revoked))):
+        remote = RemoteRevocationStore(latency)
+        service = HMACSessionService({"k1": "s" * 32}, revocations=wrap(remote))
+        issued = [service.issue(uuid4(), 1) for _ in range(sessions)]
+        for session in issued[:revoked]:
+            service.revoke(session.user_id, session.session_id)
+        tokens = [(session.session_token, session.user_id) for session in issued]
+
+        remote.lookups = 0
+        start = time.perf_counter()
+        accepted = sum(service.verify(token, 1, user_id) for token, user_id in tokens)
+        elapsed = time.perf_counter() - start
+        assert accepted == sessions - revoked
+        print(f"{label:<15} {elapsed / sessions * 1e6:8.2f} us/verify  "
+              f"{remote.lookups:6d} remote lookups ({remote.lookups - revoked} for valid tokens)")
+
+
+if __name__ == "__main__":
+    main()
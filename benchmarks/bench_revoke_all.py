@@ -0,0 +1,51 @@
+"""
+Microbenchmark: global logout cost against the size of the session keyspace.
+
+Compares removing one user's sessions by pattern-matching every key (what
+``KEYS session:<user>:*`` does server-side) with ``InMemorySessionStore``,
+which finds them through its per-user index. The scan grows with the total
+number of sessions; the index only with the user's own.
+
+Run from the project root:
+
+    python benchmarks/bench_revoke_all.py
+"""
+import fnmatch
+import time
+from uuid import uuid4
+
+from authkit.adapters import InMemorySessionStore
+from authkit.ports import SessionRecord
+
+
+def main(per_user: int = 5, keyspaces=(10_000, 100_000, 500_000)):
+    print(f"{per_user} sessions per user\n")
+    print(f"{'sessions':>10} {'key scan':>12} {'user index':>12}")
+    expires_at = int(time.time()) + 3600
+    for total in keyspaces:
+        store = InMemorySessionStore()
+        keys = {}
+        users = [uuid4() for _ in range(total // per_user)]
+        for user_id in users:
+            for _ in range(per_user):
+                record = SessionRecord(session_id=uuid4(), user_id=user_id, credentials_version=1,
+                                       token_digest=b"", expires_at=expires_at)
+                store.add(record)
+                keys[f"session:{user_id}:{record.session_id}"] = record
+
+        target = users[len(users) // 2]
+        start = time.perf_counter()
+        matched = fnmatch.filter(keys, f"session:{target}:*")
+        for key in matched:
+            del keys[key]
+        scan = time.perf_counter() - start
+
+        start = time.perf_counter()
+        removed = store.remove_user(target)
+        index = time.perf_counter() - start
+        assert removed == len(matched) == per_user
+        print(f"{total:>10} {scan * 1e3:>10.2f}ms {index * 1e6:>10.2f}us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""
+Benchmark: login verify latency during a registration burst, FIFO vs ``HashScheduler``.
+
+A simulated password manager holds each hashing slot for a fixed time
+(sleeping, like a GIL-releasing hash). Registration threads keep the slots
+saturated while login threads verify in a loop; the login queueing delay is
+reported once with a single FIFO admission gate and once with the
+weighted fair queuing scheduler.
+
+Run from the project root:
+
+    python benchmarks/bench_scheduler.py
+"""
+import threading
+import time
+
+from authkit.adapters import AdmissionControlledPasswordManager, HashScheduler
+
+
+class SlowPasswords:
+    def __init__(self, seconds):
+        self.seconds = seconds
+    def hash(self, password):
+        time.sleep(self.seconds)
+        return "h_" + password
+    def verify(self, password, hashed_password):
+        time.sleep(self.seconds)
+        return hashed_password == "h_" + password
+
+
+def percentile(samples, q):
+    samples = sorted(samples)
+    return samples[int(q * (len(samples) - 1))] if samples else 0.0
+
+
+def run(login_pm, register_pm, duration, logins, registrations):
+    stop = threading.Event()
+    latencies = []
+
+    def register():
+        while not stop.is_set():
+            register_pm.hash("pw")
+
+    def login():
+        while not stop.is_set():
+            start = time.perf_counter()
+            login_pm.verify("pw", "h_pw")
+            latencies.append(time.perf_counter() - start)
+
+    threads = [threading.Thread(target=register) for _ in range(registrations)]
+    threads += [threading.Thread(target=login) for _ in range(logins)]
+    for thread in threads:
+        thread.start()
+    time.sleep(duration)
+    stop.set()
+    for thread in threads:
+        thread.join()
+    return latencies
+
+
+def main(workers: int = 4, hash_ms: float = 5.0, duration: float = 2.0, logins: int = 4, registrations: int = 32):
+    manager = SlowPasswords(hash_ms / 1000)
+    fifo = AdmissionControlledPasswordManager(manager, max_concurrency=workers, max_queue=registrations + logins)
+    scheduler = HashScheduler(manager, workers=workers)
+    rows = [
+        ("FIFO", fifo, fifo),
+        ("HashScheduler", scheduler.for_class("login"), scheduler.for_class("registration")),
+    ]
+    print(f"{workers} slots, {hash_ms} ms per hash, {registrations} registering vs {logins} logging-in threads\n")
+    print(f"{'':<14} {'logins':>7} {'p50':>10} {'p95':>10} {'p99':>10}")
+    for label, login_pm, register_pm in rows:
+        latencies = run(login_pm, register_pm, duration, logins, registrations)
+        print(f"{label:<14} {len(latencies):>7} "
+              + " ".join(f"{percentile(latencies, q) * 1000:7.2f} ms" for q in (0.5, 0.95, 0.99)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+"""
+Microbenchmark: breached-password lookups with ``BloomFilterPasswordScreener``.
+
+Builds a Bloom filter of random SHA-1 digests in a temporary file, then times
+``is_breached`` for listed passwords (every bit probed) and for clean ones
+(usually a single probe), and measures the false positive rate.
+
+Run from the project root:
+
+    python benchmarks/bench_screening.py
+"""
+import hashlib
+import os
+import tempfile
+import timeit
+
+from authkit.adapters import BloomFilterPasswordScreener, build_bloom_filter
+
+
+def main(items: int = 1_000_000, fp_rate: float = 1e-6, number: int = 100_000):
+    listed = [f"breached-{i}" for i in range(1000)]
+    digests = [hashlib.sha1(p.encode()).digest() for p in listed]
+    digests += [os.urandom(20) for _ in range(items - len(digests))]
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "breached.bloom")
+        info = build_bloom_filter(digests, path, capacity=items, fp_rate=fp_rate)
+        screener = BloomFilterPasswordScreener(path)
+        print(f"{info.items} hashes, {info.hashes} hash functions, {info.size_bytes / 2**20:.1f} MiB, "
+              f"expected false positive rate {info.fp_rate:.1e}\n")
+
+        clean = [f"clean-{i}" for i in range(number)]
+        assert all(screener.is_breached(p) for p in listed)
+        false_positives = sum(screener.is_breached(p) for p in clean)
+
+        for label, passwords in (("listed password", listed), ("clean password", clean)):
+            n = len(passwords)
+            best = min(timeit.repeat(lambda: [screener.is_breached(p) for p in passwords], number=1, repeat=3))
+            print(f"{label:<16} {best / n * 1e6:8.3f} us/op")
+        print(f"\nfalse positives: {false_positives}/{number}")
+        screener.close()
+
+
+if __name__ == "__main__":
+    main()
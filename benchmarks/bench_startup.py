@@ -0,0 +1,76 @@
+"""
+Startup benchmark: import time and cold facade construction.
+
+Every measurement runs in a fresh interpreter so nothing is cached:
+
+* ``import authkit`` as reported by ``python -X importtime``.
+* Importing every use case module (the cost ``import authkit`` used to pay).
+* Cold ``AuthKit(...)`` construction plus the first ``auth.login`` access.
+
+Run from the project root:
+
+    python benchmarks/bench_startup.py [runs]
+"""
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+COLD_FACADE = """
+import time
+t0 = time.perf_counter()
+from authkit import AuthKit
+t1 = time.perf_counter()
+auth = AuthKit(user_repo=object(), password_manager=object(), session_service=object())
+t2 = time.perf_counter()
+auth.login
+t3 = time.perf_counter()
+print(t1 - t0, t2 - t1, t3 - t2)
+"""
+
+
+def _python(*args: str) -> subprocess.CompletedProcess:
+    env = dict(os.environ, PYTHONPATH=ROOT + os.pathsep + os.environ.get("PYTHONPATH", ""))
+    return subprocess.run([sys.executable, *args], capture_output=True, text=True, env=env, check=True)
+
+
+def import_time_us(statement: str) -> tuple[int, int]:
+    """Returns (cumulative microseconds, authkit modules loaded) for `statement`."""
+    stderr = _python("-X", "importtime", "-c", statement).stderr
+    total, modules = 0, 0
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|")
+        if not cumulative.strip().isdigit():
+            continue
+        name = name.rstrip()
+        if not name.strip().startswith("authkit"):
+            continue
+        modules += 1
+        # Top-level entries (one space after the bar) already include their nested imports.
+        if not name.startswith("  "):
+            total += int(cumulative)
+    return total, modules
+
+
+def main(runs: int = 15):
+    print(f"{'scenario':<42} {'median':>10} {'authkit modules':>16}")
+    for label, statement in [
+        ("import authkit", "import authkit"),
+        ("import authkit.usecases (all use cases)", "import authkit.usecases as u; [getattr(u, n) for n in u.__all__]"),
+    ]:
+        samples = [import_time_us(statement) for _ in range(runs)]
+        median = statistics.median(us for us, _ in samples)
+        print(f"{label:<42} {median / 1000:8.2f}ms {samples[0][1]:>16}")
+
+    cold = [tuple(map(float, _python("-c", COLD_FACADE).stdout.split())) for _ in range(runs)]
+    for index, label in enumerate(["from authkit import AuthKit", "AuthKit(...) construction", "first auth.login access"]):
+        median = statistics.median(sample[index] for sample in cold)
+        print(f"{label:<42} {median * 1000:8.2f}ms")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
@@ -0,0 +1,70 @@
+"""
+Microbenchmark: repeated ``authenticate`` calls with and without ``VerifiedTokenCache``.
+
+Times ``auth.authenticate.execute(...)`` with the same valid token, then with
+the same garbage token, for ``HMACSessionService`` (crypto only) and for
+``StoredSessionService`` over a store that adds a simulated round trip per
+lookup. With the cache, repeats skip the store; in front of the HMAC service
+it only adds cost, which is why it is meant for stored/remote services.
+
+Run from the project root:
+
+    python benchmarks/bench_token_cache.py
+"""
+import time
+import timeit
+from uuid import uuid4
+
+from authkit import AuthKit, User
+from authkit.adapters import HMACSessionService, InMemorySessionStore, StoredSessionService, VerifiedTokenCache
+from authkit.exceptions import InvalidCredentialsError
+
+
+class Users:
+    def __init__(self, user):
+        self.user = user
+    def get_by_id(self, user_id):
+        return self.user
+
+
+class RemoteSessionStore(InMemorySessionStore):
+    """In-memory store with a simulated round trip on each lookup."""
+
+    def __init__(self, latency: float):
+        super().__init__()
+        self.latency = latency
+
+    def get(self, session_id):
+        deadline = time.perf_counter() + self.latency
+        while time.perf_counter() < deadline:
+            pass
+        return super().get(session_id)
+
+
+def rejected(authenticate, user_id, token):
+    try:
+        authenticate.execute(user_id, token)
+    except InvalidCredentialsError:
+        return True
+    return False
+
+
+def main(number: int = 20_000, latency: float = 100e-6):
+    user = User(id=uuid4(), identifier="a@example.com", password_hash="", credentials_version=0)
+    services = (
+        ("HMACSessionService", HMACSessionService({"k1": "s" * 32})),
+        (f"StoredSessionService ({latency * 1e6:.0f} us store)", StoredSessionService(RemoteSessionStore(latency))),
+    )
+    print(f"{number} repeated calls per run, best of 3\n")
+    print(f"{'':<56} {'valid token':>13} {'garbage token':>15}")
+    for name, sessions in services:
+        token = sessions.issue(user.id, 0).session_token
+        for label, extra in (("no cache", {}), ("VerifiedTokenCache", {"interceptors": [VerifiedTokenCache(sessions.expires_at)]})):
+            authenticate = AuthKit(user_reader=Users(user), session_service=sessions, **extra).authenticate
+            valid = min(timeit.repeat(lambda: authenticate.execute(user.id, token), number=number, repeat=3)) / number
+            garbage = min(timeit.repeat(lambda: rejected(authenticate, user.id, "x" * 48), number=number, repeat=3)) / number
+            print(f"{name + ', ' + label:<56} {valid * 1e6:7.2f} us/op {garbage * 1e6:9.2f} us/op")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+"""
+Microbenchmark: the compact binary session token against a JSON JWT.
+
+The JWT side mirrors the FastAPI example's access token (string UUIDs,
+``ver``, ``exp``, ``iat`` and ``type`` claims, HS256). It uses PyJWT when
+installed, otherwise an equivalent stdlib implementation (JSON, base64 and
+HMAC-SHA256, no claim validation library), which flatters the JWT path.
+
+Run from the project root:
+
+    python benchmarks/bench_token_codec.py
+"""
+import base64
+import hashlib
+import hmac
+import json
+import time
+import timeit
+from uuid import UUID, uuid4
+
+from authkit.adapters import HMACSessionService
+
+SECRET = "s" * 32
+
+try:
+    import jwt
+except ImportError:
+    jwt = None
+
+
+def _b64(data: bytes) -> bytes:
+    return base64.urlsafe_b64encode(data).rstrip(b"=")
+
+
+def _unb64(data: str) -> bytes:
+    return base64.urlsafe_b64decode(data + "=" * (-len(data) % 4))
+
+
+_JWT_HEADER = _b64(json.dumps({"alg": "HS256", "typ": "JWT"}, separators=(",", ":")).encode())
+
+
+def stdlib_jwt_encode(payload: dict) -> str:
+    signing_input = _JWT_HEADER + b"." + _b64(json.dumps(payload, separators=(",", ":")).encode())
+    signature = hmac.new(SECRET.encode(), signing_input, hashlib.sha256).digest()
+    return (signing_input + b"." + _b64(signature)).decode("ascii")
+
+
+def stdlib_jwt_decode(token: str) -> dict:
+    header, payload, signature = token.split(".")
+    json.loads(_unb64(header))
+    expected = hmac.new(SECRET.encode(), f"{header}.{payload}".encode("ascii"), hashlib.sha256).digest()
+    if not hmac.compare_digest(expected, _unb64(signature)):
+        raise ValueError("bad signature")
+    claims = json.loads(_unb64(payload))
+    if claims["exp"] <= time.time():
+        raise ValueError("expired")
+    return claims
+
+
+def jwt_issue(user_id: UUID, creds_version: int) -> str:
+    now = int(time.time())
+    payload = {"sub": str(user_id), "jti": str(uuid4()), "ver": creds_version,
+               "exp": now + 3600, "iat": now, "type": "access"}
+    if jwt is not None:
+        return jwt.encode(payload, SECRET, algorithm="HS256")
+    return stdlib_jwt_encode(payload)
+
+
+def jwt_verify(token: str, creds_version: int, user_id: UUID) -> bool:
+    try:
+        if jwt is not None:
+            payload = jwt.decode(token, SECRET, algorithms=["HS256"])
+        else:
+            payload = stdlib_jwt_decode(token)
+    except Exception:
+        return False
+    if payload.get("type") != "access" or not payload.get("jti") or not payload.get("sub"):
+        return False
+    UUID(payload["jti"])
+    return UUID(payload["sub"]) == user_id and int(payload["ver"]) == creds_version
+
+
+def main(number: int = 100_000):
+    user_id = uuid4()
+    sessions = HMACSessionService({"k1": SECRET})
+    binary_token = sessions.issue(user_id, 3).session_token
+    jwt_token = jwt_issue(user_id, 3)
+    raw_token = binary_token.encode("ascii")
+    assert sessions.verify(binary_token, 3, user_id) and jwt_verify(jwt_token, 3, user_id)
+
+    print(f"JWT implementation: {'PyJWT' if jwt is not None else 'stdlib (PyJWT not installed)'}")
+    print(f"token size: binary {len(binary_token)} bytes, JWT {len(jwt_token)} bytes\n")
+    cases = (
+        ("binary issue", lambda: sessions.issue(user_id, 3)),
+        ("binary verify", lambda: sessions.verify(binary_token, 3, user_id)),
+        ("binary verify (bytes)", lambda: sessions.verify(raw_token, 3, user_id)),
+        ("JWT issue", lambda: jwt_issue(user_id, 3)),
+        ("JWT verify", lambda: jwt_verify(jwt_token, 3, user_id)),
+    )
+    for label, call in cases:
+        best = min(timeit.repeat(call, number=number, repeat=3))
+        print(f"{label:<22} {best / number * 1e6:8.2f} us/op")
+
+
+if __name__ == "__main__":
+    main()
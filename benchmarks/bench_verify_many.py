@@ -0,0 +1,95 @@
+"""
+Microbenchmark: authenticating a batch of requests, one by one vs ``authenticate_many``.
+
+Every request carries its own session token; users hold several sessions
+each. ``StoredSessionService`` runs over a store, and the user repository
+over a database, that both add a simulated round trip per call (``get`` /
+``get_many``, ``get_by_id`` / ``get_many_by_id``). The loop pays two per
+token; ``authenticate_many`` one per distinct user plus one for the
+sessions, or two in total when the repository offers ``get_many_by_id``.
+
+Run from the project root:
+
+    python benchmarks/bench_verify_many.py
+"""
+import time
+from uuid import uuid4
+
+from authkit import AuthKit, User
+from authkit.adapters import InMemorySessionStore, StoredSessionService
+
+
+class RoundTrips:
+    """Simulated latency, counted across the store and the repository."""
+
+    def __init__(self, latency: float):
+        self.latency = latency
+        self.count = 0
+
+    def wait(self):
+        self.count += 1
+        deadline = time.perf_counter() + self.latency
+        while time.perf_counter() < deadline:
+            pass
+
+
+class Users:
+    def __init__(self, users, trips: RoundTrips):
+        self.users = {user.id: user for user in users}
+        self.trips = trips
+    def get_by_id(self, user_id):
+        self.trips.wait()
+        return self.users.get(user_id)
+
+
+class BatchUsers(Users):
+    def get_many_by_id(self, user_ids):
+        self.trips.wait()
+        return {user_id: self.users[user_id] for user_id in user_ids if user_id in self.users}
+
+
+class RemoteSessionStore(InMemorySessionStore):
+    """In-memory store with a simulated round trip on each lookup."""
+
+    def __init__(self, trips: RoundTrips):
+        super().__init__()
+        self.trips = trips
+
+    def get(self, session_id):
+        self.trips.wait()
+        return super().get(session_id)
+
+    def get_many(self, session_ids):
+        self.trips.wait()
+        return super().get_many(session_ids)
+
+
+def main(batches=(10, 100, 1000), per_user: int = 4, latency: float = 100e-6):
+    print(f"{latency * 1e6:.0f} us per store or database round trip, {per_user} sessions per user\n")
+    print(f"{'tokens':>7} {'loop':>12} {'trips':>7} {'batch':>12} {'trips':>7} {'+get_many_by_id':>16} {'trips':>7}")
+    for size in batches:
+        users = [User(id=uuid4(), identifier=f"{n}@example.com", password_hash="", credentials_version=0)
+                 for n in range(-(-size // per_user))]
+        trips = RoundTrips(latency)
+        sessions = StoredSessionService(RemoteSessionStore(trips))
+        requests = [(user.id, sessions.issue(user.id, 0).session_token)
+                    for user in users for _ in range(per_user)][:size]
+        row = [f"{len(requests):>7}"]
+        looped = None
+        for repo, batched in ((Users, False), (Users, True), (BatchUsers, True)):
+            auth = AuthKit(user_repo=repo(users, trips), session_service=sessions)
+            trips.count = 0
+            start = time.perf_counter()
+            if batched:
+                result = auth.authenticate_many.execute(requests)
+            else:
+                result = [auth.authenticate.execute(user_id, token) for user_id, token in requests]
+            elapsed = time.perf_counter() - start
+            assert looped is None or result == looped
+            looped = result
+            row.append(f"{elapsed * 1e3:>{14 if repo is BatchUsers else 10}.2f}ms {trips.count:>7}")
+        print(" ".join(row))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+"""
+Pre-fork warmup benchmark: per-worker memory and first-request latency.
+
+A master process builds one AuthKit instance, optionally calls
+``auth.warmup(freeze=True)``, then forks workers. Each worker serves one
+login request through ``auth.scope(...)`` and reports:
+
+* the latency of that first request, and
+* its private (copy-on-write broken) memory, from ``/proc/self/smaps_rollup``.
+
+Linux only (uses ``os.fork`` and ``/proc``).
+
+Run from the project root:
+
+    python benchmarks/bench_warmup.py [workers]
+"""
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+MASTER = r"""
+import json, os, sys, time
+from uuid import uuid4
+
+warm = sys.argv[1] == "warm"
+workers = int(sys.argv[2])
+
+from authkit import AuthKit, User
+
+
+class Repo:
+    def __init__(self):
+        self.users = {}
+    def get_by_identifier(self, identifier):
+        return next((u for u in self.users.values() if u.identifier == identifier), None)
+    def get_by_id(self, user_id):
+        return self.users.get(user_id)
+    def update_last_login(self, user_id):
+        pass
+
+
+class Passwords:
+    def hash(self, password):
+        return "h_" + password
+    def verify(self, password, hashed_password):
+        return hashed_password == "h_" + password
+
+
+class Sessions:
+    def issue(self, user_id, creds_version):
+        return (uuid4(), "token")
+
+
+repo = Repo()
+user = User(id=uuid4(), identifier="a@example.com", password_hash="h_pw", credentials_version=0)
+repo.users[user.id] = user
+
+auth = AuthKit(password_manager=Passwords(), session_service=Sessions())
+if warm:
+    auth.warmup(freeze=True)
+
+
+def private_kb():
+    with open("/proc/self/smaps_rollup") as f:
+        fields = dict(line.split(":", 1) for line in f if ":" in line)
+    return sum(int(fields[k].split()[0]) for k in ("Private_Clean", "Private_Dirty"))
+
+
+read_fd, write_fd = os.pipe()
+pids = []
+for _ in range(workers):
+    pid = os.fork()
+    if pid == 0:
+        os.close(read_fd)
+        start = time.perf_counter()
+        auth.scope(user_repo=repo).login.execute("a@example.com", "pw")
+        latency = time.perf_counter() - start
+        os.write(write_fd, (json.dumps([latency, private_kb()]) + "\n").encode())
+        os._exit(0)
+    pids.append(pid)
+os.close(write_fd)
+for pid in pids:
+    os.waitpid(pid, 0)
+with os.fdopen(read_fd) as f:
+    print(json.dumps([json.loads(line) for line in f]))
+"""
+
+
+def run(mode: str, workers: int) -> list:
+    env = dict(os.environ, PYTHONPATH=ROOT + os.pathsep + os.environ.get("PYTHONPATH", ""))
+    out = subprocess.run([sys.executable, "-c", MASTER, mode, str(workers)],
+                         capture_output=True, text=True, env=env, check=True).stdout
+    return json.loads(out)
+
+
+def main(workers: int = 8):
+    print(f"{workers} forked workers per run\n")
+    print(f"{'master':<22} {'first request (median)':>24} {'worker private memory (median)':>32}")
+    for mode, label in (("cold", "no warmup"), ("warm", "warmup(freeze=True)")):
+        samples = run(mode, workers)
+        latency = statistics.median(s[0] for s in samples)
+        private = statistics.median(s[1] for s in samples)
+        print(f"{label:<22} {latency * 1000:21.3f} ms {private:29.0f} kB")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
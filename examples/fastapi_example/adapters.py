@@ -1,7 +1,8 @@
 from typing import Any, Optional
 from uuid import UUID, uuid4
 import json
-from sqlmodel import Session, select
+import time
+from sqlmodel import Session, select, update
 import redis
 from datetime import timedelta
 
@@ -128,8 +129,16 @@ class RedisAuthSessionService(AuthSessionService):
             "cred_ver": credential_version,
             "active": "1"
         }
-        self.redis.hset(key, mapping=data)
-        self.redis.expire(key, refresh_expires)
+        # Per-user index of session IDs scored by expiry, so revoke_all never scans the keyspace.
+        # Expired members are dropped on every login; the TTL is fixed, so EXPIRE only extends the index.
+        index = f"user_sessions:{user_id}"
+        pipe = self.redis.pipeline()
+        pipe.hset(key, mapping=data)
+        pipe.expire(key, refresh_expires)
+        pipe.zadd(index, {str(session_id): time.time() + refresh_expires.total_seconds()})
+        pipe.zremrangebyscore(index, "-inf", time.time())
+        pipe.expire(index, refresh_expires)
+        pipe.execute()
         
         # 3. Store Session in SQL (Persistence)
         # Check if already exists (for sliding window updates, though usually we create new if rotation)
@@ -182,7 +191,7 @@ class RedisAuthSessionService(AuthSessionService):
         # Reuse session ID (Slide window)
         return self._create_session(user_id, cred_ver, existing_session_id=session_id)
 
-    def verify(self, token: str, creds_version: int) -> bool:
+    def verify(self, token: str, creds_version: int, user_id: UUID) -> bool:
         try:
             payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
             
@@ -190,10 +199,14 @@ class RedisAuthSessionService(AuthSessionService):
                 return False
                 
             session_id = payload.get("jti")
-            user_id = payload.get("sub") # JWT has 'sub'
+            subject = payload.get("sub") # JWT has 'sub'
             token_ver = payload.get("ver")
             
-            if not session_id or not user_id or token_ver is None:
+            if not session_id or not subject or token_ver is None:
+                return False
+
+            # The token must belong to the user being authenticated
+            if subject != str(user_id):
                 return False
             
             if int(token_ver) != creds_version:
@@ -211,7 +224,10 @@ class RedisAuthSessionService(AuthSessionService):
     def revoke(self, user_id: UUID, session_id: UUID) -> bool:
         # Revoke in Redis
         key = f"session:{user_id}:{session_id}"
-        redis_revoked = bool(self.redis.delete(key))
+        pipe = self.redis.pipeline()
+        pipe.delete(key)
+        pipe.zrem(f"user_sessions:{user_id}", str(session_id))
+        redis_revoked = bool(pipe.execute()[0])
         
         # Revoke in SQL
         db_session = self.db_session.get(DBUserSession, session_id)
@@ -224,18 +240,22 @@ class RedisAuthSessionService(AuthSessionService):
         return redis_revoked
 
     def revoke_all(self, user_id: UUID) -> None:
-        # Pattern match all sessions for this user in Redis
-        pattern = f"session:{user_id}:*"
-        keys = self.redis.keys(pattern)
-        if keys:
-            self.redis.delete(*keys)
-            
-        # SQL: Mark all active sessions for user as revoked
-        statement = select(DBUserSession).where(DBUserSession.user_id == user_id, DBUserSession.revoked == False)
-        sessions = self.db_session.exec(statement).all()
-        for s in sessions:
-            s.revoked = True
-            self.db_session.add(s)
+        # Redis: the user's index lists their sessions (no KEYS scan), deleted in one batch
+        index = f"user_sessions:{user_id}"
+        session_ids = self.redis.zrange(index, 0, -1)
+        if session_ids:
+            pipe = self.redis.pipeline()
+            pipe.delete(*(f"session:{user_id}:{sid}" for sid in session_ids))
+            pipe.zrem(index, *session_ids)
+            pipe.execute()
+
+        # SQL: Mark all active sessions for user as revoked in one statement
+        statement = (
+            update(DBUserSession)
+            .where(DBUserSession.user_id == user_id, DBUserSession.revoked == False)
+            .values(revoked=True)
+        )
+        self.db_session.execute(statement)
         self.db_session.commit()
 
 # --- Redis OTP Store ---
@@ -293,6 +313,20 @@ class RedisRegistrationIntentStore(RegistrationIntentStore):
             metadata=json.loads(data["metadata"])
         )
 
+    # Check and write in one step: a separate EXISTS then HSET could recreate an
+    # intent deleted in between, without a TTL.
+    _UPDATE_IF_EXISTS = """
+    if redis.call('EXISTS', KEYS[1]) == 1 then
+        return redis.call('HSET', KEYS[1], ARGV[1], ARGV[2])
+    end
+    return 0
+    """
+
+    def update(self, key: UUID, intent: RegistrationIntent) -> None:
+        redis_key = f"reg_intent:{key}"
+        # HSET keeps the key's TTL; skip intents that expired or were consumed meanwhile.
+        self.redis.eval(self._UPDATE_IF_EXISTS, 1, redis_key, "password_hash", intent.password_hash)
+
     def delete(self, key: UUID) -> None:
         redis_key = f"reg_intent:{key}"
         self.redis.delete(redis_key)
@@ -2,7 +2,9 @@ from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from typing import Annotated
 from authkit import AuthKit 
-from authkit.core.adapters import AuthAdapters
+from authkit.core.adapters import Provider
+from authkit.adapters import ScryptPasswordManager
+from authkit.exceptions import InvalidCredentialsError
 
 from .database import get_session, redis_client
 from .adapters import (
@@ -21,38 +23,27 @@ from sqlmodel import Session , select
 security_scheme = HTTPBearer()
 
 # --- Dependency Injection for AuthKit ---
-def get_authkit(session: Session = Depends(get_session)) -> AuthKit:
-    # 1. Initialize Adapters
-    user_repo = SQLModelUserRepository(session)
-    session_service = RedisAuthSessionService(redis_client, session)
-    
-    # Simple password manager (using library or custom implementation)
-    # Ideally use passlib or bcrypt. For demo, we do a very naive "hash" (don't do this in prod!)
-    class SimplePasswordManager():
-        def hash(self, password: str) -> str:
-            return f"hashed_{password}"
-        def verify(self, password: str, hashed_password: str) -> bool:
-            return f"hashed_{password}" == hashed_password
-            
-    password_manager = SimplePasswordManager()
-    
-    otp_store = RedisOTPStore(redis_client)
-    otp_manager = ConsoleOTPManager()
-    reg_intent = RedisRegistrationIntentStore(redis_client)
-    user_intent = RedisUserIDIntentStore(redis_client)
+# Built-in scrypt password manager. In production, pick its cost for your hardware
+# once with `calibrate("scrypt", target_ms=..., cores=...)` and pin the parameters.
+password_manager = ScryptPasswordManager(ln=14)
 
-    adapters = AuthAdapters(
-        session_service=session_service,
-        password_manager=password_manager,
-        user_repo=user_repo,
-        otp_store=otp_store,
-        otp_manager=otp_manager,
-        registration_intent_store=reg_intent,
-        intent_store=user_intent
-    )
+# 1. Application-wide AuthKit: stateless adapters are built once, and the
+#    Redis-backed OTP/intent stores only when a flow actually needs them.
+app_auth = AuthKit(
+    password_manager=password_manager,
+    otp_store=Provider(lambda: RedisOTPStore(redis_client)),
+    otp_manager=Provider(ConsoleOTPManager),
+    registration_intent_store=Provider(lambda: RedisRegistrationIntentStore(redis_client)),
+    intent_store=Provider(lambda: RedisUserIDIntentStore(redis_client)),
+)
 
-    # 2. Return initialized Facade
-    return AuthKit(adapters=adapters)
+def get_authkit(session: Session = Depends(get_session)) -> AuthKit:
+    # 2. Per request, only bind the adapters that depend on the DB session.
+    #    Providers defer construction until a use case resolves them.
+    return app_auth.scope(
+        user_repo=Provider(lambda: SQLModelUserRepository(session)),
+        session_service=Provider(lambda: RedisAuthSessionService(redis_client, session)),
+    )
 
 # --- Dependency: Get Current User ---
 import jwt
@@ -76,19 +67,12 @@ def get_current_user(
                 headers={"WWW-Authenticate": "Bearer"},
             )
         from uuid import UUID
-        # 2. Get User
-        user = auth._adapters.user_repo.get_by_id(UUID(user_id))
-        if not user:
-            raise HTTPException(status_code=401, detail="User not found")
-            
-        # 3. Verify Token (Signature + Credential Version + Revocation Check)
+        # 2. Get User and Verify Token (Signature + Credential Version + Revocation Check)
         # The session_service 'verify' now handles looking up Redis for revocation
-        # Use _adapters because AuthKit stores it privately
-        is_valid = auth._adapters.session_service.verify(token, user.credentials_version)
-        if not is_valid:
-             raise HTTPException(status_code=401, detail="Session expired or invalid")
-             
-        return user
+        try:
+            return auth.authenticate.execute(UUID(user_id), token)
+        except InvalidCredentialsError:
+            raise HTTPException(status_code=401, detail="Session expired or invalid")
         
     except jwt.PyJWTError as e:
          raise HTTPException(
@@ -2,6 +2,7 @@ from contextlib import asynccontextmanager
 from typing import Annotated
 from fastapi import FastAPI, Depends, HTTPException, Response, Cookie
 from authkit import AuthKit, User
+from authkit.exceptions import OverloadedError
 
 from .database import create_db_and_tables
 from .models import (
@@ -80,8 +81,12 @@ def login(
     auth: Annotated[AuthKit, Depends(get_authkit)]
 ):
     try:
-        # Standard Password Login
-        session = auth.login.execute(identifier=request.email, password=request.password)
+        # Standard Password Login. try_execute() returns bad credentials as an error
+        # code instead of raising, which keeps credential-stuffing traffic cheap.
+        result = auth.login.try_execute(identifier=request.email, password=request.password)
+        if not result.ok:
+            raise HTTPException(status_code=401, detail="Invalid credentials")
+        session = result.value
              
         # Success - Set Cookie & Return Token
         if getattr(session, "refresh_token", None):
@@ -92,6 +97,11 @@ def login(
             "token_type": "bearer"
         }
 
+    except HTTPException:
+        raise
+    except OverloadedError:
+        # Shed by admission control before any hashing: tell the client to back off.
+        raise HTTPException(status_code=503, detail="Try again later", headers={"Retry-After": "1"})
     except Exception as e:
         raise HTTPException(status_code=401, detail=str(e))
 
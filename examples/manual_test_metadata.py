@@ -33,7 +33,7 @@ class SimplePasswordManager:
 class InMemoryAuthSessionService:
     def issue(self, user_id: UUID, credential_version: int) -> QuickStartSession:
         return QuickStartSession(token="tok", session_id=uuid4(), credentials_version=credential_version)
-    def verify(self, token: str, creds_version: int) -> bool: return True
+    def verify(self, token: str, creds_version: int, user_id: UUID) -> bool: return True
     def revoke(self, user_id: UUID, session_id: UUID) -> bool: return True
     def revoke_all(self, user_id: UUID) -> None: pass
 
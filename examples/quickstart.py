@@ -62,7 +62,7 @@ class InMemoryAuthSessionService:
             credentials_version=credential_version
         )
         
-    def verify(self, token: str, creds_version: int) -> bool:
+    def verify(self, token: str, creds_version: int, user_id: UUID) -> bool:
         return True
         
     def revoke(self, user_id: UUID, session_id: UUID) -> bool:
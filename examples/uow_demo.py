@@ -71,7 +71,7 @@ def run_example():
         def hash(self, p): return "hashed"
         
     class StubAuthSessionService:
-        def issue(self, user_id: UUID, credential_version: int) -> AuthSession:
+        def issue(self, user_id: UUID, creds_version: int) -> AuthSession:
             from uuid import uuid4
             
             @dataclass
@@ -81,8 +81,8 @@ def run_example():
                 credentials_version: int
                 revoked: bool = False
                 
-            return MockAuthSession(token="mock_token", session_id=uuid4(), credentials_version=credential_version)
-        def verify(self, t, c): return True
+            return MockAuthSession(token="mock_token", session_id=uuid4(), credentials_version=creds_version)
+        def verify(self, t, c, u): return True
         def revoke(self, u, s): pass
         def revoke_all(self, u): pass
         
@@ -98,22 +98,24 @@ def run_example():
     # You have your generic DB UOW...
     session = MockSession()
     with GenericUnitOfWork(session=session) as session:
-        # Inside the business logic, you CONFIGURE the existing AuthKit instance
-        print("  [Logic] Configuring AuthKit for this context...")
-        auth.configure(user_repo=SqlAlchemyUserRepo(session=session))
+        # Inside the business logic, you SCOPE the global AuthKit instance to this
+        # transaction. The global instance is never mutated, so concurrent
+        # requests cannot see each other's repositories.
+        print("  [Logic] Scoping AuthKit to this context...")
+        request_auth = auth.scope(user_repo=SqlAlchemyUserRepo(session=session))
         
-        # Now use AuthKit
-        auth.login.execute("user@example.com", "password")
+        # Now use the scoped AuthKit
+        request_auth.login.execute("user@example.com", "password")
 
     print("\n--- Request 2: Direct Session Usage (What you asked for) ---")
     # This simulates "with Session() as session:"
     with MockSession() as session:
-        print("  [Logic] Re-configuring AuthKit for this session...")
+        print("  [Logic] Scoping AuthKit to this session...")
         # Inject the repository bound to THIS session
-        auth.configure(user_repo=SqlAlchemyUserRepo(session))
+        request_auth = auth.scope(user_repo=SqlAlchemyUserRepo(session))
         
         # Now use it!
-        auth.login.execute("user@example.com", "password")
+        request_auth.login.execute("user@example.com", "password")
          
 if __name__ == "__main__":
     run_example()
@@ -0,0 +1,19 @@
+import pytest
+
+
+class FakeClock:
+    """Settable epoch clock for the adapters taking a `clock` argument."""
+
+    def __init__(self, now: float = 1_700_000_000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+    def advance(self, seconds: float) -> None:
+        self.now += seconds
+
+
+@pytest.fixture
+def clock() -> FakeClock:
+    return FakeClock()
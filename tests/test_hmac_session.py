@@ -0,0 +1,72 @@
+from uuid import uuid4
+
+import pytest
+
+from authkit.adapters import HMACSessionService, InMemoryRevocationStore
+from authkit.adapters.session import codec
+from authkit.exceptions import FeatureNotConfiguredError
+
+SECRET = "s" * 32
+
+
+def test_token_only_verifies_for_its_owner():
+    sessions = HMACSessionService({"k1": SECRET})
+    owner, other = uuid4(), uuid4()
+    token = sessions.issue(owner, 1).session_token
+
+    assert sessions.verify(token, 1, owner)
+    assert not sessions.verify(token, 1, other)
+    assert sessions.verify_many([(token, 1, owner), (token, 1, other)]) == [True, False]
+
+
+def test_revoke_checks_ownership():
+    sessions = HMACSessionService({"k1": SECRET}, revocations=InMemoryRevocationStore())
+    owner, other = uuid4(), uuid4()
+    session = sessions.issue(owner, 1)
+
+    assert not sessions.revoke(other, session.session_id)
+    assert sessions.verify(session.session_token, 1, owner)
+    assert sessions.revoke(owner, session.session_id)
+    assert not sessions.verify(session.session_token, 1, owner)
+
+
+def test_revoke_without_store_is_not_configured():
+    sessions = HMACSessionService({"k1": SECRET})
+    session = sessions.issue(uuid4(), 1)
+
+    with pytest.raises(FeatureNotConfiguredError):
+        sessions.revoke(session.user_id, session.session_id)
+
+
+def test_ownership_survives_key_rotation():
+    sessions = HMACSessionService({"old": SECRET}, revocations=InMemoryRevocationStore())
+    owner = uuid4()
+    before = sessions.issue(owner, 1)
+    sessions.add_key("new", "n" * 32, activate=True)
+    after = sessions.issue(owner, 1)
+
+    assert sessions.verify(before.session_token, 1, owner)
+    assert sessions.verify(after.session_token, 1, owner)
+    assert sessions.revoke(owner, before.session_id)
+    assert not sessions.verify(before.session_token, 1, owner)
+
+    sessions.remove_key("old")
+    assert sessions.verify(after.session_token, 1, owner)
+
+
+def test_codec_rejects_non_canonical_spellings():
+    sessions = HMACSessionService({"k1": SECRET})
+    owner = uuid4()
+    token = sessions.issue(owner, 1).session_token
+    alphabet = "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789-_"
+    # The last character carries unused low bits: flipping them decodes to the same bytes.
+    last = alphabet.index(token[-1])
+    spellings = {token[:-1] + alphabet[(last & ~0b11) | low] for low in range(4)}
+    swapped = token.replace("-", "+").replace("_", "/")
+    if swapped != token:
+        spellings.add(swapped)
+
+    assert token in spellings and len(spellings) > 1
+    for spelling in spellings - {token}:
+        assert not sessions.verify(spelling, 1, owner)
+        assert codec.decode(spelling, sessions._keys.get) is None
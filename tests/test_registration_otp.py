@@ -0,0 +1,58 @@
+import asyncio
+from uuid import uuid4
+
+from authkit.domain import RegistrationIntent
+from authkit.usecases.aio.Authentication.registration_with_otp_verify import AsyncVerifyRegistrationWithOTPUseCase
+
+
+class Intents:
+    def __init__(self, events):
+        self.events = events
+        self.intents = {}
+
+    async def get(self, key):
+        return self.intents.get(key)
+
+    async def delete(self, key):
+        self.events.append("delete")
+        self.intents.pop(key, None)
+
+
+class OTPs:
+    async def verify(self, token, code, purpose):
+        return code == "123456"
+
+
+class Users:
+    async def add(self, user):
+        return user
+
+
+class SlowHasher:
+    """Resolves after a few loop iterations, as a hash finishing on a worker would."""
+
+    def __init__(self, events):
+        self.events = events
+
+    async def resolve(self, password_hash):
+        self.events.append("resolve started")
+        for _ in range(3):
+            await asyncio.sleep(0)
+        self.events.append("resolve done")
+        return "real-hash"
+
+
+def test_intent_is_deleted_after_the_speculative_hash_resolves():
+    events = []
+    intents = Intents(events)
+    token = uuid4()
+    intents.intents[token] = RegistrationIntent(identifier="a@example.com", password_hash="placeholder",
+                                                credentials_version=0)
+    use_case = AsyncVerifyRegistrationWithOTPUseCase(user_writer=Users(), registration_intent_store=intents,
+                                                     otp_store=OTPs(), speculative_hasher=SlowHasher(events),
+                                                     concurrent_steps=True)
+
+    user = asyncio.run(use_case.execute(token, "123456"))
+
+    assert user.password_hash == "real-hash"
+    assert events == ["resolve started", "resolve done", "delete"]
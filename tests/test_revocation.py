@@ -0,0 +1,74 @@
+from uuid import uuid4
+
+from authkit.adapters.session.revocation import FilteredRevocationStore, InMemoryRevocationStore
+
+
+class CountingStore:
+    """A `SessionRevocationStore` that cannot be listed, counting its lookups."""
+
+    def __init__(self, clock):
+        self.inner = InMemoryRevocationStore(clock=clock)
+        self.lookups = 0
+
+    def revoke_session(self, session_id, expires_at):
+        self.inner.revoke_session(session_id, expires_at)
+
+    def revoke_user(self, user_id, revoked_at, expires_at):
+        self.inner.revoke_user(user_id, revoked_at, expires_at)
+
+    def is_revoked(self, user_id, session_id, issued_at):
+        self.lookups += 1
+        return self.inner.is_revoked(user_id, session_id, issued_at)
+
+
+def test_filter_loads_existing_revocations(clock):
+    backend = InMemoryRevocationStore(clock=clock)
+    session_id, user_id = uuid4(), uuid4()
+    backend.revoke_session(session_id, clock() + 60)
+    backend.revoke_user(user_id, clock(), clock() + 60)
+
+    revocations = FilteredRevocationStore(backend, clock=clock)
+
+    assert revocations.is_revoked(uuid4(), session_id, clock() - 1)
+    assert revocations.is_revoked(user_id, uuid4(), clock() - 1)
+
+
+def test_filter_pulls_revocations_of_other_processes(clock):
+    backend = InMemoryRevocationStore(clock=clock)
+    revocations = FilteredRevocationStore(backend, sync_interval=5, clock=clock)
+    peer = FilteredRevocationStore(backend, sync_interval=5, clock=clock)
+    session_id = uuid4()
+    peer.revoke_session(session_id, clock() + 60)
+
+    clock.advance(5)
+    assert revocations.is_revoked(uuid4(), session_id, clock() - 10)
+
+
+def test_filter_reloads_after_backend_restart(clock):
+    revocations = FilteredRevocationStore(InMemoryRevocationStore(clock=clock), sync_interval=5, clock=clock)
+    revocations.revoke_session(uuid4(), clock() + 60)
+    restarted = InMemoryRevocationStore(clock=clock)
+    session_id = uuid4()
+    restarted.revoke_session(session_id, clock() + 60)
+    revocations.backend = restarted
+
+    clock.advance(5)
+    assert revocations.is_revoked(uuid4(), session_id, clock() - 10)
+
+
+def test_unlistable_backend_is_asked_on_misses(clock):
+    backend = CountingStore(clock)
+    session_id = uuid4()
+    backend.revoke_session(session_id, clock() + 60)
+    revocations = FilteredRevocationStore(backend, clock=clock)
+
+    assert revocations.is_revoked(uuid4(), session_id, clock() - 1)
+    assert not revocations.is_revoked(uuid4(), uuid4(), clock() - 1)
+    assert backend.lookups == 2
+
+
+def test_blocking_flag_follows_backend(clock):
+    backend = CountingStore(clock)
+    assert FilteredRevocationStore(backend).__authkit_nonblocking__ is False
+    backend.__authkit_nonblocking__ = True
+    assert FilteredRevocationStore(backend).__authkit_nonblocking__ is True
@@ -0,0 +1,153 @@
+from uuid import uuid4
+
+import pytest
+
+from authkit.adapters import InMemorySessionStore, RedisSessionStore, StoredSessionService
+
+
+class FakeRedis:
+    """The subset of redis-py used by `RedisSessionStore`, with Redis 7 EXPIREAT flags."""
+
+    def __init__(self, clock):
+        self.clock = clock
+        self.data = {}
+        self.expiry = {}
+
+    def _alive(self, key):
+        if key in self.expiry and self.expiry[key] <= self.clock():
+            self.data.pop(key, None)
+            del self.expiry[key]
+        return key in self.data
+
+    def get(self, key):
+        return self.data[key].encode() if self._alive(key) else None
+
+    def mget(self, keys):
+        return [self.get(key) for key in keys]
+
+    def set(self, key, value, exat=None):
+        self.data[key] = value
+        self.expiry[key] = exat
+
+    def delete(self, *keys):
+        deleted = 0
+        for key in keys:
+            if self._alive(key):
+                del self.data[key]
+                self.expiry.pop(key, None)
+                deleted += 1
+        return deleted
+
+    def expireat(self, key, when, nx=False, gt=False):
+        if not self._alive(key):
+            return False
+        current = self.expiry.get(key)
+        if (nx and current is not None) or (gt and (current is None or when <= current)):
+            return False
+        self.expiry[key] = when
+        return True
+
+    def zadd(self, key, mapping):
+        self._alive(key)
+        self.data.setdefault(key, {}).update(mapping)
+
+    def zrem(self, key, *members):
+        zset = self.data.get(key, {}) if self._alive(key) else {}
+        removed = sum(zset.pop(member, None) is not None for member in members)
+        if key in self.data and not zset:
+            del self.data[key]
+        return removed
+
+    def zremrangebyscore(self, key, low, high):
+        zset = self.data.get(key, {}) if self._alive(key) else {}
+        dead = [member for member, score in zset.items() if float(low) <= score <= float(high)]
+        for member in dead:
+            del zset[member]
+        return len(dead)
+
+    def zrangebyscore(self, key, low, high):
+        zset = self.data.get(key, {}) if self._alive(key) else {}
+        exclusive = low.startswith("(")
+        low = float(low.lstrip("("))
+        return [member.encode() for member, score in zset.items()
+                if (score > low if exclusive else score >= low) and score <= float(high)]
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+
+class FakePipeline:
+    def __init__(self, client):
+        self.client = client
+        self.calls = []
+
+    def __getattr__(self, name):
+        return lambda *args, **kwargs: self.calls.append((name, args, kwargs))
+
+    def execute(self):
+        return [getattr(self.client, name)(*args, **kwargs) for name, args, kwargs in self.calls]
+
+
+@pytest.fixture(params=["memory", "redis"])
+def store(request, clock):
+    if request.param == "memory":
+        return InMemorySessionStore(clock=clock)
+    return RedisSessionStore(FakeRedis(clock), clock=clock)
+
+
+def test_token_only_verifies_for_its_owner(store, clock):
+    sessions = StoredSessionService(store, clock=clock)
+    owner, other = uuid4(), uuid4()
+    token = sessions.issue(owner, 1).session_token
+
+    assert sessions.verify(token, 1, owner)
+    assert not sessions.verify(token, 1, other)
+    assert sessions.verify_many([(token, 1, owner), (token, 1, other)]) == [True, False]
+
+
+def test_revoke_checks_ownership(store, clock):
+    sessions = StoredSessionService(store, clock=clock)
+    owner = uuid4()
+    session = sessions.issue(owner, 1)
+
+    assert not sessions.revoke(uuid4(), session.session_id)
+    assert sessions.verify(session.session_token, 1, owner)
+    assert sessions.revoke(owner, session.session_id)
+    assert not sessions.verify(session.session_token, 1, owner)
+
+
+def test_only_canonical_spelling_verifies(store, clock):
+    sessions = StoredSessionService(store, clock=clock)
+    owner = uuid4()
+    token = next(token for token in (sessions.issue(owner, 1).session_token for _ in range(100))
+                 if "-" in token or "_" in token)
+    swapped = token.replace("-", "+").replace("_", "/")
+
+    assert sessions.verify(token, 1, owner)
+    assert not sessions.verify(swapped, 1, owner)
+    assert not sessions.verify(token + "\n", 1, owner)
+
+
+def test_redis_index_expiry_is_only_extended(clock):
+    client = FakeRedis(clock)
+    store = RedisSessionStore(client, clock=clock)
+    owner = uuid4()
+    StoredSessionService(store, ttl=1000, clock=clock).issue(owner, 1)
+    StoredSessionService(store, ttl=10, clock=clock).issue(owner, 1)
+
+    assert client.expiry[store._index_key(owner)] == int(clock()) + 1000
+
+
+def test_redis_index_drops_expired_sessions(clock):
+    client = FakeRedis(clock)
+    store = RedisSessionStore(client, clock=clock)
+    sessions = StoredSessionService(store, ttl=10, clock=clock)
+    owner = uuid4()
+    for _ in range(50):
+        sessions.issue(owner, 1)
+        clock.advance(11)
+    live = sessions.issue(owner, 1)
+
+    assert len(client.data[store._index_key(owner)]) == 1
+    assert store.remove_user(owner) == 1
+    assert not sessions.verify(live.session_token, 1, owner)
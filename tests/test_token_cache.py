@@ -0,0 +1,60 @@
+from uuid import uuid4
+
+import pytest
+
+from authkit import AuthKit, User
+from authkit.adapters import InMemorySessionStore, StoredSessionService, VerifiedTokenCache
+from authkit.exceptions import InvalidCredentialsError
+
+
+class Users:
+    def __init__(self, *users):
+        self.users = {user.id: user for user in users}
+
+    def get_by_id(self, user_id):
+        return self.users.get(user_id)
+
+
+def make_user(identifier):
+    return User(id=uuid4(), identifier=identifier, password_hash="", credentials_version=0)
+
+
+@pytest.fixture
+def setup(clock):
+    owner, other = make_user("owner"), make_user("other")
+    sessions = StoredSessionService(InMemorySessionStore(clock=clock), clock=clock)
+    cache = VerifiedTokenCache(sessions.expires_at, clock=clock)
+    auth = AuthKit(user_reader=Users(owner, other), session_service=sessions, interceptors=[cache])
+    return auth, sessions, cache, owner, other
+
+
+def test_cached_token_does_not_authenticate_another_user(setup):
+    auth, sessions, cache, owner, other = setup
+    token = sessions.issue(owner.id, 0).session_token
+
+    assert auth.authenticate.execute(owner.id, token).id == owner.id
+    with pytest.raises(InvalidCredentialsError):
+        auth.authenticate.execute(other.id, token)
+    assert cache.stats().hits == 0
+
+
+def test_failed_attempt_does_not_shadow_the_owner(setup):
+    auth, sessions, cache, owner, other = setup
+    token = sessions.issue(owner.id, 0).session_token
+
+    with pytest.raises(InvalidCredentialsError):
+        auth.authenticate.execute(other.id, token)
+    assert auth.authenticate.execute(owner.id, token).id == owner.id
+    assert auth.authenticate.execute(owner.id, token).id == owner.id
+    assert cache.stats().hits == 1
+
+
+def test_entries_are_dropped_with_their_owner(setup):
+    auth, sessions, cache, owner, other = setup
+    token = sessions.issue(owner.id, 0).session_token
+    auth.authenticate.execute(owner.id, token)
+
+    cache.invalidate(other.id)
+    assert cache.stats().entries == 1
+    cache.invalidate(owner.id)
+    assert cache.stats().entries == 0